@@ -4,13 +4,26 @@ Top level of esensorlib package source files
 
 Python Library for Epson Sensing System Devices
 
+benchmarks - folder containing benchmarks of decode, logging and configuration
 example - folder containing logger scripts and helper utility
 model - folder containing device model definitions and constants
 accl_fn.py contains the accelerometer functions class
+base_fn.py contains the base class of the functions classes for register access and burst reads
+burst_decoder.py contains the precompiled burst decoder class
+burst_stream.py contains the background burst acquisition stream class
+capture.py contains the binary capture writer and memory-mapped reader classes with time index
+config_profile.py contains the configuration profile class for validating and compiling set_config() parameters
+counter_tracker.py contains the sample counter tracker class for lost and duplicate samples
 imu_fn.py contains the IMU functions class
+link_budget.py contains the UART link budget class and planner of baudrate and burst fields
+provision.py contains the provisioner class for configuring and flashing many devices in parallel
 reg_interface.py contains the register I/O interface functions class
+sample_clock.py contains the sample clock class for burst timestamps
 sensor_device.py contains the main sensor device class
+sim_port.py contains the simulated device and port class for use without hardware
+sim_pty.py contains the pseudo-terminal emulator of a simulated device for Linux
 spi_port.py contains the low-level SPI port class (*not implemented yet*)
+status_poller.py contains the status poller class for register waits with adaptive backoff
 uart_port.py contains the low-level UART port class
 vib_fn.py contains the vibration sensor functions class
 """
@@ -0,0 +1,1154 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Base class of the device functions classes
+Contains:
+- BaseFn() class
+- Descriptive Exceptions specific to this package
+"""
+
+import time
+from collections import deque
+from types import MappingProxyType
+
+from loguru import logger
+
+from esensorlib import (
+    counter_tracker,
+    sample_clock,
+    status_poller,
+    uart_port,
+)
+
+
+# Custom Exceptions
+class HardwareError(Exception):
+    """Exception class for HARD_ERR from device"""
+
+
+class SelfTestError(Exception):
+    """Exception class for ST_ERR from device"""
+
+
+class FlashTestError(Exception):
+    """Exception class for FLASH_ERR from device"""
+
+
+class FlashBackupError(Exception):
+    """Exception class for FLASH_BU_ERR from device"""
+
+
+class DeviceConfigurationError(Exception):
+    """Exception class for FLASH_BU_ERR from device"""
+
+
+class InvalidCommandError(Exception):
+    """Exception class for invalid register access for device"""
+
+
+class InvalidBurstReadError(Exception):
+    """Exception class for malformed burst read access for device"""
+
+
+class DeviceTimeoutError(TimeoutError):
+    """Exception class for device not responding within deadline"""
+
+
+class BaseFn:
+    """
+    Functions shared by ImuFn(), AcclFn() and VibFn() for register access,
+    register waits, and reading burst samples. Each functions class sets the
+    model specific register names CONFIG_REGS, SETTLE_REGS, VOLATILE_REGS,
+    the default _status and _burst_out, and implements goto(), _config_regs(),
+    _settle_reg() and the burst configuration methods
+
+    ...
+
+    Attributes
+    ----------
+    info : MappingProxyType
+        dict of device ID information
+    status : MappingProxyType
+        dict of device status
+    burst_out : MappingProxyType
+        dict of burst output status
+    burst_fields : tuple
+        tuple of fields for sensor burst read
+    tracker : CounterTracker
+        lost and duplicate sample counters, None if counter is not in burst
+    clock : SampleClock
+        fit of host time to sample index for burst timestamps
+    index : int
+        sample index of the last sample read, -1 if none
+    stall_timeout : float
+        time in seconds without a burst before a read times out
+    stalls : int
+        number of reads and register waits that timed out
+    poll_stats : MappingProxyType
+        per operation counters and measured durations of register waits
+    timestamp : float
+        host timestamp of the last sample from read_sample() or read_frames()
+    timestamps : numpy.ndarray
+        host timestamps of the last samples from read_samples()
+    mdef : object
+        model specific definitions - addresses, values, constants, etc
+    reg : enum
+        model specific register addresses from mdef
+
+    Methods
+    -------
+    get_reg(winnum, regaddr, verbose)
+        16-bit read from specified WIN_ID and register address
+
+    set_reg(winnum, regaddr, write_byte, verbose=False)
+        8-bit write to specified WIN_ID and register address
+
+    set_config(**cfg)
+        Configure device from key, value parameters
+
+    stage_config(**cfg)
+        Return register writes of set_config(**cfg) without writing to device
+
+    apply_image(image, write_all, verbose)
+        Configure device from a RegisterImage() compiled from a profile
+
+    do_softreset(verbose)
+        Perform software reset
+
+    read_sample(verbose)
+        Return scaled burst sample of sensor data
+
+    read_sample_unscaled(verbose)
+        Return unscaled burst sample of sensor data
+
+    read_samples(n, scaled, verbose)
+        Return n burst samples of sensor data as numpy structured array
+
+    read_frames(n, verbose)
+        Return n complete burst frames as received without decoding
+
+    flush_frames()
+        Return and clear burst frames received but not yet read
+
+    set_index(index)
+        Set sample index of the last sample read
+    """
+
+    # Deadline of a wait on the device is DEADLINE_SCALE times the expected
+    # delay from model definitions, or output period when reading bursts,
+    # and at least DEADLINE_MIN_S
+    DEADLINE_SCALE = 3
+    DEADLINE_MIN_S = 1.0
+
+    def __init__(
+        self, obj_regif, obj_mdef, device_info=None, verbose=False, fast_start=False
+    ):
+        """
+        Parameters
+        ----------
+        obj_regif : RegInterface() instance
+            Register interface object passed from SensorDevice() instance
+        obj_mdef : module
+            Model definitions passed from SensorDevice() instance
+        device_info : dict
+            prod_id, version_id, serial_id as key, value pairs
+        verbose : bool
+            If True outputs additional debug info
+        fast_start : bool
+            If True goto() polls MODE_CTRL instead of waiting post_delay,
+            and register waits poll from the command with backoff
+        """
+
+        self.regif = obj_regif
+        self.model_def = obj_mdef
+
+        self._device_info = device_info or {
+            "prod_id": None,
+            "version_id": None,
+            "serial_id": None,
+        }
+
+        self._verbose = verbose
+        self._fast_start = fast_start
+
+        # _cfg is updated when set_config(**cfg) called
+        self._cfg = {}
+
+        # Stores burst output fields
+        self._burst_fields = ()
+
+        # Store burst structure format for unpacking bytes
+        self._b_struct = ""
+
+        # Precompiled BurstDecoder() for current burst layout
+        self._decoder = None
+
+        # Complete burst frames parsed from UART but not yet returned
+        self._rx_frames = deque()
+
+        # CounterTracker() of sample counter and its index in burst fields
+        self._tracker = None
+        self._counter_pos = None
+
+        # SampleClock() of burst timestamps, and sample index and
+        # timestamps of the last samples read
+        self._clock = None
+        self._index = -1
+        self._timestamp = None
+        self._timestamps = None
+
+        # Number of reads and register waits that timed out
+        self._stalls = 0
+
+        # Register waits poll from the command when fast_start
+        self._poller = status_poller.StatusPoller(0.0 if fast_start else None)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(obj_regif={repr(self.regif)}, ",
+                f"obj_mdef={repr(self.model_def)}, ",
+                f"device_info={self._device_info}, ",
+                f"verbose={self._verbose}, ",
+                f"fast_start={self._fast_start})",
+            ]
+        )
+        return string_val
+
+    @property
+    def info(self):
+        """property for device info as MappingProxyType"""
+        return MappingProxyType(self._device_info)
+
+    @property
+    def status(self):
+        """property for device status as MappingProxyType"""
+        return MappingProxyType(self._status)
+
+    @property
+    def burst_out(self):
+        """property for burst_output as MappingProxyType"""
+        return MappingProxyType(self._burst_out)
+
+    @property
+    def burst_fields(self):
+        """property for burst_fields"""
+        return self._burst_fields
+
+    @property
+    def decoder(self):
+        """property for BurstDecoder() of current burst configuration"""
+        return self._decoder
+
+    @property
+    def tracker(self):
+        """property for CounterTracker() of sample counter in burst"""
+        return self._tracker
+
+    @property
+    def clock(self):
+        """property for SampleClock() of burst timestamps"""
+        return self._clock
+
+    @property
+    def index(self):
+        """property for sample index of the last sample read"""
+        return self._index
+
+    @property
+    def stall_timeout(self):
+        """property for time in seconds without a burst before a read times out"""
+        if self._clock is None:
+            return None
+        return self._get_deadline(1 / self._clock.rate)
+
+    @property
+    def stalls(self):
+        """property for number of reads and register waits that timed out"""
+        return self._stalls
+
+    @property
+    def poll_stats(self):
+        """property for per operation counters and durations of register waits"""
+        return self._poller.stats
+
+    @property
+    def timestamp(self):
+        """property for host timestamp of the last sample from read_sample()"""
+        return self._timestamp
+
+    @property
+    def timestamps(self):
+        """property for host timestamps of the last samples from read_samples()"""
+        return self._timestamps
+
+    @property
+    def mdef(self):
+        """property from SensorDevice() instance model definitions"""
+        return self.model_def
+
+    @property
+    def reg(self):
+        """property from SensorDevice() instance Reg"""
+        return self.model_def.Reg
+
+    def get_reg(self, winnum, regaddr, verbose=False):
+        """redirect to RegInterface() instance"""
+        return self.regif.get_reg(winnum, regaddr, verbose)
+
+    def set_reg(self, winnum, regaddr, write_byte, verbose=False):
+        """redirect to RegInterface() instance"""
+        self.regif.set_reg(winnum, regaddr, write_byte, verbose)
+
+    def set_config(self, **cfg):
+        """Configure device based on keyword, value parameters.
+        Configure with supplied key, values
+        Then read burst configuration from BURST_CTRL
+        and update status dict
+
+        The register image is computed from cfg first and compared with
+        the current registers, then only the register bytes that differ are
+        written, unless write_all is specified in cfg
+
+        Parameters
+        ----------
+        cfg : dict of keyword arguments
+            Optional keyword arguments
+
+        Returns
+        -------
+        bool
+            True if registers were written, so backup_flash() is needed to
+            keep the configuration after power cycle
+        """
+
+        if not cfg:
+            logger.warning("** No cfg parameters provided using defaults")
+
+        self._cfg = cfg
+
+        verbose = self._cfg.get("verbose", False)
+        if verbose:
+            logger.debug(f"set_config({cfg})")
+
+        # Place device in CONFIG mode, if not already
+        self.goto("config", verbose=verbose)
+
+        # Stage register writes in a register image unless write_all or no_init
+        is_staged = not (
+            self._cfg.get("write_all", False) or self._cfg.get("no_init", False)
+        )
+        if is_staged:
+            self.regif.begin_staging(
+                [
+                    getattr(self.reg, name)
+                    for name in self.CONFIG_REGS
+                    if name in self.reg.__members__
+                ],
+                verbose,
+            )
+        try:
+            self._config_regs(verbose)
+        finally:
+            if is_staged:
+                changes = self.regif.end_staging()
+        if is_staged:
+            self._write_changes(changes, verbose)
+        self._get_burst_config(verbose)
+        if verbose:
+            logger.debug(f"{self.__class__.__name__}.status: {self.status}")
+
+        if is_staged:
+            return len(changes) > 0
+        return not self._cfg.get("no_init", False)
+
+    def stage_config(self, **cfg):
+        """Compute the register image of set_config(**cfg) without writing
+        to the device. The configuration registers are read in a single
+        pipeline and every register byte written by the configuration is
+        returned, including bytes equal to the current registers.
+        The device should be in CONFIG mode
+
+        Parameters
+        ----------
+        cfg : dict of keyword arguments
+            Optional keyword arguments, same as set_config()
+
+        Returns
+        -------
+        list
+            (winnum, regaddr, write_byte) tuples in order of first write
+        """
+
+        self._cfg = cfg
+
+        verbose = self._cfg.get("verbose", False)
+        self.regif.begin_staging(
+            [
+                getattr(self.reg, name)
+                for name in self.CONFIG_REGS
+                if name in self.reg.__members__
+            ],
+            verbose,
+        )
+        try:
+            self._config_regs(verbose)
+        finally:
+            writes = self.regif.end_staging(changed_only=False)
+        return writes
+
+    def apply_image(self, image, write_all=False, verbose=False):
+        """Configure device from a RegisterImage() compiled from a
+        ConfigProfile(). The registers of the image are read in a single
+        pipeline and merged with the register bits set by the profile,
+        then only the register bytes that differ are written in a single
+        pipeline, unless write_all. Then read burst configuration from
+        BURST_CTRL and update status dict
+
+        Parameters
+        ----------
+        image : RegisterImage
+            register image compiled for the product ID of this device
+        write_all : bool
+            If True write every register byte of the image
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        bool
+            True if registers were written, so backup_flash() is needed to
+            keep the configuration after power cycle
+
+        Raises
+        -------
+        DeviceConfigurationError
+            When the image is compiled for a different product ID
+        """
+
+        if image.prod_id != self.info.get("prod_id"):
+            logger.error(
+                f"** Register image for {image.prod_id} does not match "
+                f"device {self.info.get('prod_id')}"
+            )
+            raise DeviceConfigurationError
+
+        self._cfg = dict(image.cfg)
+
+        # Place device in CONFIG mode, if not already
+        self.goto("config", verbose=verbose)
+
+        current = self.regif.get_regs(image.regs, verbose)
+        changes = image.get_changes(dict(zip(image.regs, current)), write_all)
+        self._write_changes(changes, verbose)
+        self._status.update(image.status)
+        self._get_burst_config(verbose)
+        if verbose:
+            logger.debug(f"{self.__class__.__name__}.status: {self.status}")
+
+        return len(changes) > 0
+
+    def do_softreset(self, verbose=False):
+        """Initiate Software Reset
+
+        Parameters
+        ----------
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        self.set_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR, 0x80, verbose)
+        time.sleep(self.mdef.RESET_DELAY_S)
+        # Registers and WIN_ID are reset, discard cached registers
+        self.regif.invalidate_cache()
+        print("Software Reset Completed")
+
+    def read_sample(self, verbose=False):
+        """Read one burst of sensor data, post processes,
+        and returns scaled sensor data.
+        If burst read contains corrupted data, returns ()
+        NOTE: Device must be in SAMPLING mode before calling
+
+        Parameters
+        ----------
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        tuple
+            tuple containing single set of sensor burst data with
+            scale factor applied or () if burst data is malformed
+            or device not in SAMPLING
+
+        Raises
+        -------
+        KeyboardInterrupt
+            Raises to caller CTRL-C
+        IOError
+            Raises to caller any type of serial port error
+        """
+
+        try:
+            raw_burst = self._get_sample(verbose=verbose)
+            return self._proc_sample(raw_burst)
+        except InvalidCommandError:
+            return ()
+        except InvalidBurstReadError:
+            return ()
+        except KeyboardInterrupt:
+            print("Stop reading sensor")
+            raise
+        except IOError:
+            logger.error("** Failure reading sensor sample")
+            raise
+
+    def read_sample_unscaled(self, verbose=False):
+        """Read one burst of sensor data, post processes,
+        and returns unscaled sensor data.
+        If burst read contains corrupted data, returns ()
+        NOTE: Device must be in SAMPLING mode before calling
+
+        Parameters
+        ----------
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        tuple
+            tuple containing single set of sensor burst data
+            without scale factor applied or () if burst data
+            is malformed or device not in SAMPLING
+
+        Raises
+        -------
+        KeyboardInterrupt
+            Raises to caller CTRL-C
+        IOError
+            Raises to caller any type of serial port error
+        """
+
+        try:
+            raw_burst = self._get_sample(verbose=verbose)
+            return raw_burst
+        except InvalidCommandError:
+            return ()
+        except InvalidBurstReadError:
+            return ()
+        except KeyboardInterrupt:
+            print("Stop reading sensor")
+            raise
+        except IOError:
+            logger.error("** Failure reading sensor sample")
+            raise
+
+    def read_samples(self, n, scaled=True, verbose=False):
+        """Read n bursts of sensor data and decode them in one pass
+        with numpy. Corrupted bursts are discarded and not returned
+        NOTE: Device must be in SAMPLING mode before calling
+
+        Parameters
+        ----------
+        n : int
+            number of burst samples to read
+        scaled : bool
+            If True apply scale factor to sensor data
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        numpy.ndarray
+            structured array of n samples with fields named by burst_fields
+
+        Raises
+        -------
+        InvalidCommandError
+            When device is not configured by set_config() or
+            When device is not in SAMPLING mode
+        ImportError
+            When numpy is not installed
+        KeyboardInterrupt
+            Raises to caller CTRL-C
+        IOError
+            Raises to caller any type of serial port error
+        """
+
+        try:
+            data = self._get_frames(n, verbose=verbose)
+            samples = self._decoder.decode_array(data, scaled)
+            if self._tracker is not None:
+                indexes = self._tracker.update_array(samples["counter"])
+            else:
+                indexes = range(self._index + 1, self._index + 1 + len(samples))
+            if len(indexes):
+                self._index = int(indexes[-1])
+                # Fit the clock to the last burst received
+                self._clock.update(self._index + len(self._rx_frames))
+            self._timestamps = self._clock.timestamps(indexes)
+            return samples
+        except KeyboardInterrupt:
+            print("Stop reading sensor")
+            raise
+        except IOError:
+            logger.error("** Failure reading sensor sample")
+            raise
+
+    def read_frames(self, n, verbose=False):
+        """Read n bursts of sensor data and return the complete burst frames
+        as received without decoding i.e. to append to a binary capture.
+        Corrupted bursts are discarded and not returned
+        NOTE: Device must be in SAMPLING mode before calling
+
+        Parameters
+        ----------
+        n : int
+            number of burst frames to read
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        bytes
+            n complete burst frames including header and delimiter byte
+
+        Raises
+        -------
+        InvalidCommandError
+            When device is not configured by set_config() or
+            When device is not in SAMPLING mode
+        KeyboardInterrupt
+            Raises to caller CTRL-C
+        IOError
+            Raises to caller any type of serial port error
+        """
+
+        try:
+            data = self._get_frames(n, verbose=verbose)
+            size = self._decoder.size
+            if self._tracker is not None:
+                unpack = self._decoder.unpack
+                for i in range(0, len(data), size):
+                    raw_burst = unpack(data[i : i + size])
+                    self._index = self._tracker.update(raw_burst[self._counter_pos])
+            else:
+                self._index = self._index + len(data) // size
+            if data:
+                # Fit the clock to the last burst received
+                self._clock.update(self._index + len(self._rx_frames))
+                self._timestamp = self._clock.timestamp(self._index)
+            return data
+        except KeyboardInterrupt:
+            print("Stop reading sensor")
+            raise
+        except IOError:
+            logger.error("** Failure reading sensor sample")
+            raise
+
+    def flush_frames(self):
+        """Return and clear complete burst frames that are received
+        from the device but not yet returned by read_sample()
+
+        Returns
+        -------
+        tuple
+            bytes of each complete burst frame
+        """
+
+        frames = tuple(self._rx_frames)
+        self._rx_frames.clear()
+        return frames
+
+    def set_index(self, index):
+        """Set sample index of the last sample read, i.e. when bursts were
+        read by BurstStream() instead of read_sample()
+
+        Parameters
+        ----------
+        index : int
+            sample index of the last sample read
+        """
+
+        self._index = index
+
+    def _start_session(self, rate, bin_size, use_counter=True, verbose=False):
+        """Compile the burst layout read by _get_burst_config(), and start
+        a new session of sample counter statistics and sample timestamps
+
+        Parameters
+        ----------
+        rate : float
+            output rate in samples per second of the burst configuration
+        bin_size : int
+            number of samples per bin of the CounterTracker() loss history
+        use_counter : bool
+            If False the counter field does not count samples
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        self._b_struct = self._get_burst_struct_fmt()
+        self._burst_fields = self._get_burst_fields()
+        self._decoder = self._get_burst_decoder()
+        self._rx_frames.clear()
+
+        # Start a new session of sample counter statistics
+        self._tracker = None
+        self._counter_pos = None
+        if use_counter and "counter" in self._burst_fields:
+            self._tracker = counter_tracker.CounterTracker(bin_size=bin_size)
+            self._counter_pos = self._burst_fields.index("counter")
+
+        # Start a new session of sample timestamps
+        self._clock = sample_clock.SampleClock(rate=rate)
+        self._index = -1
+        self._timestamp = None
+        self._timestamps = None
+
+        if verbose:
+            logger.debug(f"burst_out: {self._burst_out}")
+            logger.debug(f"burst_struct_fmt: {self._b_struct}")
+            logger.debug(f"burst_fields: {self._burst_fields}")
+
+    def _write_changes(self, changes, verbose=False):
+        """Write register bytes returned by RegInterface().end_staging()
+        in a pipeline, and settle registers in SETTLE_REGS after writing
+
+        Parameters
+        ----------
+        changes : list
+            (winnum, regaddr, write_byte) tuples
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        settle_regs = {
+            (getattr(self.reg, name).WINID, getattr(self.reg, name).ADDR)
+            for name in self.SETTLE_REGS
+            if name in self.reg.__members__
+        }
+        pending = []
+        for winnum, regaddr, write_byte in changes:
+            pending.append((winnum, regaddr, write_byte))
+            if (winnum, regaddr) in settle_regs:
+                self.regif.set_regs(pending, verbose)
+                pending = []
+                self._settle(winnum, regaddr, verbose)
+        if pending:
+            self.regif.set_regs(pending, verbose)
+        if verbose:
+            logger.debug(f"set_config() wrote {len(changes)} register bytes")
+
+    def _settle(self, winnum, regaddr, verbose=False):
+        """Wait for the setting to complete after writing a register
+        in SETTLE_REGS with the model specific _settle_reg().
+        Bypassed when the writes are staged
+
+        Parameters
+        ----------
+        winnum : int
+            WIN_ID of register written
+        regaddr : int
+            register address written
+        verbose : bool
+            If True outputs additional debug info
+
+        Raises
+        -------
+        DeviceTimeoutError
+            When the setting does not complete within the deadline
+        """
+
+        if self.regif.is_staging:
+            return
+        self._settle_reg(winnum, regaddr, verbose)
+
+    def _settle_reg(self, winnum, regaddr, verbose=False):
+        """Wait for the setting to complete after writing a register
+        in SETTLE_REGS, implemented by each functions class
+
+        Parameters
+        ----------
+        winnum : int
+            WIN_ID of register written
+        regaddr : int
+            register address written
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        raise NotImplementedError
+
+    def _get_deadline(self, delay_s):
+        """Return timeout in seconds of a wait on the device
+
+        Parameters
+        ----------
+        delay_s : float
+            expected delay in seconds from model definitions or output period
+
+        Returns
+        -------
+        float
+            DEADLINE_SCALE times delay_s, at least DEADLINE_MIN_S
+        """
+
+        return max(delay_s * self.DEADLINE_SCALE, self.DEADLINE_MIN_S)
+
+    def _wait_reg(
+        self, op, winnum, regaddr, mask, delay_s, verbose=False, min_wait=True
+    ):
+        """Read register until the busy bits in mask are cleared by the
+        device, polling with the adaptive backoff of StatusPoller() until
+        the deadline. Unless min_wait is False, the first read is after
+        delay_s, the minimum delay of the datasheet
+
+        Parameters
+        ----------
+        op : str
+            name of the operation for the measured durations in poll_stats
+        winnum : int
+            WIN_ID of register
+        regaddr : int
+            register address
+        mask : int
+            busy bits of the register that are 1 until the operation completes
+        delay_s : float
+            expected delay in seconds of the operation from model definitions
+        verbose : bool
+            If True outputs additional debug info
+        min_wait : bool
+            If True wait delay_s before the first read, False to read
+            immediately i.e. for power on or a mode change
+
+        Returns
+        -------
+        int
+            register value with busy bits cleared
+
+        Raises
+        -------
+        DeviceTimeoutError
+            When the busy bits are not cleared within the deadline
+        """
+
+        timeout = self._get_deadline(delay_s)
+        result, is_done = self._poller.wait(
+            op,
+            lambda: self.get_reg(winnum, regaddr, verbose),
+            mask,
+            delay_s,
+            timeout,
+            delay_s if min_wait else 0.0,
+        )
+        if not is_done:
+            self._stalls = self._stalls + 1
+            logger.error(
+                f"** Timeout after {timeout:.3f} seconds waiting for {op} "
+                f"WIN_ID {winnum} REG[0x{regaddr:02X}] & 0x{mask:04X} = 0"
+            )
+            raise DeviceTimeoutError
+        if verbose:
+            logger.debug(f"{op}: {dict(self._poller.stats[op])}")
+        return result
+
+    def _wait_mode(self, mode, was_config, delay_s, verbose=False):
+        """Wait for MODE_CMD to complete by polling MODE_CTRL instead of
+        a fixed delay, used by goto() when fast_start
+
+        Parameters
+        ----------
+        mode : str
+            "CONFIG" or "SAMPLING"
+        was_config : bool
+            True if the device was in CONFIG mode before MODE_CMD
+        delay_s : float
+            Maximum expected time in seconds for the mode change
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        port_io = self.regif.port_io
+        if mode == "SAMPLING" and self._status["uart_auto"]:
+            # Registers cannot be read back between bursts in UART_AUTO,
+            # the first read_sample() waits for the first burst instead
+            return
+        if mode == "CONFIG" and not was_config:
+            # Bursts already in flight must end before the response is read
+            idle = port_io.RX_IDLE_SEC
+            if self._clock is not None:
+                idle = min(1.5 / self._clock.rate, idle)
+            port_io.wait_rx_idle(idle, self._get_deadline(delay_s))
+        try:
+            self._wait_reg(
+                "mode",
+                self.reg.MODE_CTRL.WINID,
+                self.reg.MODE_CTRL.ADDR,
+                0x0300,
+                delay_s,
+                verbose,
+                min_wait=False,
+            )
+        except uart_port.InvalidResponseFormatError:
+            # A late burst was mixed with the response, wait for idle and retry
+            logger.warning("Burst received after MODE_CMD, retrying")
+            port_io.wait_rx_idle(delay_s, self._get_deadline(delay_s))
+            self._wait_reg(
+                "mode",
+                self.reg.MODE_CTRL.WINID,
+                self.reg.MODE_CTRL.ADDR,
+                0x0300,
+                delay_s,
+                verbose,
+                min_wait=False,
+            )
+
+    def _set_drdy_polarity(self, act_high=True, verbose=False):
+        """Configure DRDY to active HIGH in MSC_CTRL
+           update _status, and if no_init do not write to registers
+
+        Parameters
+        ----------
+        act_high : bool
+            True = active HIGH or False = active LOW
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        self._status["drdy_pol"] = act_high
+
+        if verbose:
+            logger.debug(f"DRDY_POL = {act_high}")
+
+        if self._cfg.get("no_init", False):
+            logger.warning("--no_init bypass setting DRDY_POL in MSC_CTRL register")
+            return
+
+        _tmp = self.get_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDR, verbose)
+        self.set_reg(
+            self.reg.MSC_CTRL.WINID,
+            self.reg.MSC_CTRL.ADDR,
+            (_tmp & 0xFD) | int(act_high) << 1,
+            verbose,
+        )
+
+    def _get_sample(self, verbose=False):
+        """Return single burst from device. Bursts are parsed in chunks
+        from the UART receive buffer and queued, so one serial read can
+        return several bursts. If bytes were discarded to resync to the next
+        valid burst then raise InvalidBurstReadError
+
+        Parameters
+        ----------
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        list of integers of a single burst of data
+
+        Raises
+        -------
+        InvalidCommandError
+            When device is not configured by set_config() or
+            When device is not in SAMPLING mode
+        DeviceTimeoutError
+            When no burst is received within stall_timeout
+        InvalidBurstReadError
+            When header byte, delimiter byte or checksum is invalid, the
+            malformed bytes are discarded up to the next valid burst
+        KeyboardInterrupt
+            When CTRL-C occurs, re-raise
+        """
+
+        # Return if decoder is empty, then device is not configured
+        if self._decoder is None:
+            logger.error("** Device not configured. Have you run set_config()?")
+            raise InvalidCommandError
+        # Return if still in CONFIG mode
+        if self._status.get("is_config"):
+            logger.error("** Device not in SAMPLING mode. Run goto('sampling') first.")
+            raise InvalidCommandError
+        # Get precompiled decoder of the burst
+        decoder = self._decoder
+        port_io = self.regif.port_io
+        frames = self._rx_frames
+
+        try:
+            is_read = not frames
+            if is_read:
+                discarded = port_io.rx_discarded
+                resyncs = port_io.rx_resyncs
+                self._fill_frames(1, verbose)
+                if port_io.rx_discarded != discarded:
+                    logger.warning(
+                        "** Missing Header, Delimiter or Checksum, "
+                        f"discarded {port_io.rx_discarded - discarded} bytes "
+                        f"in {port_io.rx_resyncs - resyncs} resync(s)"
+                    )
+                    raise InvalidBurstReadError
+
+            # Strip out the header and delimiter byte
+            raw_burst = decoder.unpack(frames.popleft())
+            if raw_burst is None:
+                return raw_burst
+            if self._tracker is not None:
+                self._index = self._tracker.update(raw_burst[self._counter_pos])
+            else:
+                self._index = self._index + 1
+            # Fit the clock once per read to the last burst received
+            if is_read:
+                self._clock.update(self._index + len(frames))
+            self._timestamp = self._clock.timestamp(self._index)
+            return raw_burst
+        except KeyboardInterrupt:
+            print("CTRL-C: Exiting")
+            raise
+
+    def _get_frames(self, n, verbose=False):
+        """Return n complete burst frames from device concatenated in bytes.
+        Malformed bytes are discarded and do not count towards n
+
+        Parameters
+        ----------
+        n : int
+            number of burst frames
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        bytes of n complete burst frames
+
+        Raises
+        -------
+        InvalidCommandError
+            When device is not configured by set_config() or
+            When device is not in SAMPLING mode
+        DeviceTimeoutError
+            When no burst is received within stall_timeout
+        KeyboardInterrupt
+            When CTRL-C occurs, re-raise
+        """
+
+        # Return if decoder is empty, then device is not configured
+        if self._decoder is None:
+            logger.error("** Device not configured. Have you run set_config()?")
+            raise InvalidCommandError
+        # Return if still in CONFIG mode
+        if self._status.get("is_config"):
+            logger.error("** Device not in SAMPLING mode. Run goto('sampling') first.")
+            raise InvalidCommandError
+        port_io = self.regif.port_io
+        frames = self._rx_frames
+
+        try:
+            discarded = port_io.rx_discarded
+            resyncs = port_io.rx_resyncs
+            self._fill_frames(n, verbose)
+            if port_io.rx_discarded != discarded:
+                logger.warning(
+                    "** Missing Header, Delimiter or Checksum, "
+                    f"discarded {port_io.rx_discarded - discarded} bytes "
+                    f"in {port_io.rx_resyncs - resyncs} resync(s)"
+                )
+            return b"".join([frames.popleft() for _ in range(n)])
+        except KeyboardInterrupt:
+            print("CTRL-C: Exiting")
+            raise
+
+    def _fill_frames(self, count, verbose=False):
+        """Read from device until at least count complete burst frames
+        are queued in _rx_frames. Between reads, wait on the serial port
+        for the bytes of the missing frames instead of polling.
+        Raise DeviceTimeoutError if no frame is received within stall_timeout
+
+        Parameters
+        ----------
+        count : int
+            minimum number of queued burst frames
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        port_io = self.regif.port_io
+        frames = self._rx_frames
+        size = self._decoder.size
+        chksm = self._burst_out["chksm"]
+        uart_auto = self._status["uart_auto"]
+        timeout = self.stall_timeout
+        while len(frames) < count:
+            # If UART_AUTO disabled, send BURST command
+            if not uart_auto:
+                port_io.set_raw8(self.mdef.BURST_MARKER, 0x00, verbose)
+            queued = len(frames)
+            frames.extend(port_io.read_frames(size, chksm))
+            # The deadline restarts whenever a frame is received
+            deadline = time.perf_counter() + timeout
+            while len(frames) == queued:
+                t_wait = deadline - time.perf_counter()
+                if t_wait <= 0:
+                    self._stalls = self._stalls + 1
+                    logger.error(
+                        f"** No burst received within {timeout:.3f} seconds. "
+                        "Is device streaming?"
+                    )
+                    raise DeviceTimeoutError
+                # A BURST command returns a single frame
+                nframes = count - queued if uart_auto else 1
+                port_io.wait_rx(nframes * size, t_wait)
+                frames.extend(port_io.read_frames(size, chksm))
+
+    def _proc_sample(self, raw_burst=()):
+        """Process as single burst read of device data
+        Returns processed data in a tuple or () if empty burst
+
+        Parameters
+        ----------
+        raw_burst : list
+            list of integers of single burst of data
+            Typically the output from _get_sample()
+
+        Returns
+        -------
+        tuple of scale-converted single burst of data
+
+        Raises
+        -------
+        InvalidBurstReadError
+            If raw_burst is False
+        KeyboardInterrupt
+            When CTRL-C occurs re-raise
+        """
+
+        try:
+            if not raw_burst:
+                raise InvalidBurstReadError
+
+            return self._decoder.scale(raw_burst)
+        except KeyboardInterrupt:
+            print("CTRL-C: Exiting")
+            raise
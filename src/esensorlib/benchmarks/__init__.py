@@ -0,0 +1,14 @@
+"""
+Benchmarks folder containing performance benchmarks of esensorlib hot paths
+============
+
+Benchmarks run against SimulatedPort() so that no hardware is required,
+and are run as a console application with esensorlib-bench or
+python -m esensorlib.benchmarks
+
+bench_config.py measures set_config() cost in register transactions
+bench_decode.py measures burst read and decode throughput per burst layout
+bench_logger.py measures LoggerHelper CSV write throughput
+common.py provides the model list and simulated device setup shared by benchmarks
+__main__.py is the command line entry point to run the benchmarks
+"""
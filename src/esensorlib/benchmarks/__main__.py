@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Command line entry point to run esensorlib benchmarks against
+simulated devices, i.e. esensorlib-bench --suite decode --quick
+Contains:
+- get_args() function
+- main() function
+"""
+
+import argparse
+import json
+import sys
+
+from loguru import logger
+from tabulate import tabulate
+
+from esensorlib.benchmarks import bench_config, bench_decode, bench_logger, common
+
+# Models used by the logger and config suites when --models is not specified
+DEFAULT_MODELS = ("G370PDF1", "A352AD10", "A342VD10")
+
+SUITES = ("decode", "logger", "config")
+
+
+def get_args(argv=None):
+    """
+    returns parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="This program benchmarks burst decode, CSV logging, and "
+        "set_config() of esensorlib against simulated devices "
+        "without hardware."
+    )
+
+    parser.add_argument(
+        "--suite",
+        help="specifies benchmarks to run, default is all.",
+        nargs="+",
+        choices=SUITES,
+        default=list(SUITES),
+    )
+    parser.add_argument(
+        "--models",
+        help="specifies product IDs to benchmark i.e. G370PDF1 A352AD10, "
+        "default is all models for decode and "
+        f"{' '.join(DEFAULT_MODELS)} for logger and config.",
+        nargs="+",
+        type=str.upper,
+    )
+    parser.add_argument(
+        "-s",
+        "--samples",
+        help="specifies number of samples timed per burst layout, default is 2000.",
+        type=int,
+        default=2000,
+    )
+    parser.add_argument(
+        "--rows",
+        help="specifies number of CSV rows written per model, default is 10000.",
+        type=int,
+        default=10000,
+    )
+    parser.add_argument(
+        "--quick",
+        help="specifies to only decode burst layouts with all flags "
+        "disabled or all enabled.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--json",
+        help="specifies a file to save results as JSON for comparison "
+        "against a baseline.",
+        type=str,
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run benchmarks and print a table of results per suite"""
+
+    args = get_args(argv)
+    # Silence no_init warnings logged for every simulated device
+    logger.disable("esensorlib")
+
+    results = {}
+    if "decode" in args.suite:
+        print("Decode: read_sample() per burst layout", flush=True)
+        results["decode"] = bench_decode.run(
+            args.models or common.list_models(), args.samples, args.quick
+        )
+        print(tabulate(results["decode"], headers="keys", floatfmt=".2f"), flush=True)
+    if "logger" in args.suite:
+        print("\nLogger: LoggerHelper.write() to CSV", flush=True)
+        results["logger"] = bench_logger.run(args.models or DEFAULT_MODELS, args.rows)
+        print(tabulate(results["logger"], headers="keys", floatfmt=".2f"), flush=True)
+    if "config" in args.suite:
+        print("\nConfig: set_config() register transactions", flush=True)
+        results["config"] = bench_config.run(args.models or DEFAULT_MODELS)
+        print(tabulate(results["config"], headers="keys", floatfmt=".2f"), flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
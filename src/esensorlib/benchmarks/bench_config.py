@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of set_config() cost in register transactions
+Contains:
+- measure() function
+- run() function
+"""
+
+import contextlib
+import io
+import time
+
+from esensorlib import sim_port, uart_port
+from esensorlib.benchmarks import common
+
+# Typical configuration per device type
+CONFIGS = {
+    "imu": {
+        "dout_rate": 200,
+        "ndflags": True,
+        "tempc": True,
+        "counter": "sample",
+        "chksm": True,
+        "is_32bit": True,
+    },
+    "accl": {
+        "dout_rate": 200,
+        "ndflags": True,
+        "tempc": True,
+        "counter": True,
+        "chksm": True,
+    },
+    "vib": {
+        "output_sel": "VELOCITY_RMS",
+        "ndflags": True,
+        "tempc": True,
+        "counter": True,
+        "chksm": True,
+    },
+}
+
+# set_config() variants as (label, extra set_config() arguments, reg_cache)
+VARIANTS = (
+    ("write_all", {"write_all": True}, False),
+    ("diff", {}, False),
+    ("diff+cache", {}, True),
+)
+
+
+def measure(dev, cfg):
+    """Return register transactions of a single set_config() call
+
+    Parameters
+    ----------
+    dev : SensorDevice
+        sensor device from common.open_device() without no_init
+    cfg : dict
+        set_config() keyword arguments
+
+    Returns
+    -------
+    dict
+        register reads, register writes, estimated UART time in ms at the
+        UartPort() command rate, wall time in ms including mode change and
+        settling delays, and set_config() return value
+    """
+
+    device = dev.port_io.device
+    device.nreads = 0
+    device.nwrites = 0
+    # Suppress configuration messages printed by set_config()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        changed = dev.set_config(**cfg)
+        wall_s = time.perf_counter() - start
+    uart_s = (
+        device.nreads * uart_port.UartPort.TREADRATE
+        + device.nwrites * uart_port.UartPort.TWRITERATE
+    )
+    return {
+        "reads": device.nreads,
+        "writes": device.nwrites,
+        "uart_ms": uart_s * 1e3,
+        "wall_ms": wall_s * 1e3,
+        "changed": changed,
+    }
+
+
+def run(models):
+    """Measure first and repeated set_config() of the typical configuration
+    for each model and set_config() variant
+
+    Parameters
+    ----------
+    models : list
+        product IDs of models to benchmark
+
+    Returns
+    -------
+    list
+        dict per model, variant and call with measure() results
+    """
+
+    results = []
+    for prod_id in models:
+        cfg = CONFIGS[sim_port.SimulatedDevice.get_family(prod_id)]
+        for label, extra, reg_cache in VARIANTS:
+            dev = common.open_device(prod_id, reg_cache=reg_cache)
+            try:
+                for call in ("first", "repeat"):
+                    result = measure(dev, dict(cfg, **extra))
+                    results.append(
+                        dict({"model": prod_id, "variant": label, "call": call}, **result)
+                    )
+            finally:
+                common.close_device(dev)
+    return results
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of burst read and decode throughput for every model
+and burst layout combination
+Contains:
+- measure() function
+- run() function
+"""
+
+import time
+
+from esensorlib.benchmarks import common
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Samples read before timing to fill caches and compile the burst table
+WARMUP_SAMPLES = 100
+
+
+def measure(dev, samples=2000):
+    """Return timing of read_sample() on a device in SAMPLING mode.
+    Time spent by the simulated device to produce the same bytes is
+    measured separately so it can be subtracted from read_sample()
+
+    Parameters
+    ----------
+    dev : SensorDevice
+        sensor device from common.open_device() with no_init configuration
+    samples : int
+        number of samples to time
+
+    Returns
+    -------
+    dict
+        frame bytes, simulated device us/sample, read_sample() us/sample,
+        samples/sec, read_samples() us/sample or None without numpy,
+        and number of samples returned as corrupted
+    """
+
+    size = dev.sensor_fn.decoder.size
+    device = dev.port_io.device
+
+    for _ in range(WARMUP_SAMPLES):
+        dev.read_sample()
+
+    start = time.perf_counter()
+    device.read(size * samples)
+    sim_s = time.perf_counter() - start
+
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(samples):
+        if not dev.read_sample():
+            errors = errors + 1
+    read_s = time.perf_counter() - start
+
+    batch_s = None
+    if np is not None:
+        start = time.perf_counter()
+        dev.read_samples(samples)
+        batch_s = time.perf_counter() - start
+
+    return {
+        "bytes": size,
+        "sim_us": sim_s / samples * 1e6,
+        "us_sample": read_s / samples * 1e6,
+        "samples_s": samples / read_s,
+        "batch_us_sample": None if batch_s is None else batch_s / samples * 1e6,
+        "errors": errors,
+    }
+
+
+def run(models, samples=2000, quick=False):
+    """Measure read_sample() for every burst layout of each model
+
+    Parameters
+    ----------
+    models : list
+        product IDs of models to benchmark
+    samples : int
+        number of samples to time per burst layout
+    quick : bool
+        If True only combine all burst flags disabled or all enabled
+
+    Returns
+    -------
+    list
+        dict per model and burst layout with measure() results, maximum
+        output rate of the burst layout and headroom as samples/sec over
+        maximum output rate
+    """
+
+    results = []
+    for prod_id in models:
+        for label, cfg in common.get_layouts(prod_id, quick):
+            max_rate = common.get_max_rate(prod_id, cfg)
+            dev = common.open_device(prod_id, cfg)
+            try:
+                result = measure(dev, samples)
+            finally:
+                common.close_device(dev)
+            results.append(
+                dict(
+                    {"model": prod_id, "layout": label},
+                    **result,
+                    max_rate=max_rate,
+                    headroom=result["samples_s"] / max_rate,
+                )
+            )
+    return results
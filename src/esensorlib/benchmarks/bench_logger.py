@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark of LoggerHelper CSV write throughput
+Contains:
+- measure() function
+- run() function
+"""
+
+import os
+import tempfile
+import time
+
+from esensorlib.benchmarks import common
+from esensorlib.example import helper
+
+
+def measure(dev, samples=10000, buffered=False):
+    """Return timing of LoggerHelper.write() to a CSV file in a
+    temporary folder. Samples are read before timing so that only
+    formatting and file output is measured
+
+    Parameters
+    ----------
+    dev : SensorDevice
+        sensor device from common.open_device() with no_init configuration
+    samples : int
+        number of rows to write
+    buffered : bool
+        If True write with AsyncCsvWriter(), write_us_row is the time
+        spent in write() before rows are written by the writer thread
+
+    Returns
+    -------
+    dict
+        number of columns, us/row, us/row spent in write(), rows/sec,
+        and MB/sec written
+    """
+
+    data = [dev.read_sample() for _ in range(samples)]
+
+    with tempfile.TemporaryDirectory() as folder:
+        log = helper.LoggerHelper(sensor=dev)
+        log.set_writer(to=[os.path.join(folder, "bench")], buffered=buffered)
+        start = time.perf_counter()
+        for sample_data in data:
+            log.write(sample_data)
+        loop_s = time.perf_counter() - start
+        # Switching to stdout closes and flushes the CSV file
+        log.set_writer(to=None)
+        write_s = time.perf_counter() - start
+        size = sum(
+            os.path.getsize(os.path.join(folder, fname)) for fname in os.listdir(folder)
+        )
+
+    return {
+        "columns": len(dev.burst_fields) + 1,
+        "us_row": write_s / samples * 1e6,
+        "write_us_row": loop_s / samples * 1e6,
+        "rows_s": samples / write_s,
+        "mb_s": size / write_s / 1e6,
+    }
+
+
+def run(models, samples=10000):
+    """Measure LoggerHelper.write() for the widest burst layout of each model,
+    directly to the file and with the buffered writer
+
+    Parameters
+    ----------
+    models : list
+        product IDs of models to benchmark
+    samples : int
+        number of rows to write per model
+
+    Returns
+    -------
+    list
+        dict per model and writer with measure() results
+    """
+
+    results = []
+    for prod_id in models:
+        label, cfg = list(common.get_layouts(prod_id, quick=True))[-1]
+        dev = common.open_device(prod_id, cfg)
+        try:
+            for buffered in (False, True):
+                result = measure(dev, samples, buffered)
+                results.append(
+                    dict(
+                        {"model": prod_id, "layout": label, "buffered": buffered},
+                        **result,
+                    )
+                )
+        finally:
+            common.close_device(dev)
+    return results
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Common setup shared by benchmarks to create simulated devices
+for every model and burst layout
+Contains:
+- list_models() function
+- get_max_rate() function
+- get_layouts() function
+- get_flash() function
+- open_device() function
+- close_device() function
+"""
+
+import contextlib
+import io
+import itertools
+import pkgutil
+
+from esensorlib import model, sensor_device, sim_port
+
+# Representative product ID for model definitions shared by a product family
+_PROD_IDS = {
+    "G320": "G320PDG0",
+    "G354": "G354PDH0",
+}
+
+# Burst flags in the order used for layout labels
+_FLAGS = (
+    ("ndflags", "nd"),
+    ("tempc", "tc"),
+    ("counter", "cnt"),
+    ("chksm", "cs"),
+)
+
+
+def list_models():
+    """Return product IDs of all models in the model folder
+
+    Returns
+    -------
+    list
+        product ID per model definitions module except mcore
+    """
+
+    prod_ids = []
+    for module in pkgutil.iter_modules(model.__path__):
+        if module.name == "mcore":
+            continue
+        prod_id = module.name[1:].upper()
+        prod_ids.append(_PROD_IDS.get(prod_id, prod_id))
+    return sorted(prod_ids)
+
+
+def get_max_rate(prod_id, cfg=None):
+    """Return maximum burst output rate in Hz of the model and burst layout,
+    the raw output of the vibration sensor has a fixed rate per output_sel
+
+    Parameters
+    ----------
+    prod_id : str
+        product ID of model
+    cfg : dict
+        optional set_config() keyword arguments of the burst layout
+        i.e. from get_layouts()
+
+    Returns
+    -------
+    int
+        maximum output rate in Hz
+    """
+
+    if sim_port.SimulatedDevice.get_family(prod_id) == "vib":
+        if (cfg or {}).get("output_sel", "VELOCITY_RAW").upper() == "DISP_RAW":
+            return sim_port.SimulatedDevice.DISP_RAW_RATE
+        return sim_port.SimulatedDevice.VELOCITY_RAW_RATE
+    mdef = sim_port.SimulatedDevice.get_model_definitions(prod_id)
+    return max(mdef.DOUT_RATE)
+
+
+def get_layouts(prod_id, quick=False):
+    """Generate every burst layout supported by the model as no_init
+    configuration, ndflags, tempc, counter and chksm are combined with
+    16-bit or 32-bit output, delta angle/velocity, quaternion and attitude
+    for IMU or output selection for vibration sensor
+
+    Parameters
+    ----------
+    prod_id : str
+        product ID of model
+    quick : bool
+        If True only combine all burst flags disabled or all enabled
+
+    Yields
+    ------
+    tuple
+        (layout label, set_config() keyword arguments)
+    """
+
+    family = sim_port.SimulatedDevice.get_family(prod_id)
+    mdef = sim_port.SimulatedDevice.get_model_definitions(prod_id)
+
+    if quick:
+        flag_sets = [(False,) * len(_FLAGS), (True,) * len(_FLAGS)]
+    else:
+        flag_sets = itertools.product((False, True), repeat=len(_FLAGS))
+
+    if family == "imu":
+        extras = [("", {})]
+        if mdef.HAS_FEATURE.get("DLT_OUTPUT"):
+            extras.append(("dlt", {"dlta": True, "dltv": True}))
+        if mdef.HAS_FEATURE.get("ATTI_OUTPUT"):
+            extras.append(("qtn", {"qtn": True}))
+            extras.append(("atti", {"atti": True}))
+            extras.append(("qtn+atti", {"qtn": True, "atti": True}))
+        variants = [
+            (f"{'32' if is_32bit else '16'}bit", dict(extra, is_32bit=is_32bit), name)
+            for is_32bit in (False, True)
+            for name, extra in extras
+        ]
+    elif family == "vib":
+        variants = [
+            (sel.lower(), {"output_sel": sel}, "")
+            for sel in ("VELOCITY_RAW", "DISP_RAW")
+        ]
+    else:
+        variants = [("", {}, "")]
+
+    for flags in flag_sets:
+        for prefix, extra, suffix in variants:
+            cfg = {key: value for (key, _), value in zip(_FLAGS, flags)}
+            if family == "imu":
+                cfg["counter"] = "sample" if cfg["counter"] else ""
+            cfg.update(extra)
+            parts = [prefix] + [abbrev for (_, abbrev), on in zip(_FLAGS, flags) if on]
+            label = "+".join([part for part in parts + [suffix] if part])
+            yield label or "default", cfg
+
+
+def get_flash(prod_id, cfg):
+    """Return flash backup registers that power on the simulated device
+    in SAMPLING mode with UART_AUTO and the burst layout of cfg
+
+    Parameters
+    ----------
+    prod_id : str
+        product ID of model
+    cfg : dict
+        no_init configuration i.e. from get_layouts()
+
+    Returns
+    -------
+    dict
+        register name to 16-bit value
+    """
+
+    family = sim_port.SimulatedDevice.get_family(prod_id)
+    mdef = sim_port.SimulatedDevice.get_model_definitions(prod_id)
+
+    flags = (
+        (0x8000 if cfg.get("ndflags") else 0)
+        | (0x4000 if cfg.get("tempc") else 0)
+        | (0x0002 if cfg.get("counter") else 0)
+        | (0x0001 if cfg.get("chksm") else 0)
+    )
+    if family == "imu":
+        outputs = (
+            0x3000
+            | (0x4000 if cfg.get("tempc") else 0)
+            | (0x0800 if cfg.get("dlta") else 0)
+            | (0x0400 if cfg.get("dltv") else 0)
+            | (0x0200 if cfg.get("qtn") else 0)
+            | (0x0100 if cfg.get("atti") else 0)
+        )
+        return {
+            "UART_CTRL": 0x03,
+            "BURST_CTRL1": flags | outputs,
+            "BURST_CTRL2": outputs if cfg.get("is_32bit") else 0,
+        }
+    if family == "vib":
+        return {
+            "UART_CTRL": 0x03,
+            "BURST_CTRL": flags | 0x0700,
+            "SIG_CTRL": mdef.OUTPUT_SEL[cfg.get("output_sel", "VELOCITY_RAW")] << 4,
+        }
+    return {
+        "UART_CTRL": 0x03,
+        "BURST_CTRL": flags | 0x0700,
+    }
+
+
+def open_device(prod_id, cfg=None, reg_cache=False):
+    """Return SensorDevice() connected to a SimulatedPort().
+    If cfg is specified the device powers on in SAMPLING mode with the
+    burst layout of cfg and is configured with no_init, otherwise the
+    device is initialized as connected hardware
+
+    Parameters
+    ----------
+    prod_id : str
+        product ID of model
+    cfg : dict
+        optional no_init configuration i.e. from get_layouts()
+    reg_cache : bool
+        If True enable RegInterface() shadow register cache
+
+    Returns
+    -------
+    SensorDevice
+        sensor device ready for read_sample() when cfg is specified
+    """
+
+    no_init = cfg is not None
+    flash = get_flash(prod_id, cfg) if no_init else None
+    # Suppress port open messages printed for every device
+    with contextlib.redirect_stdout(io.StringIO()):
+        port = sim_port.SimulatedPort(prod_id, no_init=no_init, flash=flash)
+        dev = sensor_device.SensorDevice(
+            port, if_type="sim", model=prod_id, no_init=no_init, reg_cache=reg_cache
+        )
+        if no_init:
+            dev.set_config(no_init=True, uart_auto=True, **cfg)
+            dev.goto("sampling")
+    return dev
+
+
+def close_device(dev):
+    """Close port of SensorDevice() created by open_device()
+
+    Parameters
+    ----------
+    dev : SensorDevice
+        sensor device to close
+    """
+
+    dev.port_io.close(verbose=False)
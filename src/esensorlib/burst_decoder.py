@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Burst Decoder class for unpacking and scaling sensor burst data
+Contains:
+- BurstDecoder() class
+"""
+
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# struct format character to big endian numpy type
+_NP_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": ">i2",
+    "H": ">u2",
+    "i": ">i4",
+    "I": ">u4",
+}
+
+
+class BurstDecoder:
+    """
+    Precompiled decoder for one burst layout of accelerometer,
+    vibration sensor, or IMU. It is created by AcclFn(), ImuFn(), or
+    VibFn() when the burst configuration is read and reused for
+    every sample until the burst layout changes.
+
+    ...
+
+    Attributes
+    ----------
+    struct : struct.Struct
+        compiled struct used to unpack a complete burst frame
+    size : int
+        size of a complete burst frame in bytes
+    fields : tuple
+        burst fields in the order returned by unpack() and scale()
+    scales : tuple
+        per-field scale factor
+    offsets : tuple
+        per-field offset added after scaling
+    ndigits : tuple
+        per-field rounding digits, None means no rounding
+    layout : dict
+        parameters to create an identical BurstDecoder(**layout) i.e. when
+        decoding frames stored in a binary capture
+
+    Methods
+    -------
+    unpack(data)
+        Return tuple of unscaled burst fields or None if frame is malformed
+
+    scale(raw_burst)
+        Return tuple of burst fields with scale factor and offset applied
+
+    decode(data)
+        Return tuple of scaled burst fields or None if frame is malformed
+
+    decode_array(data, scaled)
+        Return numpy structured array of burst fields from many frames
+    """
+
+    def __init__(
+        self,
+        struct_fmt,
+        burst_fields,
+        conversions,
+        marker=0x80,
+        delimiter=0x0D,
+        merge=None,
+        rounding=True,
+    ):
+        """
+        Parameters
+        ----------
+        struct_fmt : str
+            struct format of the complete burst including header and delimiter
+        burst_fields : tuple
+            burst field names
+        conversions : list
+            (scale, offset, ndigits) per burst field, scale of None means
+            the field is passed through unscaled
+        marker : int
+            expected header byte
+        delimiter : int
+            expected delimiter byte
+        merge : list
+            optional index plan of (index, index_low) per burst field to merge
+            an upper signed part and lower 16-bit part into a single integer
+            i.e. 24-bit fields, index_low is None for plain fields
+        rounding : bool
+            If True scaled values are rounded to ndigits per field
+        """
+
+        self.struct = struct.Struct(struct_fmt)
+        self.size = self.struct.size
+        self.fields = tuple(burst_fields)
+        self._marker = marker
+        self._delimiter = delimiter
+        self._rounding = rounding
+        self._merge = tuple(merge) if merge else None
+        self._conversions = tuple(tuple(conv) for conv in conversions)
+
+        if len(conversions) != len(self.fields):
+            raise ValueError(
+                f"** Mismatched conversions ({len(conversions)}) "
+                f"and burst fields ({len(self.fields)})"
+            )
+
+        # Pass-through fields are scaled by 1 with no offset and ndigits None
+        # so that scale() uses a single expression for every field
+        self.scales = tuple(1 if conv[0] is None else conv[0] for conv in conversions)
+        self.offsets = tuple(0 if conv[0] is None else conv[1] for conv in conversions)
+        self.ndigits = tuple(None if conv[0] is None else conv[2] for conv in conversions)
+        self._is_identity = all(conv[0] is None for conv in conversions)
+        self._is_scaled = tuple(conv[0] is not None for conv in conversions)
+        # numpy dtype of complete burst frame, created on first decode_array()
+        self._dtype = None
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(struct_fmt='{self.struct.format}', burst_fields={self.fields})"
+
+    @property
+    def layout(self):
+        """property for parameters of BurstDecoder() with json compatible types"""
+        return {
+            "struct_fmt": self.struct.format,
+            "burst_fields": list(self.fields),
+            "conversions": [list(conv) for conv in self._conversions],
+            "marker": self._marker,
+            "delimiter": self._delimiter,
+            "merge": [list(each) for each in self._merge] if self._merge else None,
+            "rounding": self._rounding,
+        }
+
+    def unpack(self, data):
+        """Unpack a complete burst frame and strip header and delimiter
+
+        Parameters
+        ----------
+        data : bytes
+            complete burst frame including header and delimiter byte
+
+        Returns
+        -------
+        tuple
+            unscaled burst fields or None if header or delimiter is missing
+        """
+
+        data_unpacked = self.struct.unpack(data)
+        if data_unpacked[0] != self._marker or data_unpacked[-1] != self._delimiter:
+            return None
+        if self._merge is None:
+            return data_unpacked[1:-1]
+        return tuple(
+            [
+                data_unpacked[i] if j is None else (data_unpacked[i] << 16) | data_unpacked[j]
+                for i, j in self._merge
+            ]
+        )
+
+    def scale(self, raw_burst):
+        """Apply per-field scale factor, offset and rounding
+
+        Parameters
+        ----------
+        raw_burst : tuple
+            unscaled burst fields, typically the output of unpack()
+
+        Returns
+        -------
+        tuple
+            scaled burst fields
+        """
+
+        if self._is_identity:
+            return tuple(raw_burst)
+        if self._rounding:
+            return tuple(
+                [
+                    round(x * sf + off, nd)
+                    for x, sf, off, nd in zip(
+                        raw_burst, self.scales, self.offsets, self.ndigits
+                    )
+                ]
+            )
+        return tuple(
+            [x * sf + off for x, sf, off in zip(raw_burst, self.scales, self.offsets)]
+        )
+
+    def decode(self, data):
+        """Unpack and scale a complete burst frame
+
+        Parameters
+        ----------
+        data : bytes
+            complete burst frame including header and delimiter byte
+
+        Returns
+        -------
+        tuple
+            scaled burst fields or None if header or delimiter is missing
+        """
+
+        raw_burst = self.unpack(data)
+        if raw_burst is None:
+            return None
+        return self.scale(raw_burst)
+
+    def decode_array(self, data, scaled=True):
+        """Unpack and optionally scale many concatenated burst frames
+        with numpy. Frames with missing header or delimiter are dropped.
+        Scaled fields are float64, pass-through fields keep their integer type
+
+        Parameters
+        ----------
+        data : bytes
+            concatenated complete burst frames including header and delimiter
+        scaled : bool
+            If True apply per-field scale factor, offset and rounding
+
+        Returns
+        -------
+        numpy.ndarray
+            structured array with one row per frame named by burst fields
+
+        Raises
+        -------
+        ImportError
+            When numpy is not installed
+        """
+
+        if np is None:
+            raise ImportError("** numpy is required for decode_array()")
+        if self._dtype is None:
+            self._dtype = np.dtype(
+                [
+                    (f"f{i}", _NP_TYPES[char])
+                    for i, char in enumerate(self.struct.format.lstrip("<>!=@"))
+                ]
+            )
+
+        raw = np.frombuffer(data, dtype=self._dtype)
+        names = self._dtype.names
+        is_valid = (raw[names[0]] == self._marker) & (raw[names[-1]] == self._delimiter)
+        if not is_valid.all():
+            raw = raw[is_valid]
+
+        if self._merge is None:
+            columns = [raw[name] for name in names[1:-1]]
+        else:
+            columns = [
+                raw[names[i]]
+                if j is None
+                else (raw[names[i]].astype(np.int32) << 16) | raw[names[j]]
+                for i, j in self._merge
+            ]
+        # Convert from big endian to native byte order
+        columns = [col.astype(col.dtype.newbyteorder("=")) for col in columns]
+
+        if scaled:
+            for i, col in enumerate(columns):
+                if not self._is_scaled[i]:
+                    continue
+                col = col * self.scales[i] + self.offsets[i]
+                if self._rounding:
+                    col = np.round(col, self.ndigits[i])
+                columns[i] = col
+
+        samples = np.empty(
+            len(raw),
+            dtype=[(field, col.dtype) for field, col in zip(self.fields, columns)],
+        )
+        for field, col in zip(self.fields, columns):
+            samples[field] = col
+        return samples
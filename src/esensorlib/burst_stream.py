@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Burst Stream class for reading sensor bursts on a background thread
+Contains:
+- StreamError() class
+- BurstStream() class
+"""
+
+import queue
+import threading
+import time
+from types import MappingProxyType
+
+from loguru import logger
+
+
+class StreamError(Exception):
+    """Stream cannot be started or acquisition thread failed"""
+
+
+class BurstStream:
+    """
+    Background acquisition thread that reads burst frames from
+    the UART, decodes them, and pushes each batch of samples
+    into a bounded queue. Typically, created by SensorDevice.start_stream()
+    when the device is in SAMPLING mode
+
+    ...
+
+    Attributes
+    ----------
+    stats : MappingProxyType
+        queued, dropped, est_overruns frame counters, discarded bytes, resyncs
+        and stalls
+    tracker : CounterTracker
+        sample counter statistics updated as batches are decoded or None
+    clock : SampleClock
+        fit of host time to sample index updated per batch or None
+    index : int
+        sample index of the last sample decoded
+    is_running : bool
+        True while the acquisition thread is alive
+
+    Methods
+    -------
+    start()
+        Start acquisition thread
+
+    stop(timeout)
+        Stop acquisition thread and wait for it to exit
+
+    get(block, timeout)
+        Return next batch of samples from the queue
+    """
+
+    POLICIES = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(
+        self,
+        port_io,
+        decoder,
+        frames=(),
+        chksm=False,
+        tracker=None,
+        clock=None,
+        index=-1,
+        timestamps=False,
+        burst_cmd=None,
+        maxsize=64,
+        policy="block",
+        scaled=True,
+        poll_interval=0.1,
+        stall_timeout=None,
+    ):
+        """
+        Parameters
+        ----------
+        port_io : UartPort() instance
+            serial port the device is streaming from
+        decoder : BurstDecoder() instance
+            decoder of the current burst configuration
+        frames : tuple
+            complete burst frames already received, sent as the first batch
+        chksm : bool
+            If True verify the 16-bit checksum of each burst frame
+        tracker : CounterTracker() instance
+            optional tracker updated with the counter field of each burst
+        clock : SampleClock() instance
+            optional clock fitted to the sample index of each batch
+        index : int
+            sample index of the last sample already read, used to count
+            sample index when there is no tracker
+        timestamps : bool
+            If True each sample in a batch is a (timestamp, sample) tuple
+            with host timestamp from clock
+        burst_cmd : int
+            BURST command byte to send for each burst if UART_AUTO is disabled,
+            None if UART_AUTO is enabled
+        maxsize : int
+            maximum number of batches in the queue
+        policy : str
+            when the queue is full either "block" to wait for the consumer,
+            "drop_oldest" to discard the oldest batch in the queue, or
+            "drop_newest" to discard the new batch
+        scaled : bool
+            If True apply scale factor to sensor data
+        poll_interval : float
+            maximum time in seconds to wait on the serial port for a complete
+            burst before checking if the stream is stopped
+        stall_timeout : float
+            If no burst is received for stall_timeout seconds, stop the
+            acquisition thread with StreamError, None to wait forever
+        """
+
+        if policy not in self.POLICIES:
+            raise ValueError(f"** Invalid overflow policy {policy}, use {self.POLICIES}")
+        if decoder is None:
+            logger.error("** Device not configured. Have you run set_config()?")
+            raise StreamError
+        if timestamps and clock is None:
+            logger.error("** Timestamps require a SampleClock()")
+            raise StreamError
+
+        self._port_io = port_io
+        self._decoder = decoder
+        self._frames = tuple(frames)
+        self._chksm = chksm
+        self._tracker = tracker
+        self._counter_pos = decoder.fields.index("counter") if tracker else None
+        self._clock = clock
+        self._index = index
+        self._timestamps = timestamps
+        self._burst_cmd = burst_cmd
+        self._maxsize = maxsize
+        self._policy = policy
+        self._scaled = scaled
+        self._poll_interval = poll_interval
+        self._stall_timeout = stall_timeout
+
+        self._queue = queue.Queue(maxsize)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._stats = {
+            "queued": 0,
+            "dropped": 0,
+            "est_overruns": 0,
+            "discarded_bytes": 0,
+            "resyncs": 0,
+            "stalls": 0,
+        }
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(port_io={self._port_io}, ",
+                f"decoder={self._decoder}, ",
+                f"maxsize={self._maxsize}, ",
+                f"policy='{self._policy}', ",
+                f"scaled={self._scaled})",
+            ]
+        )
+        return string_val
+
+    def __iter__(self):
+        """Yield batches until the stream is stopped and the queue is empty"""
+
+        while self.is_running or not self._queue.empty():
+            try:
+                yield self.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    @property
+    def stats(self):
+        """property for stream counters as MappingProxyType"""
+        return MappingProxyType(self._stats)
+
+    @property
+    def tracker(self):
+        """property for CounterTracker() updated by the acquisition thread"""
+        return self._tracker
+
+    @property
+    def clock(self):
+        """property for SampleClock() updated by the acquisition thread"""
+        return self._clock
+
+    @property
+    def index(self):
+        """property for sample index of the last sample decoded"""
+        return self._index
+
+    @property
+    def is_running(self):
+        """property for acquisition thread alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start acquisition thread
+
+        Raises
+        -------
+        StreamError
+            When the stream is already running
+        """
+
+        if self.is_running:
+            logger.error("** Stream is already running")
+            raise StreamError
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="BurstStream", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """Stop acquisition thread, batches in the queue can still be read
+
+        Parameters
+        ----------
+        timeout : float
+            maximum time in seconds to wait for the thread to exit
+        """
+
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get(self, block=True, timeout=None):
+        """Return next batch of samples from the queue
+
+        Parameters
+        ----------
+        block : bool
+            If True wait until a batch is available
+        timeout : float
+            maximum time in seconds to wait, None to wait forever
+
+        Returns
+        -------
+        list
+            tuples of burst samples as returned by read_sample() or
+            read_sample_unscaled(), or (timestamp, sample) tuples
+            if timestamps are enabled
+
+        Raises
+        -------
+        queue.Empty
+            When no batch is available within timeout
+        StreamError
+            When the acquisition thread stopped on an error and the queue is empty
+        """
+
+        try:
+            return self._queue.get(block, timeout)
+        except queue.Empty:
+            if self._error is not None:
+                raise StreamError from self._error
+            raise
+
+    def _run(self):
+        """Acquisition thread, read and decode frames until stopped"""
+
+        port_io = self._port_io
+        size = self._decoder.size
+        decode = self._decoder.decode if self._scaled else self._decoder.unpack
+        is_pending = False
+        t_frame = time.perf_counter()
+        try:
+            if self._frames:
+                self._put(self._stamp([decode(frame) for frame in self._frames]))
+                self._frames = ()
+            while not self._stop_event.is_set():
+                # If UART_AUTO disabled, send BURST command when none pending
+                if self._burst_cmd is not None and not is_pending:
+                    port_io.set_raw8(self._burst_cmd, 0x00)
+                    is_pending = True
+                discarded = port_io.rx_discarded
+                resyncs = port_io.rx_resyncs
+                frames = list(port_io.read_frames(size, self._chksm))
+                if port_io.rx_discarded != discarded:
+                    nbytes = port_io.rx_discarded - discarded
+                    self._stats["discarded_bytes"] += nbytes
+                    self._stats["resyncs"] += port_io.rx_resyncs - resyncs
+                    # The UART does not report overruns, so estimate lost
+                    # bursts as discarded bytes rounded up to burst size
+                    self._stats["est_overruns"] += -(-nbytes // size)
+                if not frames:
+                    if (
+                        self._stall_timeout is not None
+                        and time.perf_counter() - t_frame > self._stall_timeout
+                    ):
+                        self._stats["stalls"] += 1
+                        raise StreamError(
+                            "No burst received within "
+                            f"{self._stall_timeout:.3f} seconds"
+                        )
+                    port_io.wait_rx(size, self._poll_interval)
+                    continue
+                is_pending = False
+                t_frame = time.perf_counter()
+                self._put(self._stamp([decode(frame) for frame in frames]))
+        except Exception as err:
+            logger.error(f"** Stream acquisition stopped: {err}")
+            self._error = err
+
+    def _stamp(self, batch):
+        """Update tracker and clock with a batch as it is received, and
+        return batch of (timestamp, sample) tuples if timestamps are enabled"""
+
+        if self._tracker is not None:
+            update = self._tracker.update
+            pos = self._counter_pos
+            indexes = [update(sample[pos]) for sample in batch]
+        else:
+            indexes = range(self._index + 1, self._index + 1 + len(batch))
+        if not indexes:
+            return batch
+        self._index = indexes[-1]
+        if self._clock is None:
+            return batch
+
+        # Fit the clock once per batch to the last burst received
+        self._clock.update(self._index)
+        if not self._timestamps:
+            return batch
+        timestamp = self._clock.timestamp
+        return [(timestamp(index), sample) for index, sample in zip(indexes, batch)]
+
+    def _put(self, batch):
+        """Push batch to the queue according to overflow policy"""
+
+        if self._policy == "block":
+            while not self._stop_event.is_set():
+                try:
+                    self._queue.put(batch, timeout=0.1)
+                    self._stats["queued"] += len(batch)
+                    return
+                except queue.Full:
+                    continue
+            # Stopped while waiting, keep the batch if the queue has room
+            try:
+                self._queue.put_nowait(batch)
+                self._stats["queued"] += len(batch)
+            except queue.Full:
+                self._stats["dropped"] += len(batch)
+        elif self._policy == "drop_newest":
+            try:
+                self._queue.put_nowait(batch)
+                self._stats["queued"] += len(batch)
+            except queue.Full:
+                self._stats["dropped"] += len(batch)
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(batch)
+                    self._stats["queued"] += len(batch)
+                    return
+                except queue.Full:
+                    try:
+                        self._stats["dropped"] += len(self._queue.get_nowait())
+                    except queue.Empty:
+                        pass
@@ -0,0 +1,811 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Binary capture classes for writing burst frames or decoded records
+to a file with a self-describing layout header, and for reading them
+memory-mapped with a sidecar time index
+Contains:
+- CaptureError() class
+- CaptureWriter() class
+- CaptureReader() class
+"""
+
+import datetime
+import json
+import math
+import mmap
+import os
+import struct
+
+from loguru import logger
+
+from esensorlib import burst_decoder, counter_tracker
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# First bytes of a capture file followed by the header length as uint32
+MAGIC = b"ESNSRCAP"
+FORMAT_VERSION = 1
+# Records start at a multiple of ALIGN bytes, the header is padded with spaces
+ALIGN = 64
+
+# First bytes of the sidecar index file, followed by INDEX_STRUCT entries
+INDEX_MAGIC = b"ESNSRIDX"
+# Entry of record number, sample index, host timestamp, byte offset in capture
+INDEX_STRUCT = struct.Struct("<QqdQ")
+INDEX_DTYPE = [
+    ("record", "<u8"),
+    ("index", "<i8"),
+    ("timestamp", "<f8"),
+    ("offset", "<u8"),
+]
+# Minimum records between index entries
+INDEX_INTERVAL = 1024
+
+# struct format character to little endian numpy type of decoded records
+_NP_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": "<i2",
+    "H": "<u2",
+    "i": "<i4",
+    "I": "<u4",
+    "d": "<f8",
+}
+
+
+class CaptureError(Exception):
+    """Capture file cannot be written or read"""
+
+
+class CaptureWriter:
+    """
+    Appends burst data of a configured SensorDevice() to a binary capture
+    file. The file starts with a JSON header describing the record layout,
+    burst decoder, scale factors, device info and status, followed by
+    fixed size records of either the raw burst frames as received, or
+    decoded fields in little endian with an optional host timestamp.
+    The sidecar index file maps sample index and host timestamp of every
+    INDEX_INTERVAL records to the byte offset in the capture file
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        path of the capture file
+    index_path : str
+        path of the sidecar index file or None
+    header : dict
+        layout header written at the start of the file
+    record_size : int
+        size of one record in bytes
+    records : int
+        number of records written
+    skipped : int
+        number of corrupted samples not written
+
+    Methods
+    -------
+    write(sample, timestamp, index)
+        Append one decoded record of a sample from read_sample()
+
+    write_samples(samples, timestamps, index)
+        Append decoded records of numpy samples from read_samples()
+
+    write_frames(data, index)
+        Append raw burst frames from read_frames()
+
+    flush()
+        Flush buffered records to the file
+
+    close()
+        Flush and close the file
+    """
+
+    def __init__(
+        self,
+        path,
+        sensor,
+        mode="decoded",
+        scaled=True,
+        timestamps=True,
+        start_date=None,
+        index=True,
+    ):
+        """
+        Parameters
+        ----------
+        path : str
+            path of the capture file, an existing file is overwritten
+        sensor : class
+            SensorDevice() object configured by set_config()
+        mode : str
+            "decoded" for records of burst fields, or "raw" for the burst
+            frames including header and delimiter byte as received
+        scaled : bool
+            If True decoded records hold scaled fields as float64,
+            otherwise fields are unscaled integers. Ignored for raw
+        timestamps : bool
+            If True decoded records start with the host timestamp as float64.
+            Ignored for raw
+        start_date : datetime object
+            datetime of capture start, if None then grab current datetime
+        index : bool
+            If True write the sidecar index file to path + ".idx"
+        """
+
+        decoder = sensor.sensor_fn.decoder
+        if decoder is None:
+            logger.error("** Device not configured. Have you run set_config()?")
+            raise CaptureError("Device must be configured before capture")
+        if mode not in ("decoded", "raw"):
+            raise ValueError(f"** Unsupported capture mode specified {mode}")
+
+        self.path = path
+        self._sensor = sensor
+        self._mode = mode
+        self._scaled = scaled and mode == "decoded"
+        self._timestamps = timestamps and mode == "decoded"
+        self._frame_size = decoder.size
+        self.records = 0
+        self.skipped = 0
+        self.index_path = path + ".idx" if index else None
+        self._next_entry = 0
+        self._index_file = None
+        # Host timestamp and sample index of the last record written
+        self._last = (None, -1)
+
+        layout = decoder.layout
+        chars = layout["struct_fmt"].lstrip("<>!=@")
+        if mode == "raw":
+            record_fmt = layout["struct_fmt"]
+            record_dtype = [
+                [f"f{i}", _NP_TYPES[char].replace("<", ">")]
+                for i, char in enumerate(chars)
+            ]
+        else:
+            # Unscaled type of each burst field after merging 24-bit parts
+            if layout["merge"] is None:
+                field_chars = list(chars[1:-1])
+            else:
+                field_chars = [
+                    chars[i] if j is None else "i" for i, j in layout["merge"]
+                ]
+            field_chars = [
+                "d" if self._scaled and conv[0] is not None else char
+                for char, conv in zip(field_chars, layout["conversions"])
+            ]
+            record_dtype = [
+                [field, _NP_TYPES[char]]
+                for field, char in zip(layout["burst_fields"], field_chars)
+            ]
+            if self._timestamps:
+                field_chars.insert(0, "d")
+                record_dtype.insert(0, ["timestamp", "<f8"])
+            record_fmt = "<" + "".join(field_chars)
+        self._struct = struct.Struct(record_fmt)
+        self.record_size = self._struct.size
+
+        mdef = sensor.mdef
+        self.header = {
+            "format": FORMAT_VERSION,
+            "created": (start_date or datetime.datetime.now()).isoformat(),
+            "mode": mode,
+            "scaled": self._scaled,
+            "timestamps": self._timestamps,
+            "record_format": record_fmt,
+            "record_size": self.record_size,
+            "record_dtype": record_dtype,
+            "burst_fields": list(sensor.burst_fields),
+            "decoder": layout,
+            "rate": sensor.sample_clock.rate,
+            "sf": {
+                name: getattr(mdef, name) for name in dir(mdef) if name[:3] == "SF_"
+            },
+            "info": {
+                key: sensor.info.get(key)
+                for key in ("prod_id", "version_id", "serial_id", "if_type", "model")
+            },
+            "status": dict(sensor.status),
+            "burst_out": dict(sensor.burst_out),
+        }
+
+        header = json.dumps(self.header, default=str).encode("utf-8")
+        offset = len(MAGIC) + 4 + len(header)
+        header = header + b" " * (-offset % ALIGN)
+        self._data_offset = offset + (-offset % ALIGN)
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + struct.pack("<I", len(header)) + header)
+        if self.index_path:
+            self._index_file = open(self.index_path, "wb")
+            self._index_file.write(INDEX_MAGIC)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return (
+            f"{cls}(path='{self.path}', sensor={repr(self._sensor)}, "
+            f"mode='{self._mode}', scaled={self._scaled}, "
+            f"timestamps={self._timestamps})"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, sample, timestamp=None, index=None):
+        """Append one decoded record. Corrupted samples are counted
+        in skipped and not written
+
+        Parameters
+        ----------
+        sample : tuple
+            burst fields from read_sample() if scaled,
+            otherwise from read_sample_unscaled()
+        timestamp : float
+            host timestamp of the sample, if None then SensorDevice().timestamp
+        index : int
+            sample index of the sample, if None then the sample index of
+            the last sample read by the device
+        """
+
+        if self._mode != "decoded":
+            logger.error("** write() requires capture mode decoded")
+            raise CaptureError("write() requires capture mode decoded")
+        if not sample:
+            self.skipped = self.skipped + 1
+            return
+        if timestamp is None:
+            timestamp = self._sensor.timestamp
+        if self._timestamps:
+            record = self._struct.pack(
+                float("nan") if timestamp is None else timestamp, *sample
+            )
+        else:
+            record = self._struct.pack(*sample)
+        self._file.write(record)
+        self.records = self.records + 1
+        self._set_last(timestamp, index)
+
+    def write_samples(self, samples, timestamps=None, index=None):
+        """Append decoded records of many samples with numpy
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            structured array from read_samples() with scaled matching
+            the capture
+        timestamps : numpy.ndarray
+            host timestamps of samples, if None then SensorDevice().timestamps
+        index : int
+            sample index of the last sample, if None then the sample index
+            of the last sample read by the device
+
+        Raises
+        -------
+        ImportError
+            When numpy is not installed
+        """
+
+        if np is None:
+            raise ImportError("** numpy is required for write_samples()")
+        if self._mode != "decoded":
+            logger.error("** write_samples() requires capture mode decoded")
+            raise CaptureError("write_samples() requires capture mode decoded")
+        records = np.empty(
+            len(samples), dtype=[tuple(each) for each in self.header["record_dtype"]]
+        )
+        for field in samples.dtype.names:
+            records[field] = samples[field]
+        if timestamps is None:
+            timestamps = self._sensor.timestamps
+        if self._timestamps:
+            records["timestamp"] = np.nan if timestamps is None else timestamps
+        if not len(records):
+            return
+        self._file.write(records.tobytes())
+        self.records = self.records + len(records)
+        self._set_last(None if timestamps is None else float(timestamps[-1]), index)
+
+    def write_frames(self, data, index=None):
+        """Append raw burst frames
+
+        Parameters
+        ----------
+        data : bytes
+            complete burst frames including header and delimiter byte
+            i.e. from read_frames()
+        index : int
+            sample index of the last frame, if None then the sample index
+            of the last sample read by the device
+        """
+
+        if self._mode != "raw":
+            logger.error("** write_frames() requires capture mode raw")
+            raise CaptureError("write_frames() requires capture mode raw")
+        if len(data) % self._frame_size:
+            raise ValueError(
+                f"** Data length {len(data)} is not a multiple of "
+                f"frame size {self._frame_size}"
+            )
+        if not data:
+            return
+        self._file.write(data)
+        self.records = self.records + len(data) // self._frame_size
+        self._set_last(None, index)
+
+    def flush(self):
+        """Flush buffered records to the file"""
+
+        self._file.flush()
+        if self._index_file:
+            self._index_file.flush()
+
+    def close(self):
+        """Flush and close the file"""
+
+        if self._index_file and not self._index_file.closed:
+            # Index the last record so the end of the capture is not extrapolated
+            if self.records and self._next_entry - INDEX_INTERVAL != self.records - 1:
+                self._add_entry()
+            self._index_file.close()
+        if not self._file.closed:
+            self._file.close()
+
+    def _set_last(self, timestamp, index):
+        """Keep host timestamp and sample index of the last record written,
+        and append an index entry if it is due
+
+        Parameters
+        ----------
+        timestamp : float
+            host timestamp of the last record, if None then
+            SensorDevice().timestamp
+        index : int
+            sample index of the last record, if None then
+            the sample index of the last sample read by the device
+        """
+
+        if timestamp is None:
+            timestamp = self._sensor.timestamp
+        if index is None:
+            index = self._sensor.sensor_fn.index
+        self._last = (timestamp, index)
+        if self._index_file and self.records > self._next_entry:
+            self._add_entry()
+
+    def _add_entry(self):
+        """Append index entry of the last record written"""
+
+        timestamp, index = self._last
+        record = self.records - 1
+        self._index_file.write(
+            INDEX_STRUCT.pack(
+                record,
+                index,
+                float("nan") if timestamp is None else timestamp,
+                self._data_offset + record * self.record_size,
+            )
+        )
+        self._next_entry = record + INDEX_INTERVAL
+
+
+class CaptureReader:
+    """
+    Memory-maps a capture file written by CaptureWriter() and exposes the
+    records as a read-only numpy structured array without copying. Records
+    in a range of host time or sample index are found with a binary search
+    of the sidecar index, then of one block of records between two entries,
+    so only the pages of those records are read from disk
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        path of the capture file
+    header : dict
+        layout header written at the start of the file
+    records : numpy.ndarray
+        zero-copy structured array of all complete records
+    entries : numpy.ndarray
+        index entries of record, sample index, timestamp, offset or None
+
+    Methods
+    -------
+    find_time(timestamp)
+        Return record number of the first record at or after timestamp
+
+    find_index(index)
+        Return record number of the first record at or after sample index
+
+    select_time(start, stop)
+        Return records from start up to stop host time
+
+    select_index(start, stop)
+        Return records from start up to stop sample index
+
+    get_timestamps(start, stop)
+        Return host timestamps of records from start up to stop record number
+
+    decode(records, scaled)
+        Return records as numpy structured array of burst fields
+
+    close()
+        Release the memory map
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            path of the capture file, the sidecar index is read from
+            path + ".idx" if it exists
+
+        Raises
+        -------
+        CaptureError
+            When the file is not a capture file
+        ImportError
+            When numpy is not installed
+        """
+
+        if np is None:
+            raise ImportError("** numpy is required for CaptureReader()")
+
+        self.path = path
+        with open(path, "rb") as f:
+            preamble = f.read(len(MAGIC) + 4)
+            if len(preamble) < len(MAGIC) + 4 or preamble[: len(MAGIC)] != MAGIC:
+                logger.error(f"** Not a capture file {path}")
+                raise CaptureError(f"Not a capture file {path}")
+            (header_size,) = struct.unpack("<I", preamble[len(MAGIC) :])
+            self.header = json.loads(f.read(header_size).decode("utf-8"))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data_offset = len(MAGIC) + 4 + header_size
+        dtype = np.dtype([tuple(each) for each in self.header["record_dtype"]])
+        # A capture that is still written or was interrupted may end
+        # with a partial record, which is ignored
+        count = (len(self._mmap) - data_offset) // dtype.itemsize
+        self.records = np.frombuffer(
+            self._mmap, dtype=dtype, count=count, offset=data_offset
+        )
+        self._has_timestamps = "timestamp" in dtype.names
+        self._rate = self.header.get("rate") or 1.0
+        self._decoder = None
+
+        self.entries = None
+        index_path = path + ".idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                if f.read(len(INDEX_MAGIC)) == INDEX_MAGIC:
+                    data = f.read()
+                    # Ignore a partial entry of a capture that is still written
+                    entries = np.frombuffer(
+                        data[: len(data) - len(data) % INDEX_STRUCT.size],
+                        dtype=INDEX_DTYPE,
+                    )
+                    self.entries = entries[
+                        (entries["record"] < count) & ~np.isnan(entries["timestamp"])
+                    ]
+        elif self._has_timestamps and count:
+            # Without sidecar index assume no lost samples
+            records = np.unique(
+                np.append(np.arange(0, count, INDEX_INTERVAL), count - 1)
+            )
+            self.entries = np.empty(len(records), dtype=INDEX_DTYPE)
+            self.entries["record"] = records
+            self.entries["index"] = records
+            self.entries["timestamp"] = self.records["timestamp"][records]
+            self.entries["offset"] = data_offset + records * dtype.itemsize
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(path='{self.path}')"
+
+    def __len__(self):
+        return len(self.records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def find_time(self, timestamp):
+        """Return record number of the first record at or after timestamp.
+        Without host timestamps in the records, the record number is
+        interpolated between index entries at the output rate
+
+        Parameters
+        ----------
+        timestamp : float or datetime object
+            host time in seconds since the epoch
+
+        Returns
+        -------
+        int
+            record number, len() if all records are before timestamp
+
+        Raises
+        -------
+        CaptureError
+            When the records have no host timestamps and there is no
+            sidecar index, so there is no host time to search
+        """
+
+        if isinstance(timestamp, datetime.datetime):
+            timestamp = timestamp.timestamp()
+        if self._has_timestamps:
+            lo, hi = self._get_block("timestamp", timestamp)
+            column = self.records["timestamp"][lo:hi]
+            return lo + int(np.searchsorted(column, timestamp, side="left"))
+        return self._interp("timestamp", timestamp, self._rate)
+
+    def find_index(self, index):
+        """Return record number of the first record at or after sample index.
+        With the counter in the burst fields, the sample index of each record
+        in the block between the index entries is unwrapped from the counter,
+        so the result is exact across lost samples. Without the counter the
+        record number is interpolated between index entries, which is only
+        exact when no samples are lost between two entries. Without the
+        sidecar index, the first record is sample index 0 and the records
+        are scanned from the start
+
+        Parameters
+        ----------
+        index : int
+            sample index counted by the device from entering SAMPLING mode
+
+        Returns
+        -------
+        int
+            record number, len() if all records are before index
+        """
+
+        if self.entries is None or not len(self.entries):
+            return self._scan_index(index)
+        if "counter" not in self.header["burst_fields"]:
+            return self._interp("index", index, 1.0)
+        entries = self._get_entries()
+        values = entries["index"]
+        pos = int(np.searchsorted(values, index, side="left"))
+        if pos == len(values):
+            # After the last entry, unwrap forward from the last entry
+            lo, hi = int(entries["record"][-1]), len(self)
+            indexes = self._get_indexes(lo, hi, values[-1], None)
+        elif pos == 0:
+            # Before the first entry, unwrap backward from the first entry
+            lo, hi = 0, int(entries["record"][0]) + 1
+            indexes = self._get_indexes(lo, hi, None, values[0])
+        else:
+            lo, hi = int(entries["record"][pos - 1]), int(entries["record"][pos]) + 1
+            indexes = self._get_indexes(lo, hi, values[pos - 1], values[pos])
+        if indexes is None:
+            return self._interp("index", index, 1.0)
+        return lo + int(np.searchsorted(indexes, index, side="left"))
+
+    def select_time(self, start, stop):
+        """Return records from start up to, but not including, stop host time
+
+        Parameters
+        ----------
+        start : float or datetime object
+            host time in seconds since the epoch
+        stop : float or datetime object
+            host time in seconds since the epoch
+
+        Returns
+        -------
+        numpy.ndarray
+            zero-copy structured array of the records
+
+        Raises
+        -------
+        CaptureError
+            When the records have no host timestamps and there is no
+            sidecar index
+        """
+
+        return self.records[self.find_time(start) : self.find_time(stop)]
+
+    def select_index(self, start, stop):
+        """Return records from start up to, but not including, stop sample index
+
+        Parameters
+        ----------
+        start : int
+            sample index
+        stop : int
+            sample index
+
+        Returns
+        -------
+        numpy.ndarray
+            zero-copy structured array of the records
+        """
+
+        return self.records[self.find_index(start) : self.find_index(stop)]
+
+    def get_timestamps(self, start=0, stop=None):
+        """Return host timestamps of records from start up to stop record
+        number, interpolated between index entries at the output rate
+        without host timestamps in the records
+
+        Parameters
+        ----------
+        start : int
+            record number
+        stop : int
+            record number, if None then len()
+
+        Returns
+        -------
+        numpy.ndarray
+            host timestamps in seconds since the epoch
+
+        Raises
+        -------
+        CaptureError
+            When the records have no host timestamps and there is no
+            sidecar index
+        """
+
+        stop = len(self) if stop is None else stop
+        if self._has_timestamps:
+            return self.records["timestamp"][start:stop]
+        entries = self._get_entries()
+        records = np.arange(start, stop)
+        timestamps = np.interp(records, entries["record"], entries["timestamp"])
+        # Extrapolate at the output rate before the first and after the last entry
+        first = entries[0]
+        before = records < first["record"]
+        timestamps[before] = (
+            first["timestamp"] - (first["record"] - records[before]) / self._rate
+        )
+        last = entries[-1]
+        after = records > last["record"]
+        timestamps[after] = (
+            last["timestamp"] + (records[after] - last["record"]) / self._rate
+        )
+        return timestamps
+
+    def decode(self, records=None, scaled=True):
+        """Return records as numpy structured array of burst fields. Raw
+        frames are decoded with the BurstDecoder() layout of the header,
+        decoded records are returned as stored without the timestamp
+
+        Parameters
+        ----------
+        records : numpy.ndarray
+            records i.e. from select_time(), if None then all records
+        scaled : bool
+            If True apply per-field scale factor to raw frames
+
+        Returns
+        -------
+        numpy.ndarray
+            structured array with one row per record named by burst fields
+        """
+
+        records = self.records if records is None else records
+        if self.header["mode"] != "raw":
+            return records[self.header["burst_fields"]]
+        if self._decoder is None:
+            self._decoder = burst_decoder.BurstDecoder(**self.header["decoder"])
+        return self._decoder.decode_array(np.ascontiguousarray(records), scaled)
+
+    def close(self):
+        """Release the memory map. Arrays returned by the reader must be
+        deleted first, otherwise the map is released when they are"""
+
+        self.records = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def _get_entries(self):
+        """Return index entries or raise CaptureError if there are none"""
+
+        if self.entries is None or not len(self.entries):
+            logger.error(f"** No index for {self.path}")
+            raise CaptureError(f"No index for {self.path}")
+        return self.entries
+
+    def _get_block(self, column, value):
+        """Return record number range between the index entries before
+        and at or after value"""
+
+        if self.entries is None or not len(self.entries):
+            return 0, len(self)
+        values = self.entries[column]
+        pos = int(np.searchsorted(values, value, side="left"))
+        lo = int(self.entries["record"][pos - 1]) if pos else 0
+        hi = int(self.entries["record"][pos]) + 1 if pos < len(values) else len(self)
+        return lo, hi
+
+    def _get_indexes(self, lo, hi, first, last):
+        """Return sample index of records from lo up to hi record number
+        unwrapped from the counter, where first and last are the sample
+        index of the records lo and hi - 1 from the index entries, one of
+        them may be None. Return None if the counter cannot be unwrapped"""
+
+        counts = self.decode(self.records[lo:hi], scaled=False)["counter"]
+        if len(counts) != hi - lo:
+            # Malformed raw frames were dropped by the decoder
+            return None
+        modulo = counter_tracker.CounterTracker.MODULO
+        deltas = np.diff(counts.astype(np.int64)) % modulo
+        positive = deltas[deltas > 0]
+        if first is not None and last is not None and last > first:
+            # Counter increment per sample from the span of the block
+            step = int(positive.sum()) // int(last - first)
+        elif len(positive):
+            # Counter increment is the smallest increment seen
+            step = int(positive.min())
+        else:
+            step = 0
+        if step <= 0:
+            periods = np.zeros(len(deltas), dtype=np.int64)
+        else:
+            periods = np.maximum(deltas // step, 1)
+            periods[deltas == 0] = 0
+        offsets = np.concatenate(([0], np.cumsum(periods)))
+        if first is not None:
+            return int(first) + offsets
+        return int(last) - offsets[-1] + offsets
+
+    def _scan_index(self, index):
+        """Return record number of sample index without index entries,
+        unwrapped from the counter of all records starting at sample
+        index 0, otherwise assuming no lost samples"""
+
+        if len(self) and "counter" in self.header["burst_fields"]:
+            indexes = self._get_indexes(0, len(self), 0, None)
+            if indexes is not None:
+                return int(np.searchsorted(indexes, index, side="left"))
+        return min(max(int(index), 0), len(self))
+
+    def _interp(self, column, value, slope):
+        """Return record number of value interpolated between index entries,
+        slope is records per unit of value outside the entries"""
+
+        entries = self._get_entries()
+        values = entries[column]
+        records = entries["record"]
+        if value <= values[0]:
+            record = records[0] - (values[0] - value) * slope
+        elif value >= values[-1]:
+            record = records[-1] + (value - values[-1]) * slope
+        else:
+            record = np.interp(value, values, records)
+        return min(max(math.ceil(record - 1e-6), 0), len(self))
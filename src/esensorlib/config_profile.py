@@ -0,0 +1,560 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Configuration Profile class for validating set_config() parameters
+against the model definitions and compiling them to register images
+without a device
+Contains:
+- ProfileError() class
+- RegisterImage() class
+- ConfigProfile() class
+- load_profiles() function
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from types import MappingProxyType
+
+from loguru import logger
+from tabulate import tabulate
+
+from esensorlib import accl_fn, imu_fn, reg_interface, sim_port, vib_fn
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# set_config() parameters accepted in a profile per device family
+PROFILE_KEYS = {
+    "imu": (
+        "dout_rate",
+        "filter_sel",
+        "ndflags",
+        "tempc",
+        "counter",
+        "chksm",
+        "auto_start",
+        "uart_auto",
+        "is_32bit",
+        "a_range",
+        "ext_trigger",
+        "gpio",
+        "dlta",
+        "dltv",
+        "dlta_sf_range",
+        "dltv_sf_range",
+        "atti",
+        "atti_mode",
+        "atti_conv",
+        "atti_profile",
+        "qtn",
+        "rounding",
+    ),
+    "accl": (
+        "dout_rate",
+        "filter_sel",
+        "ndflags",
+        "tempc",
+        "counter",
+        "chksm",
+        "auto_start",
+        "uart_auto",
+        "ext_trigger",
+        "drdy_pol",
+        "tilt",
+        "reduced_noise",
+        "temp_stabil",
+        "rounding",
+    ),
+    "vib": (
+        "output_sel",
+        "dout_rate_rmspp",
+        "update_rate_rmspp",
+        "ndflags",
+        "tempc",
+        "is_tempc16",
+        "counter",
+        "chksm",
+        "auto_start",
+        "uart_auto",
+        "ext_pol",
+        "drdy_pol",
+        "sensx",
+        "sensy",
+        "sensz",
+        "rounding",
+    ),
+}
+
+# set_config() parameters that need a feature in HAS_FEATURE when enabled
+FEATURE_KEYS = {
+    "imu": {
+        "dlta": "DLT_OUTPUT",
+        "dltv": "DLT_OUTPUT",
+        "atti": "ATTI_OUTPUT",
+        "qtn": "ATTI_OUTPUT",
+        "a_range": "A_RANGE",
+        "ext_trigger": "EXT_PIN",
+    },
+    "accl": {
+        "tilt": "TILT_OUTPUT",
+        "reduced_noise": "REDUCED_NOISE",
+        "temp_stabil": "TEMP_STBIL",
+        "ext_trigger": "EXT_PIN",
+    },
+    "vib": {
+        "ext_pol": "EXT_PIN",
+    },
+}
+
+_FN_CLASSES = {
+    "imu": imu_fn.ImuFn,
+    "accl": accl_fn.AcclFn,
+    "vib": vib_fn.VibFn,
+}
+
+
+class ProfileError(Exception):
+    """Profile is not valid for the device model"""
+
+
+class RegisterImage:
+    """
+    Register bytes set by a ConfigProfile() for one product ID.
+    Each register byte has a mask of the bits set by the profile, the
+    other bits keep the value read from the device when applied
+
+    ...
+
+    Attributes
+    ----------
+    prod_id : str
+        product ID the image is compiled for
+    cfg : MappingProxyType
+        validated set_config() parameters
+    status : MappingProxyType
+        device status after applying the image
+    writes : tuple
+        (winnum, regaddr, mask, value) per register byte in order of writing
+    regs : tuple
+        (winnum, regaddr) of the 16-bit registers to read before applying
+
+    Methods
+    -------
+    get_changes(current, write_all)
+        Return register bytes to write to a device with current registers
+    """
+
+    def __init__(self, prod_id, cfg, status, writes):
+        """
+        Parameters
+        ----------
+        prod_id : str
+            product ID the image is compiled for
+        cfg : dict
+            validated set_config() parameters
+        status : dict
+            device status after applying the image
+        writes : list
+            (winnum, regaddr, mask, value) per register byte
+        """
+
+        self.prod_id = prod_id
+        self.cfg = MappingProxyType(dict(cfg))
+        self.status = MappingProxyType(dict(status))
+        self.writes = tuple(writes)
+        self.regs = tuple(
+            dict.fromkeys((winnum, regaddr & 0xFE) for winnum, regaddr, _, _ in writes)
+        )
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(prod_id='{self.prod_id}', writes={len(self.writes)})"
+
+    def __len__(self):
+        return len(self.writes)
+
+    def get_changes(self, current, write_all=False):
+        """Merge the image with the current registers of a device
+
+        Parameters
+        ----------
+        current : dict
+            (winnum, regaddr) to 16-bit register value for each of regs
+        write_all : bool
+            If True return every register byte of the image
+
+        Returns
+        -------
+        list
+            (winnum, regaddr, write_byte) tuples that differ from current
+        """
+
+        changes = []
+        for winnum, regaddr, mask, value in self.writes:
+            shift = 8 if regaddr & 0x01 else 0
+            current_byte = (current[(winnum, regaddr & 0xFE)] >> shift) & 0xFF
+            write_byte = (current_byte & ~mask & 0xFF) | value
+            if write_all or write_byte != current_byte:
+                changes.append((winnum, regaddr, write_byte))
+        return changes
+
+
+class ConfigProfile:
+    """
+    Named set of set_config() parameters that is validated against the
+    DOUT_RATE, FILTER_SEL, MAP_DOUT_FILTER and HAS_FEATURE tables of the
+    model definitions, and compiled to a RegisterImage() per product ID
+    without a device. Compiled images are cached
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        profile name
+    cfg : MappingProxyType
+        set_config() parameters of the profile
+
+    Methods
+    -------
+    get_problems(prod_id)
+        Return list of reasons the profile is not valid for the model
+    validate(prod_id)
+        Return validated set_config() parameters for the model
+    compile(prod_id)
+        Return RegisterImage() of the profile for the model
+    """
+
+    def __init__(self, cfg, name="profile"):
+        """
+        Parameters
+        ----------
+        cfg : dict
+            set_config() keyword arguments
+        name : str
+            profile name used in messages
+        """
+
+        self.name = name
+        self.cfg = MappingProxyType(dict(cfg))
+        self._images = {}
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(cfg={dict(self.cfg)}, name='{self.name}')"
+
+    def get_problems(self, prod_id):
+        """Check the profile against the model definitions of prod_id
+
+        Parameters
+        ----------
+        prod_id : str
+            product ID of device model i.e. G370PDF1, A352AD10, A342VD10
+
+        Returns
+        -------
+        list
+            reasons the profile is not valid, empty if valid
+        """
+
+        _, problems = self._check(prod_id.upper())
+        return problems
+
+    def validate(self, prod_id):
+        """Check the profile against the model definitions of prod_id and
+        return set_config() parameters with FILTER_SEL in upper case, and
+        for IMU the FILTER_SEL from MAP_DOUT_FILTER when not specified
+
+        Parameters
+        ----------
+        prod_id : str
+            product ID of device model i.e. G370PDF1, A352AD10, A342VD10
+
+        Returns
+        -------
+        dict
+            validated set_config() parameters
+
+        Raises
+        -------
+        ProfileError
+            When the profile is not valid for the model
+        """
+
+        cfg, problems = self._check(prod_id.upper())
+        if problems:
+            for problem in problems:
+                logger.error(f"** {self.name} ({prod_id}): {problem}")
+            raise ProfileError(
+                f"{self.name} is not valid for {prod_id}: " + "; ".join(problems)
+            )
+        return cfg
+
+    def compile(self, prod_id):
+        """Validate and compile the profile to a register image by staging
+        set_config() on a SimulatedDevice() twice, with configuration
+        registers preset to all 0s and all 1s. Bits that differ between the
+        two are kept from the device when applied, other bits are set by
+        the profile
+
+        Parameters
+        ----------
+        prod_id : str
+            product ID of device model i.e. G370PDF1, A352AD10, A342VD10
+
+        Returns
+        -------
+        RegisterImage
+            register image of the profile for prod_id
+
+        Raises
+        -------
+        ProfileError
+            When the profile is not valid for the model
+        """
+
+        prod_id = prod_id.upper()
+        if prod_id in self._images:
+            return self._images[prod_id]
+
+        cfg = self.validate(prod_id)
+        writes_0, status = self._stage(prod_id, cfg, 0x0000)
+        writes_1, _ = self._stage(prod_id, cfg, 0xFFFF)
+        if [write[:2] for write in writes_0] != [write[:2] for write in writes_1]:
+            logger.error(f"** {self.name} ({prod_id}): writes depend on registers")
+            raise ProfileError(f"{self.name} cannot be compiled for {prod_id}")
+
+        writes = []
+        for (winnum, regaddr, byte_0), (_, _, byte_1) in zip(writes_0, writes_1):
+            mask = ~(byte_0 ^ byte_1) & 0xFF
+            writes.append((winnum, regaddr, mask, byte_0 & mask))
+        image = RegisterImage(prod_id, cfg, status, writes)
+        self._images[prod_id] = image
+        return image
+
+    def _check(self, prod_id):
+        """Return validated set_config() parameters and list of problems"""
+
+        cfg = dict(self.cfg)
+        try:
+            family = sim_port.SimulatedDevice.get_family(prod_id)
+            mdef = sim_port.SimulatedDevice.get_model_definitions(prod_id)
+        except IOError:
+            return cfg, [f"Unknown device model {prod_id}"]
+
+        problems = [
+            f"Unknown parameter {key}" for key in cfg if key not in PROFILE_KEYS[family]
+        ]
+        for key, feature in FEATURE_KEYS[family].items():
+            value = cfg.get(key, False)
+            if value and str(value).upper() != "DISABLED":
+                if not mdef.HAS_FEATURE.get(feature):
+                    problems.append(f"{key} needs {feature}, not supported")
+        if family == "imu" and cfg.get("counter") == "reset":
+            if not mdef.HAS_FEATURE.get("EXT_PIN"):
+                problems.append("counter reset needs EXT_PIN, not supported")
+
+        if family == "vib":
+            output_sel = cfg.get("output_sel")
+            if output_sel is not None and output_sel not in mdef.OUTPUT_SEL:
+                problems.append(f"Invalid OUTPUT_SEL {output_sel}")
+            if not 1 <= cfg.get("dout_rate_rmspp", 1) <= 255:
+                problems.append("DOUT_RATE_RMSPP must be 1 ~ 255")
+            if not 0 <= cfg.get("update_rate_rmspp", 4) <= 15:
+                problems.append("UPDATE_RATE_RMSPP must be 0 ~ 15")
+            return cfg, problems
+
+        if family == "accl":
+            ext_trigger = cfg.get("ext_trigger", "DISABLED")
+            if str(ext_trigger).upper() not in mdef.EXT_SEL:
+                problems.append(f"Invalid EXT_SEL {ext_trigger}")
+
+        dout_rate = cfg.get("dout_rate", 200)
+        if dout_rate not in mdef.DOUT_RATE:
+            problems.append(f"Invalid DOUT_RATE {dout_rate}")
+            return cfg, problems
+
+        map_filter = getattr(mdef, "MAP_DOUT_FILTER", {})
+        if cfg.get("filter_sel") is None:
+            if family != "imu":
+                return cfg, problems
+            if dout_rate not in map_filter:
+                problems.append(f"No default FILTER_SEL for DOUT_RATE {dout_rate}")
+                return cfg, problems
+            cfg["filter_sel"] = map_filter[dout_rate]
+        cfg["filter_sel"] = str(cfg["filter_sel"]).upper()
+
+        # For G370PDF1 & G370PDS0, filter setting is non-standard
+        # when DOUT_RATE 2000, 400, or 80sps
+        filter_sel = mdef.FILTER_SEL
+        if prod_id in ("G370PDF1", "G370PDS0") and dout_rate in (2000, 400, 80):
+            filter_sel = mdef.FILTER_SEL_2K_400_80
+        if cfg["filter_sel"] not in filter_sel:
+            problems.append(
+                f"Invalid FILTER_SEL {cfg['filter_sel']} for DOUT_RATE {dout_rate}"
+            )
+        return cfg, problems
+
+    def _stage(self, prod_id, cfg, preset):
+        """Return register writes and status of set_config(**cfg) staged on
+        a SimulatedDevice() with configuration registers set to preset"""
+
+        # Discard messages printed by the port and configuration functions
+        with contextlib.redirect_stdout(io.StringIO()):
+            port = sim_port.SimulatedPort(prod_id)
+            try:
+                device = port.device
+                fn = _FN_CLASSES[device.family](
+                    reg_interface.RegInterface(port),
+                    device.mdef,
+                    {"prod_id": prod_id, "version_id": None, "serial_id": None},
+                )
+                for name in fn.CONFIG_REGS:
+                    if name in fn.reg.__members__:
+                        reg = getattr(fn.reg, name)
+                        device.regs[(reg.WINID, reg.ADDR & 0xFE)] = preset
+                writes = fn.stage_config(**cfg)
+            except Exception as err:
+                logger.error(f"** {self.name} ({prod_id}): {type(err).__name__} {err}")
+                raise ProfileError(
+                    f"{self.name} cannot be compiled for {prod_id}"
+                ) from err
+            finally:
+                port.close(verbose=False)
+        status = dict(fn.status)
+        del status["is_config"]
+        return writes, status
+
+
+def load_profiles(path):
+    """Load profiles from a JSON or TOML file. The file contains one
+    profile of set_config() parameters named by the file name, or
+    tables of set_config() parameters named by profile name
+
+    Parameters
+    ----------
+    path : str
+        path of .json or .toml file
+
+    Returns
+    -------
+    dict
+        profile name to ConfigProfile()
+
+    Raises
+    -------
+    ImportError
+        When loading TOML before Python 3.11
+    ProfileError
+        When the file does not contain profiles
+    """
+
+    if path.lower().endswith(".toml"):
+        if tomllib is None:
+            raise ImportError("** Python 3.11 or later is required for TOML profiles")
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    if not isinstance(data, dict) or not data:
+        logger.error(f"** No profiles found in {path}")
+        raise ProfileError(f"No profiles found in {path}")
+    if all(isinstance(value, dict) for value in data.values()):
+        return {name: ConfigProfile(cfg, name) for name, cfg in data.items()}
+    name = os.path.splitext(os.path.basename(path))[0]
+    return {name: ConfigProfile(data, name)}
+
+
+def get_args():
+    """
+    returns parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="This program validates profiles of set_config() "
+        "parameters against the model definitions and compiles them to "
+        "register images without a device."
+    )
+
+    parser.add_argument(
+        "profiles",
+        help="specifies a JSON or TOML file of profiles.",
+        type=str,
+    )
+    parser.add_argument(
+        "-m",
+        "--models",
+        help="specifies the product IDs to validate against i.e. G370PDF1 A352AD10.",
+        type=str,
+        nargs="+",
+        required=True,
+    )
+    parser.add_argument(
+        "--verbose",
+        help="specifies to print the register bytes of each image.",
+        action="store_true",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    try:
+        profiles = load_profiles(args.profiles)
+    except (OSError, ValueError, ImportError, ProfileError) as err:
+        logger.error(f"** Unable to read profiles: {err}")
+        sys.exit(1)
+
+    rows = []
+    for profile in profiles.values():
+        for model in args.models:
+            try:
+                image = profile.compile(model)
+            except ProfileError as err:
+                rows.append([profile.name, model.upper(), "INVALID", None, str(err)])
+                continue
+            rows.append([profile.name, model.upper(), "OK", len(image), ""])
+            if args.verbose:
+                for winnum, regaddr, mask, value in image.writes:
+                    print(
+                        f"{profile.name} {image.prod_id}: "
+                        f"REG[0x{regaddr:02X}, W({winnum:X})] "
+                        f"mask 0x{mask:02X} <- 0x{value:02X}"
+                    )
+    print(
+        tabulate(
+            rows,
+            headers=["profile", "model", "result", "writes", "error"],
+            missingval="-",
+        )
+    )
+    sys.exit(0 if all(row[2] == "OK" for row in rows) else 1)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Counter Tracker class for detecting lost and duplicate samples
+from the burst sample counter
+Contains:
+- CounterTracker() class
+"""
+
+from collections import deque
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CounterTracker:
+    """
+    Unwraps the 16-bit sample counter of burst data into a monotonically
+    increasing sample index and counts lost and duplicate samples.
+    Typically, created by AcclFn(), ImuFn(), or VibFn() when the burst
+    configuration includes the sample counter, and reset each time
+    the device enters SAMPLING mode
+
+    ...
+
+    Attributes
+    ----------
+    index : int
+        sample index of the last sample, starts at 0 for the first sample
+    step : int
+        counter increment per sample, detected from the smallest increment
+    stats : MappingProxyType
+        samples, lost, duplicates, gaps, longest_gap and loss_rate
+    loss_history : tuple
+        (first sample index, samples, lost) per bin of bin_size sample index
+
+    Methods
+    -------
+    reset()
+        Clear counters to start a new session
+
+    update(count)
+        Return sample index of a single counter value
+
+    update_array(counts)
+        Return numpy array of sample index of many counter values
+    """
+
+    # Range of the 16-bit burst counter
+    MODULO = 0x10000
+
+    def __init__(self, bin_size=1000, history=3600):
+        """
+        Parameters
+        ----------
+        bin_size : int
+            number of sample index per bin of loss_history,
+            typically the output rate for 1 second bins
+        history : int
+            maximum number of bins kept in loss_history
+        """
+
+        self._bin_size = max(int(bin_size), 1)
+        self._bins = deque(maxlen=history)
+        self.reset()
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(bin_size={self._bin_size}, history={self._bins.maxlen})"
+
+    @property
+    def index(self):
+        """property for sample index of the last sample"""
+        return self._index
+
+    @property
+    def step(self):
+        """property for counter increment per sample"""
+        return self._step
+
+    @property
+    def stats(self):
+        """property for session counters as MappingProxyType"""
+        expected = self._stats["samples"] + self._stats["lost"]
+        return MappingProxyType(
+            dict(
+                self._stats,
+                loss_rate=self._stats["lost"] / expected if expected else 0.0,
+            )
+        )
+
+    @property
+    def loss_history(self):
+        """property for (first sample index, samples, lost) per bin"""
+        return tuple(tuple(each) for each in self._bins)
+
+    def reset(self):
+        """Clear counters to start a new session"""
+
+        self._last = None
+        self._index = -1
+        self._step = None
+        self._stats = {
+            "samples": 0,
+            "lost": 0,
+            "duplicates": 0,
+            "gaps": 0,
+            "longest_gap": 0,
+        }
+        self._bins.clear()
+
+    def update(self, count):
+        """Unwrap counter value of the next sample
+
+        Parameters
+        ----------
+        count : int
+            16-bit counter value from burst data
+
+        Returns
+        -------
+        int
+            sample index, a duplicate returns the index of the previous sample
+        """
+
+        stats = self._stats
+        if self._last is None:
+            self._last = count
+            self._index = 0
+            stats["samples"] = stats["samples"] + 1
+            self._add_bin(0, 1, 0)
+            return 0
+
+        delta = (count - self._last) % self.MODULO
+        self._last = count
+        if delta == 0:
+            stats["duplicates"] = stats["duplicates"] + 1
+            return self._index
+
+        # Counter increment is the smallest increment seen, a gap
+        # before the first regular increment is counted as one sample
+        if self._step is None or delta < self._step:
+            self._step = delta
+        periods = max(delta // self._step, 1)
+        self._index = self._index + periods
+        stats["samples"] = stats["samples"] + 1
+        missing = periods - 1
+        if missing:
+            stats["lost"] = stats["lost"] + missing
+            stats["gaps"] = stats["gaps"] + 1
+            if missing > stats["longest_gap"]:
+                stats["longest_gap"] = missing
+        self._add_bin(self._index, 1, missing)
+        return self._index
+
+    def update_array(self, counts):
+        """Unwrap counter values of many samples with numpy
+
+        Parameters
+        ----------
+        counts : numpy.ndarray
+            16-bit counter values from burst data in order received
+
+        Returns
+        -------
+        numpy.ndarray
+            int64 sample index per counter value
+
+        Raises
+        -------
+        ImportError
+            When numpy is not installed
+        """
+
+        if np is None:
+            raise ImportError("** numpy is required for update_array()")
+        counts = np.asarray(counts, dtype=np.int64)
+        if len(counts) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Start the session and learn the step with the scalar method
+        # so that the vectorized path has a previous counter and step
+        head = 0
+        indexes = []
+        while head < len(counts) and (self._last is None or self._step is None):
+            indexes.append(self.update(int(counts[head])))
+            head = head + 1
+        counts = counts[head:]
+        if len(counts) == 0:
+            return np.array(indexes, dtype=np.int64)
+
+        stats = self._stats
+        deltas = np.diff(counts, prepend=self._last) % self.MODULO
+        is_dup = deltas == 0
+        positive = deltas[~is_dup]
+        if len(positive) and positive.min() < self._step:
+            self._step = int(positive.min())
+        periods = np.maximum(deltas // self._step, 1)
+        periods[is_dup] = 0
+        missing = np.maximum(periods - 1, 0)
+        index = self._index + np.cumsum(periods)
+
+        nsamples = len(counts) - int(is_dup.sum())
+        stats["samples"] = stats["samples"] + nsamples
+        stats["duplicates"] = stats["duplicates"] + int(is_dup.sum())
+        if missing.any():
+            stats["lost"] = stats["lost"] + int(missing.sum())
+            stats["gaps"] = stats["gaps"] + int(np.count_nonzero(missing))
+            stats["longest_gap"] = max(stats["longest_gap"], int(missing.max()))
+
+        # Accumulate samples and lost samples per bin of sample index
+        is_new = ~is_dup
+        bins = index[is_new] // self._bin_size
+        if len(bins):
+            first, inverse = np.unique(bins, return_inverse=True)
+            received = np.bincount(inverse)
+            lost = np.bincount(inverse, weights=missing[is_new])
+            for each, nrecv, nlost in zip(first, received, lost):
+                self._add_bin(int(each) * self._bin_size, int(nrecv), int(nlost))
+
+        self._last = int(counts[-1])
+        self._index = int(index[-1])
+        if indexes:
+            return np.concatenate((np.array(indexes, dtype=np.int64), index))
+        return index
+
+    def _add_bin(self, index, samples, lost):
+        """Add samples and lost samples to the loss_history bin of index
+
+        Parameters
+        ----------
+        index : int
+            sample index
+        samples : int
+            number of samples received
+        lost : int
+            number of samples lost
+        """
+
+        start = index - index % self._bin_size
+        if self._bins and self._bins[-1][0] == start:
+            self._bins[-1][1] = self._bins[-1][1] + samples
+            self._bins[-1][2] = self._bins[-1][2] + lost
+        else:
+            self._bins.append([start, samples, lost])
@@ -9,4 +9,7 @@ accl_logger.py is intended for accelerometers
 imu_logger.py is intended for IMUs
 vib_logger.py is intended for vibration sensors
 helper.py provides common utility functions for the logger script
+async_writer.py writes CSV rows of the helper on a background thread
+rotation.py splits logger files into segments and compresses closed segments
+capture_converter.py converts binary capture files to CSV or numpy files
 """
@@ -0,0 +1,386 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asynchronous CSV writer class that writes rows on a background thread
+so that slow storage does not stall reading sensor data
+Contains:
+- WriterError() class
+- AsyncCsvWriter() class
+"""
+
+import csv
+import io
+import os
+import queue
+import threading
+import time
+from types import MappingProxyType
+
+from loguru import logger
+
+
+class WriterError(Exception):
+    """Background writer thread failed to write to the file"""
+
+
+class AsyncCsvWriter:
+    """
+    Drop-in replacement of csv.writer() for LoggerHelper(). Rows are
+    stored in preallocated blocks by writerow() and full blocks are
+    handed to a background thread which formats them and writes them to
+    the file, so that writerow() never waits on the file system. A
+    partial block is handed over when it is older than flush_interval.
+    The file is flushed when flush_bytes have been written or
+    flush_interval has passed since the last flush. Blocks are recycled
+    after writing, and a new block is allocated instead of waiting when
+    all blocks are queued during a disk stall
+
+    ...
+
+    Attributes
+    ----------
+    stats : MappingProxyType
+        rows, blocks, bytes written, flushes, blocks allocated, current and
+        maximum queue depth in blocks, and last, max, and mean write
+        latency in seconds of a block including flush
+    queue_depth : int
+        number of blocks waiting to be written
+    is_running : bool
+        True while the writer thread is alive
+
+    Methods
+    -------
+    writerow(row)
+        Store row in the current block
+
+    writerows(rows)
+        Store rows in the current block
+
+    flush()
+        Hand over the current block and wait until all rows are written
+        and flushed
+
+    close()
+        Write remaining rows, stop writer thread, and close file if owned
+
+    get_bytes()
+        Return estimated size of all rows including rows not yet written
+    """
+
+    # Rows per block
+    BLOCK_ROWS = 1024
+    # Blocks preallocated
+    BLOCKS = 8
+    # Maximum seconds before rows are handed over and the file is flushed
+    FLUSH_INTERVAL_S = 1.0
+    # Bytes written before the file is flushed
+    FLUSH_BYTES = 1 << 20
+
+    def __init__(
+        self,
+        file,
+        close_file=True,
+        block_rows=None,
+        blocks=None,
+        flush_interval=None,
+        flush_bytes=None,
+        fsync=False,
+    ):
+        """
+        Parameters
+        ----------
+        file : file object
+            text file opened with newline="" to write rows to
+        close_file : bool
+            If True close the file in close()
+        block_rows : int
+            rows per block, None for BLOCK_ROWS
+        blocks : int
+            blocks preallocated, None for BLOCKS
+        flush_interval : float
+            maximum seconds before rows are handed over and the file is
+            flushed, None for FLUSH_INTERVAL_S
+        flush_bytes : int
+            bytes written before the file is flushed, None for FLUSH_BYTES
+        fsync : bool
+            If True also call os.fsync() when the file is flushed so that
+            rows are on the storage device and not only in the OS cache
+        """
+
+        self._file = file
+        self._close_file = close_file
+        self._block_rows = block_rows or self.BLOCK_ROWS
+        self._flush_interval = flush_interval or self.FLUSH_INTERVAL_S
+        self._flush_bytes = flush_bytes or self.FLUSH_BYTES
+        self._fsync = fsync
+
+        self._free = queue.SimpleQueue()
+        for _ in range(blocks or self.BLOCKS):
+            self._free.put([None] * self._block_rows)
+        self._queue = queue.Queue()
+        self._block = self._free.get()
+        self._count = 0
+        # Rows handed to the writer thread
+        self._submitted = 0
+        self._t_block = time.perf_counter()
+        self._error = None
+        self._stats = {
+            "rows": 0,
+            "blocks": 0,
+            "bytes": 0,
+            "flushes": 0,
+            "allocated": blocks or self.BLOCKS,
+            "queue_depth": 0,
+            "max_depth": 0,
+            "latency_last": None,
+            "latency_max": None,
+            "latency_mean": None,
+        }
+        self._thread = threading.Thread(
+            target=self._run, name="AsyncCsvWriter", daemon=True
+        )
+        self._thread.start()
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(file={getattr(self._file, 'name', self._file)!r}, ",
+                f"block_rows={self._block_rows}, ",
+                f"flush_interval={self._flush_interval}, ",
+                f"flush_bytes={self._flush_bytes})",
+            ]
+        )
+        return string_val
+
+    @property
+    def stats(self):
+        """property for writer counters and write latency as MappingProxyType"""
+        return MappingProxyType(dict(self._stats, queue_depth=self._queue.qsize()))
+
+    @property
+    def queue_depth(self):
+        """property for number of blocks waiting to be written"""
+        return self._queue.qsize()
+
+    @property
+    def is_running(self):
+        """property for writer thread alive"""
+        return self._thread.is_alive()
+
+    def writerow(self, row):
+        """Store row in the current block, the block is handed to the
+        writer thread when full or older than flush_interval
+
+        Parameters
+        ----------
+        row : list or tuple
+            values of one CSV row
+
+        Raises
+        -------
+        WriterError
+            When the writer thread stopped on an error
+        """
+
+        if self._error is not None:
+            raise WriterError from self._error
+        self._block[self._count] = row
+        self._count = self._count + 1
+        if self._count == self._block_rows:
+            self._submit()
+        elif time.perf_counter() - self._t_block >= self._flush_interval:
+            self._submit()
+
+    def writerows(self, rows):
+        """Store rows in the current block
+
+        Parameters
+        ----------
+        rows : iterable
+            lists or tuples of values of CSV rows
+        """
+
+        for row in rows:
+            self.writerow(row)
+
+    def flush(self):
+        """Hand over the current block and wait until all rows are written
+        and the file is flushed
+
+        Raises
+        -------
+        WriterError
+            When the writer thread stopped on an error
+        """
+
+        if not self._thread.is_alive():
+            return
+        if self._count:
+            self._submit()
+        self._queue.put((None, 0))
+        self._queue.join()
+        if self._error is not None:
+            raise WriterError from self._error
+
+    def close(self, timeout=None):
+        """Write remaining rows, stop writer thread, and close file if owned
+
+        Parameters
+        ----------
+        timeout : float
+            maximum time in seconds to wait for remaining rows to be
+            written, None to wait until done
+        """
+
+        if not self._thread.is_alive():
+            return
+        if self._count:
+            self._submit()
+        # Stop marker
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def get_bytes(self):
+        """Return estimated size in bytes of all rows, rows not yet written
+        are estimated from the mean size of rows written
+
+        Returns
+        -------
+        int
+            bytes written plus estimate of rows waiting in blocks
+        """
+
+        written = self._stats["bytes"]
+        rows = self._stats["rows"]
+        waiting = self._submitted + self._count - rows
+        if not rows or waiting <= 0:
+            return written
+        return written + waiting * written // rows
+
+    def _submit(self):
+        """Hand current block to the writer thread and take a free block"""
+
+        self._queue.put((self._block, self._count))
+        self._submitted = self._submitted + self._count
+        depth = self._queue.qsize()
+        if depth > self._stats["max_depth"]:
+            self._stats["max_depth"] = depth
+        try:
+            self._block = self._free.get_nowait()
+        except queue.Empty:
+            # All blocks are queued, i.e. during a disk stall
+            self._block = [None] * self._block_rows
+            self._stats["allocated"] = self._stats["allocated"] + 1
+        self._count = 0
+        self._t_block = time.perf_counter()
+
+    def _run(self):
+        """Writer thread, format and write blocks until stop marker"""
+
+        text = io.StringIO()
+        csv_writer = csv.writer(text, dialect="excel")
+        pending = 0
+        t_flush = time.perf_counter()
+        while True:
+            try:
+                item = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                # Idle, flush rows written since the last flush
+                if pending and self._error is None:
+                    try:
+                        self._flush_file()
+                    except (OSError, ValueError) as err:
+                        logger.error(f"** CSV writer stopped: {err}")
+                        self._error = err
+                    pending = 0
+                    t_flush = time.perf_counter()
+                continue
+            if item is None:
+                break
+            block, count = item
+            try:
+                if self._error is not None:
+                    continue
+                t_start = time.perf_counter()
+                if count:
+                    text.seek(0)
+                    text.truncate()
+                    csv_writer.writerows(block[:count] if count < len(block) else block)
+                    data = text.getvalue()
+                    self._file.write(data)
+                    pending = pending + len(data)
+                    self._stats["rows"] = self._stats["rows"] + count
+                    self._stats["blocks"] = self._stats["blocks"] + 1
+                    self._stats["bytes"] = self._stats["bytes"] + len(data)
+                    self._free.put(block)
+                # Flush on byte budget, time budget, or request by flush()
+                if pending and (
+                    block is None
+                    or pending >= self._flush_bytes
+                    or t_start - t_flush >= self._flush_interval
+                ):
+                    self._flush_file()
+                    pending = 0
+                    t_flush = time.perf_counter()
+                if count:
+                    self._update(time.perf_counter() - t_start)
+            except (OSError, ValueError) as err:
+                logger.error(f"** CSV writer stopped: {err}")
+                self._error = err
+            finally:
+                self._queue.task_done()
+
+        try:
+            if pending and self._error is None:
+                self._flush_file()
+            if self._close_file:
+                self._file.close()
+        except (OSError, ValueError) as err:
+            logger.error(f"** CSV writer failed to close file: {err}")
+            self._error = err
+        finally:
+            self._queue.task_done()
+
+    def _flush_file(self):
+        """Flush file and optionally sync to the storage device"""
+
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._stats["flushes"] = self._stats["flushes"] + 1
+
+    def _update(self, latency):
+        """Add write latency of a block to stats"""
+
+        stats = self._stats
+        stats["latency_last"] = latency
+        if stats["blocks"] == 1:
+            stats["latency_max"] = stats["latency_mean"] = latency
+        else:
+            stats["latency_max"] = max(stats["latency_max"], latency)
+            stats["latency_mean"] = (
+                stats["latency_mean"]
+                + (latency - stats["latency_mean"]) / stats["blocks"]
+            )
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Utility to convert binary capture files written by the logger scripts
+with --binary or by CaptureWriter() to CSV files with the same header,
+columns and footer as LoggerHelper(), or to numpy .npy files per burst
+field. Records are decoded in frame-aligned chunks by worker processes
+on all CPU cores.
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType, SimpleNamespace
+
+import numpy as np
+from tqdm import tqdm
+
+from esensorlib import burst_decoder, capture, counter_tracker
+from esensorlib.example import helper
+
+
+class CaptureSensor:
+    """
+    Stand-in for a configured SensorDevice() created from the header of a
+    capture file, with the properties used by LoggerHelper() to write
+    the header and footer rows
+
+    ...
+
+    Attributes
+    ----------
+    info : MappingProxyType
+        device info from the capture header
+    status : MappingProxyType
+        device status from the capture header
+    burst_out : MappingProxyType
+        burst output settings from the capture header
+    burst_fields : tuple
+        burst fields from the capture header
+    mdef : SimpleNamespace
+        SF_ scale factors of the model definitions from the capture header
+    sample_stats : MappingProxyType
+        lost and duplicate samples detected from the burst counter
+        after conversion, or None if counter is not enabled
+    """
+
+    def __init__(self, header):
+        """
+        Parameters
+        ----------
+        header : dict
+            layout header of the capture file
+        """
+
+        self.info = MappingProxyType(dict(header["info"]))
+        self.status = MappingProxyType(dict(header["status"]))
+        self.burst_out = MappingProxyType(dict(header["burst_out"]))
+        self.burst_fields = tuple(header["burst_fields"])
+        self.mdef = SimpleNamespace(**header["sf"])
+        self.sample_stats = None
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(prod_id='{self.info.get('prod_id')}')"
+
+
+def convert_chunk(path, start, stop, scaled=True, npy_prefix=None):
+    """Decode records from start up to stop of a capture file in a worker
+    process. Rows are returned as CSV text, or columns are written to the
+    .npy files of npy_prefix created by convert()
+
+    Parameters
+    ----------
+    path : str
+        path of the capture file
+    start : int
+        first record number
+    stop : int
+        record number after the last record
+    scaled : bool
+        If True apply scale factor to raw frames
+    npy_prefix : str
+        path prefix of .npy files per burst field, if None return CSV text
+
+    Returns
+    -------
+    tuple
+        (CSV text or "", numpy.ndarray of counter values or None)
+    """
+
+    with capture.CaptureReader(path) as reader:
+        records = reader.records[start:stop]
+        is_raw = reader.header["mode"] == "raw"
+        if npy_prefix:
+            samples = reader.decode(records, scaled)
+            for field in samples.dtype.names:
+                column = np.load(f"{npy_prefix}_{field}.npy", mmap_mode="r+")
+                column[start:stop] = samples[field]
+                column.flush()
+                del column
+            text = ""
+        else:
+            # Scale raw frames with BurstDecoder.scale() like read_sample()
+            # so that CSV rows are identical to LoggerHelper().write()
+            samples = reader.decode(records, scaled=False if is_raw else scaled)
+            rows = zip(*[samples[field].tolist() for field in samples.dtype.names])
+            if is_raw and scaled:
+                decoder = burst_decoder.BurstDecoder(**reader.header["decoder"])
+                rows = map(decoder.scale, rows)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, dialect="excel")
+            writer.writerows([(i, *row) for i, row in zip(range(start, stop), rows)])
+            text = buffer.getvalue()
+        counters = (
+            np.array(samples["counter"]) if "counter" in samples.dtype.names else None
+        )
+        del records, samples
+    return text, counters
+
+
+def convert(path, npy=False, scaled=True, jobs=None, chunk=65536, outdir=None):
+    """Convert a capture file to CSV file or .npy files per burst field
+
+    Parameters
+    ----------
+    path : str
+        path of the capture file
+    npy : bool
+        If True write .npy files per burst field instead of CSV file
+    scaled : bool
+        If True apply scale factor to raw frames, decoded records
+        are converted as stored
+    jobs : int
+        number of worker processes, if None then number of CPU cores
+    chunk : int
+        number of records decoded per task
+    outdir : str
+        directory of converted files, if None then directory of path
+
+    Returns
+    -------
+    list
+        paths of converted files
+    """
+
+    with capture.CaptureReader(path) as reader:
+        header = reader.header
+        count = len(reader)
+        scaled = scaled if header["mode"] == "raw" else header["scaled"]
+        try:
+            end_ts = float(reader.get_timestamps(count - 1)[0]) if count else None
+        except capture.CaptureError:
+            end_ts = None
+        if npy:
+            timestamps = None if end_ts is None else np.array(reader.get_timestamps())
+            dtype = reader.decode(reader.records[:1], scaled).dtype
+
+    sensor = CaptureSensor(header)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    prefix = os.path.join(outdir or os.path.dirname(path), stem)
+    tracker = None
+    if "counter" in sensor.burst_fields and sensor.status.get("counter") != "reset":
+        tracker = counter_tracker.CounterTracker(
+            bin_size=int(round(header.get("rate") or 0)) or 1000
+        )
+
+    if npy:
+        outputs = [f"{prefix}_{field}.npy" for field in dtype.names]
+        for output, field in zip(outputs, dtype.names):
+            np.lib.format.open_memmap(
+                output, mode="w+", dtype=dtype[field].newbyteorder("="), shape=(count,)
+            )
+        if timestamps is not None:
+            outputs.append(f"{prefix}_timestamp.npy")
+            np.save(outputs[-1], timestamps)
+        for _, counters in _map_chunks(path, count, scaled, prefix, jobs, chunk):
+            if tracker is not None:
+                tracker.update_array(counters)
+        return outputs
+
+    with open(f"{prefix}.csv", "w", newline="", encoding="utf-8") as f:
+        log = helper.LoggerHelper(sensor=sensor)
+        log.set_writer(to=f)
+        start_date = datetime.datetime.fromisoformat(header["created"])
+        log.write_header(scale_mode=scaled, start_date=start_date)
+        for text, counters in _map_chunks(path, count, scaled, None, jobs, chunk):
+            f.write(text)
+            if tracker is not None:
+                tracker.update_array(counters)
+        sensor.sample_stats = None if tracker is None else tracker.stats
+        end_date = None if end_ts is None else datetime.datetime.fromtimestamp(end_ts)
+        log.write_footer(end_date=end_date, sample_count=count)
+        log.set_writer()
+    return [f"{prefix}.csv"]
+
+
+def _map_chunks(path, count, scaled, npy_prefix, jobs, chunk):
+    """Yield results of convert_chunk() in record order, with at most
+    two tasks per worker process pending to bound memory"""
+
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        progress = tqdm(total=count, unit="rec")
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            pending.append(
+                (
+                    stop - start,
+                    executor.submit(
+                        convert_chunk, path, start, stop, scaled, npy_prefix
+                    ),
+                )
+            )
+            if len(pending) >= 2 * jobs:
+                size, future = pending.popleft()
+                yield future.result()
+                progress.update(size)
+        while pending:
+            size, future = pending.popleft()
+            yield future.result()
+            progress.update(size)
+        progress.close()
+
+
+def get_args():
+    """
+    returns parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="This program converts binary capture files (.ecap) "
+        "written by the logger scripts with --binary to CSV files with the "
+        "same header and footer as --csv, or to numpy .npy files per field."
+    )
+
+    parser.add_argument(
+        "captures",
+        help="specifies the capture files to convert.",
+        nargs="+",
+    )
+    parser.add_argument(
+        "--npy",
+        help="specifies to write a numpy .npy file per burst field and "
+        "host timestamp instead of a CSV file.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--noscale",
+        help="specifies to keep sensor data of raw frame captures unscaled, "
+        "decoded captures are converted as stored.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="specifies the number of worker processes, default is the "
+        "number of CPU cores.",
+        type=int,
+    )
+    parser.add_argument(
+        "--chunk",
+        help="specifies the number of records decoded per task, default is 65536.",
+        type=int,
+        default=65536,
+    )
+    parser.add_argument(
+        "--outdir",
+        help="specifies the directory of converted files, default is the "
+        "directory of the capture file.",
+        type=str,
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    for capture_path in args.captures:
+        try:
+            converted = convert(
+                capture_path,
+                npy=args.npy,
+                scaled=not args.noscale,
+                jobs=args.jobs,
+                chunk=args.chunk,
+                outdir=args.outdir,
+            )
+        except (OSError, capture.CaptureError) as err:
+            print(f"Unable to convert {capture_path}: {err}")
+            sys.exit(1)
+        print(f"Converted {capture_path} to {', '.join(converted)}")
+    sys.exit(0)
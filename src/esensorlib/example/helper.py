@@ -23,7 +23,7 @@
 # SOFTWARE.
 
 """Utility helper class to format and send sensor data
-to either stdout or CSV file
+to either stdout, CSV file, or binary capture file
 Contains:
 - LoggerHelper() class
 """
@@ -35,6 +35,9 @@ import time
 
 from tabulate import SEPARATING_LINE, tabulate
 
+from esensorlib import capture
+from esensorlib.example import async_writer
+
 
 class LoggerHelper:
     """
@@ -55,13 +58,23 @@ class LoggerHelper:
         SensorDevice() burst_out
     dev_burst_fields : tuple
         SensorDevice() burst_fields
+    writer_stats : MappingProxyType
+        stats of the current or last closed AsyncCsvWriter(), None if
+        buffered=True was not set
 
     Methods
     -------
-    set_writer(to=None)
+    set_writer(to=None, binary=False, buffered=False)
         If to=None, write() method sends to stdout.
         If to=list of strings, write() method sends to CSV file with
-        filename generated joining list of strings
+        filename generated joining list of strings, or to binary capture
+        file if binary=True.
+        If to=file object, write() method sends to the open file.
+        If buffered=True, CSV rows are written on a background thread
+
+    set_rotation(rotator=None)
+        Split files set by set_writer() into segments by the policy of
+        SegmentRotator() object, or no rotation if rotator=None
 
     write(sample_data)
         Write list or tuple of numbers (representing sensor data) to writer
@@ -70,7 +83,7 @@ class LoggerHelper:
         Write rows of header info to writer and
         increment internal sample counter
 
-    write_footer(end_date=None)
+    write_footer(end_date=None, sample_count=None)
         Write rows of footer info to writer
 
     get_dev_status()
@@ -93,6 +106,18 @@ class LoggerHelper:
         self._csv_file = None
         # Writer object defaults to stdout
         self._csv_writer = csv.writer(sys.stdout)
+        # Binary capture filename and CaptureWriter() created by write_header()
+        self._capture_fname = None
+        self._capture = None
+        # Last closed AsyncCsvWriter() for stats
+        self._last_writer = None
+        # SegmentRotator() and current file, filename parts, and settings
+        # to open the next segment
+        self._rotator = None
+        self._fname = None
+        self._segment_args = None
+        self._segment_index = 0
+        self._scale_mode = True
         # Sensor object
         self._sensor = sensor
         # SensorDevice() properties
@@ -114,43 +139,76 @@ class LoggerHelper:
     def __del__(self):
         self._close()
 
-    def set_writer(self, to=None):
+    @property
+    def writer_stats(self):
+        """property for AsyncCsvWriter() stats or None if not buffered"""
+        if isinstance(self._csv_writer, async_writer.AsyncCsvWriter):
+            return self._csv_writer.stats
+        if self._last_writer is not None:
+            return self._last_writer.stats
+        return None
+
+    def set_writer(self, to=None, binary=False, buffered=False):
         """Sets the writer to stdout if to=None or
-           csv_writer object if to=list of strings
+           csv_writer object if to=list of strings or
+           CaptureWriter() object if binary=True, which is created
+           by write_header(), or AsyncCsvWriter() object if buffered=True
 
         Parameters
         ----------
-        to : list
-            list of strings to concatenate to a filename
+        to : list or file object
+            list of strings to concatenate to a filename, or text file
+            opened with newline="" which is not closed by the helper
+        binary : bool
+            If True write to a binary capture file instead of CSV file
+        buffered : bool
+            If True CSV rows are stored in blocks and written on a
+            background thread, so that write() does not wait on the file
 
         Returns
         -------
         None
         """
         try:
-            if to is not None:
+            if hasattr(to, "write"):
                 self._close()
-                to.insert(1, self.dev_info.get("prod_id"))
-                to.insert(
-                    2,
-                    str(
-                        self.dev_status.get("dout_rate")
-                        or str(self.dev_status.get("dout_rate_rmspp"))
-                    ),
-                )
-                if self.dev_status.get("filter_sel"):
-                    to.insert(3, str(self.dev_status.get("filter_sel", "NA")))
-                fname = "_".join(to)
-                fname = fname + ".csv"
-                self._csv_file = open(fname, "a", newline="", encoding="utf-8")
-                self._csv_writer = csv.writer(self._csv_file, dialect="excel")
+                self._csv_file = None
+                self._csv_writer = self._create_writer(to, buffered, close_file=False)
+            elif to is not None:
+                self._close()
+                if self._rotator is not None:
+                    # Segment number is appended to the filename
+                    self._segment_args = (list(to), binary, buffered)
+                    self._segment_index = 0
+                    to.append(f"{self._segment_index:04}")
+                self._open_file(to, binary, buffered)
             else:
                 self._close()
                 self._csv_file = None
-                self._csv_writer = csv.writer(sys.stdout)  # Defaults to stdout
+                # Defaults to stdout
+                self._csv_writer = self._create_writer(
+                    sys.stdout, buffered, close_file=False
+                )
         except KeyboardInterrupt:
             pass
 
+    def set_rotation(self, rotator=None):
+        """Sets the rotation policy of files set by set_writer() with
+        a list of strings, the segment number is appended to the filename
+
+        Parameters
+        ----------
+        rotator : SegmentRotator
+            rotation policy and compression of closed segments,
+            None for no rotation
+
+        Returns
+        -------
+        None
+        """
+
+        self._rotator = rotator
+
     def write(self, sample_data=None):
         """Appends sample count to sample_data, formats,
         sends to writer object. If sample_data is None
@@ -167,6 +225,12 @@ class LoggerHelper:
         """
 
         try:
+            if self._rotator is not None and self._rotator.is_due(self._sample_count):
+                self._rotate()
+            if self._capture is not None:
+                self._capture.write(sample_data)
+                self._sample_count = self._sample_count + 1
+                return
             row_data = [self._sample_count]
             if sample_data:
                 row_data.extend(sample_data)
@@ -183,7 +247,8 @@ class LoggerHelper:
             pass
 
     def write_header(self, scale_mode=True, start_date=None):
-        """Writes the header rows to the writer object
+        """Writes the header rows to the writer object, or creates
+        the binary capture file with the layout header
 
         Parameters
         ----------
@@ -198,6 +263,15 @@ class LoggerHelper:
 
         if not start_date:
             start_date = datetime.datetime.now()
+        self._scale_mode = scale_mode
+        if self._capture_fname:
+            self._capture = capture.CaptureWriter(
+                self._capture_fname,
+                self._sensor,
+                scaled=scale_mode,
+                start_date=start_date,
+            )
+            return
         try:
             if self.dev_status.get("output_sel") is None:
                 _output_sel_name = ""
@@ -428,13 +502,15 @@ class LoggerHelper:
         except KeyboardInterrupt:
             pass
 
-    def write_footer(self, end_date=None):
+    def write_footer(self, end_date=None, sample_count=None):
         """Writes the footer rows to the writer object
 
         Parameters
         ----------
         end_date : datetime object
             datetime of current time, if None then grab current datetime
+        sample_count : int
+            number of samples written, if None then the internal sample counter
         Returns
         -------
         None
@@ -442,11 +518,17 @@ class LoggerHelper:
 
         if not end_date:
             end_date = datetime.datetime.now()
+        if sample_count is None:
+            sample_count = self._sample_count
+        # Binary capture has no footer, records are flushed
+        if self._capture is not None:
+            self._capture.flush()
+            return
         try:
             footer1 = ["#Log End", str(end_date), "", "", "", "", "", "", "", ""]
             footer2 = [
                 "#Sample Count",
-                f"{self._sample_count:09d}",
+                f"{sample_count:09d}",
                 "",
                 "",
                 "",
@@ -478,7 +560,25 @@ class LoggerHelper:
                 "",
                 "",
             ]
-            self._csv_writer.writerows([footer1, footer2, footer3])
+            footers = [footer1, footer2, footer3]
+            # Sample loss detected from the burst counter
+            sample_stats = self._sensor.sample_stats
+            if sample_stats is not None:
+                footers.append(
+                    [
+                        "#Lost Samples",
+                        f"{sample_stats['lost']:09d}",
+                        "",
+                        "Longest Gap",
+                        f"{sample_stats['longest_gap']}",
+                        "",
+                        "Loss Rate",
+                        f"{sample_stats['loss_rate']:.6f}",
+                        "Duplicates",
+                        f"{sample_stats['duplicates']}",
+                    ]
+                )
+            self._csv_writer.writerows(footers)
         except KeyboardInterrupt:
             pass
 
@@ -540,12 +640,71 @@ class LoggerHelper:
 
         self._sample_count = 0
 
+    def _open_file(self, to, binary, buffered):
+        """Opens CSV file or sets binary capture filename from list of strings"""
+
+        to.insert(1, self.dev_info.get("prod_id"))
+        to.insert(
+            2,
+            str(
+                self.dev_status.get("dout_rate")
+                or str(self.dev_status.get("dout_rate_rmspp"))
+            ),
+        )
+        if self.dev_status.get("filter_sel"):
+            to.insert(3, str(self.dev_status.get("filter_sel", "NA")))
+        fname = "_".join(to)
+        if binary:
+            self._capture_fname = self._fname = fname + ".ecap"
+        else:
+            self._fname = fname + ".csv"
+            self._csv_file = open(self._fname, "a", newline="", encoding="utf-8")
+            self._csv_writer = self._create_writer(self._csv_file, buffered)
+        if self._rotator is not None:
+            get_size = None
+            if isinstance(self._csv_writer, async_writer.AsyncCsvWriter):
+                get_size = self._csv_writer.get_bytes
+            self._rotator.start(self._fname, self._sample_count, get_size)
+
+    def _rotate(self):
+        """Closes the current segment and opens the next segment with header"""
+
+        parts, binary, buffered = self._segment_args
+        self._close()
+        self._segment_index = self._segment_index + 1
+        self._open_file(parts + [f"{self._segment_index:04}"], binary, buffered)
+        self.write_header(scale_mode=self._scale_mode)
+
+    def _create_writer(self, file, buffered, close_file=True):
+        """Returns csv writer object or AsyncCsvWriter() object of file"""
+
+        if buffered:
+            return async_writer.AsyncCsvWriter(file, close_file=close_file)
+        return csv.writer(file, dialect="excel")
+
     def _close(self):
         """Closes file if open"""
 
         try:
+            self._capture_fname = None
+            if self._capture is not None:
+                self._capture.close()
+                self._capture = None
+            writer = None
+            if isinstance(self._csv_writer, async_writer.AsyncCsvWriter):
+                writer = self._csv_writer
+                self._csv_writer = csv.writer(sys.stdout)
+                self._csv_file = None
+                if self._fname is None or self._rotator is None:
+                    # Writer thread writes remaining rows and closes the file
+                    writer.close()
+                self._last_writer = writer
             if self._csv_file:
                 if not self._csv_file.closed:
                     self._csv_file.close()
+            if self._fname is not None and self._rotator is not None:
+                # Segment is closed by the writer thread without waiting
+                self._rotator.finish(self._sample_count - 1, writer)
+            self._fname = None
         except AttributeError:
             pass
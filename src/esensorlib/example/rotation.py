@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Segment rotator class for splitting logger files by samples, size, or
+time and compressing closed segments in a background worker process
+Contains:
+- compress_file() function
+- SegmentRotator() class
+"""
+
+import datetime
+import functools
+import gzip
+import json
+import lzma
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+
+# Compression method to (open function, file extension)
+COMPRESSORS = {
+    "gzip": (gzip.open, ".gz"),
+    "lzma": (lzma.open, ".xz"),
+}
+
+
+def _lower_priority():
+    """Initializer of worker process so compression yields the CPU
+    to the logger"""
+
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+
+def compress_file(path, method="gzip"):
+    """Compress a closed segment file and remove the original, called in
+    the worker process of SegmentRotator()
+
+    Parameters
+    ----------
+    path : str
+        path of file to compress
+    method : str
+        compression method "gzip" or "lzma"
+
+    Returns
+    -------
+    tuple
+        (path of compressed file, size in bytes of compressed file)
+    """
+
+    open_fn, ext = COMPRESSORS[method]
+    dest = path + ext
+    tmp = dest + ".tmp"
+    with open(path, "rb") as src, open_fn(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, dest)
+    os.remove(path)
+    return dest, os.path.getsize(dest)
+
+
+class SegmentRotator:
+    """
+    Rotation policy of LoggerHelper() for splitting CSV or binary capture
+    files into segments. A new segment is started when the current segment
+    reaches max_rows samples, max_bytes on disk, interval seconds, or at
+    the next hour boundary of the local time, whichever comes first.
+    Closed segments are finished on a background thread which waits for a
+    buffered writer to write remaining rows, then compresses the segment in
+    a worker process, so the sampling loop only opens the next file.
+    The sidecar index file path + ".idx" of a binary capture segment is
+    compressed with the segment. The manifest file lists the segments with
+    their sample numbers, start and end time, size, and index file, and is
+    rewritten when a segment is closed or compressed
+
+    ...
+
+    Attributes
+    ----------
+    segments : list
+        dict per closed segment as written in the manifest
+    manifest : str
+        path of manifest file, derived from the first segment filename
+        if not specified
+
+    Methods
+    -------
+    start(path, first_sample, get_size)
+        Start a new segment, called by LoggerHelper()
+
+    is_due(sample_count)
+        Return True if the current segment should be closed before
+        writing the next sample
+
+    finish(last_sample, writer)
+        Close the current segment in the background, called by LoggerHelper()
+
+    close()
+        Wait for closed segments to be compressed and the manifest written
+    """
+
+    # Samples written between checks of the segment size on disk
+    CHECK_ROWS = 256
+
+    def __init__(
+        self,
+        max_rows=None,
+        max_bytes=None,
+        interval=None,
+        hourly=False,
+        compress=None,
+        manifest=None,
+    ):
+        """
+        Parameters
+        ----------
+        max_rows : int
+            maximum samples per segment
+        max_bytes : int
+            maximum size of a segment in bytes, checked every CHECK_ROWS
+            samples so segments are approximately this size
+        interval : float
+            maximum duration of a segment in seconds
+        hourly : bool
+            If True start a new segment at every hour of local time
+        compress : str
+            "gzip" or "lzma" to compress closed segments, None to keep
+            segments uncompressed
+        manifest : str
+            path of manifest file, None for the first segment filename
+            without segment number and extension appended with
+            _manifest.json
+        """
+
+        if compress is not None and compress not in COMPRESSORS:
+            raise ValueError(
+                f"** Invalid compress {compress}, use {tuple(COMPRESSORS)}"
+            )
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._interval = interval
+        self._hourly = hourly
+        self._compress = compress
+        self.manifest = manifest
+
+        self._lock = threading.Lock()
+        self._threads = []
+        self._executor = None
+        self._segments = []
+        # Current segment
+        self._index = -1
+        self._entry = None
+        self._row_limit = None
+        self._next_check = None
+        self._get_size = None
+        self._deadline = None
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(max_rows={self._max_rows}, ",
+                f"max_bytes={self._max_bytes}, ",
+                f"interval={self._interval}, ",
+                f"hourly={self._hourly}, ",
+                f"compress={self._compress!r})",
+            ]
+        )
+        return string_val
+
+    @property
+    def segments(self):
+        """property for list of closed segments"""
+        with self._lock:
+            return self._get_entries()
+
+    def start(self, path, first_sample, get_size=None):
+        """Start a new segment
+
+        Parameters
+        ----------
+        path : str
+            path of segment file, which is created by LoggerHelper()
+        first_sample : int
+            sample number of the first sample in the segment
+        get_size : callable
+            optional function returning bytes written to the segment i.e.
+            by a buffered writer which flushes the file less often,
+            None for the size of the file on disk
+        """
+
+        if self.manifest is None:
+            base = os.path.splitext(path)[0]
+            if base[-5:-4] == "_" and base[-4:].isdigit():
+                base = base[:-5]
+            self.manifest = base + "_manifest.json"
+        now = time.time()
+        self._index = self._index + 1
+        self._entry = {
+            "segment": self._index,
+            "file": os.path.basename(path),
+            "first_sample": first_sample,
+            "last_sample": None,
+            "start": datetime.datetime.fromtimestamp(now).isoformat(),
+            "end": None,
+            "bytes": None,
+            "compressed": None,
+            "compressed_bytes": None,
+            "index_file": None,
+            "index_bytes": None,
+            "index_compressed_bytes": None,
+            "_path": path,
+        }
+        self._row_limit = (
+            first_sample + self._max_rows if self._max_rows else float("inf")
+        )
+        self._next_check = first_sample + self.CHECK_ROWS
+        self._get_size = get_size or functools.partial(os.path.getsize, path)
+        deadlines = []
+        if self._interval:
+            deadlines.append(now + self._interval)
+        if self._hourly:
+            hour = datetime.datetime.fromtimestamp(now).replace(
+                minute=0, second=0, microsecond=0
+            )
+            deadlines.append((hour + datetime.timedelta(hours=1)).timestamp())
+        self._deadline = min(deadlines) if deadlines else float("inf")
+
+    def is_due(self, sample_count):
+        """Return True if the current segment should be closed before
+        writing the next sample
+
+        Parameters
+        ----------
+        sample_count : int
+            sample number of the next sample
+
+        Returns
+        -------
+        bool
+            True if the segment reached a row, size, or time limit
+        """
+
+        entry = self._entry
+        if entry is None or sample_count == entry["first_sample"]:
+            return False
+        if sample_count >= self._row_limit or time.time() >= self._deadline:
+            return True
+        if self._max_bytes and sample_count >= self._next_check:
+            self._next_check = sample_count + self.CHECK_ROWS
+            try:
+                return self._get_size() >= self._max_bytes
+            except OSError:
+                return False
+        return False
+
+    def finish(self, last_sample, writer=None):
+        """Close the current segment on a background thread, which waits
+        for the writer to close the file, then compresses it and writes
+        the manifest
+
+        Parameters
+        ----------
+        last_sample : int
+            sample number of the last sample in the segment
+        writer : AsyncCsvWriter
+            optional buffered writer still writing the segment, which is
+            closed without waiting
+        """
+
+        entry = self._entry
+        if entry is None:
+            return
+        self._entry = None
+        entry["last_sample"] = last_sample
+        entry["end"] = datetime.datetime.now().isoformat()
+        if writer is not None:
+            writer.close(timeout=0)
+        thread = threading.Thread(
+            target=self._finish, args=(entry, writer), name="SegmentRotator"
+        )
+        with self._lock:
+            self._threads.append(thread)
+        thread.start()
+
+    def close(self):
+        """Wait for closed segments to be compressed and the manifest written"""
+
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _finish(self, entry, writer):
+        """Background thread, wait for writer, update manifest, and submit
+        compression of the segment and its sidecar index to the worker
+        process"""
+
+        try:
+            if writer is not None:
+                writer.close()
+            path = entry["_path"]
+            try:
+                entry["bytes"] = os.path.getsize(path)
+            except OSError as err:
+                logger.error(f"** Segment {path} not found: {err}")
+                return
+            paths = {"": path}
+            index_path = path + ".idx"
+            if os.path.exists(index_path):
+                entry["index_file"] = os.path.basename(index_path)
+                entry["index_bytes"] = os.path.getsize(index_path)
+                paths["index_"] = index_path
+            with self._lock:
+                self._segments.append(entry)
+                self._write_manifest()
+                if self._compress is None:
+                    return
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=1, initializer=_lower_priority
+                    )
+                futures = {
+                    prefix: self._executor.submit(compress_file, each, self._compress)
+                    for prefix, each in paths.items()
+                }
+            for prefix, future in futures.items():
+                future.add_done_callback(
+                    functools.partial(self._on_compressed, entry, prefix)
+                )
+        finally:
+            with self._lock:
+                self._threads.remove(threading.current_thread())
+
+    def _on_compressed(self, entry, prefix, future):
+        """Update manifest when a segment or its sidecar index, with prefix
+        "index_" of the manifest keys, is compressed"""
+
+        try:
+            dest, size = future.result()
+        except Exception as err:
+            path = entry["_path"] + (".idx" if prefix else "")
+            logger.error(f"** Unable to compress {path}: {err}")
+            return
+        with self._lock:
+            entry[prefix + "file"] = os.path.basename(dest)
+            entry[prefix + "compressed_bytes"] = size
+            entry["compressed"] = self._compress
+            self._write_manifest()
+
+    def _get_entries(self):
+        """Return closed segments in segment order without internal keys"""
+
+        return [
+            {key: val for key, val in entry.items() if key != "_path"}
+            for entry in sorted(self._segments, key=lambda entry: entry["segment"])
+        ]
+
+    def _write_manifest(self):
+        """Replace the manifest file with the list of closed segments,
+        called with lock held"""
+
+        manifest = {
+            "format": "esensorlib-manifest",
+            "max_rows": self._max_rows,
+            "max_bytes": self._max_bytes,
+            "interval": self._interval,
+            "hourly": self._hourly,
+            "compress": self._compress,
+            "segments": self._get_entries(),
+        }
+        tmp = self.manifest + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp, self.manifest)
+        except OSError as err:
+            logger.error(f"** Unable to write manifest {self.manifest}: {err}")
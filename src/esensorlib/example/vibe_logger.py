@@ -36,8 +36,8 @@ import time
 from loguru import logger
 from tqdm import tqdm
 
-from esensorlib import sensor_device
-from esensorlib.example import helper
+from esensorlib import link_budget, sensor_device
+from esensorlib.example import helper, rotation
 
 VELOCITY_RAW_DRATE = 3000
 DISP_RAW_DRATE = 300
@@ -86,6 +86,27 @@ def get_args():
         choices=[921600, 460800, 230400, 115200],
         default=460800,
     )
+    parser.add_argument(
+        "--fast_start",
+        help="specifies to poll the device instead of waiting fixed delays "
+        "when opening the port and changing modes, to reduce the time to "
+        "the first sample i.e. when restarting a service.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--plan",
+        help="specifies to print the UART link budget of the configuration "
+        "and suggest the minimum baudrate or the fields to drop, then exit "
+        "without configuring the device.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cost",
+        help="specifies a JSON file saved by esensorlib-bench --suite decode "
+        "--json to estimate the host CPU of --plan, default is READ_US_FRAME "
+        "and READ_US_BYTE of link_budget.",
+        type=str,
+    )
 
     mutual_smpl_time.add_argument(
         "--secs",
@@ -158,6 +179,12 @@ def get_args():
         help="specifies to read sensor data to CSV file otherwise sends " "to console.",
         action="store_true",
     )
+    parser.add_argument(
+        "--binary",
+        help="specifies to write sensor data to a binary capture file (.ecap) "
+        "instead of CSV, the file header describes the record layout.",
+        action="store_true",
+    )
 
     parser.add_argument(
         "--noscale",
@@ -258,6 +285,13 @@ def get_args():
         default=None,
     )
 
+    group_csv.add_argument(
+        "--buffered",
+        help="specifies to write CSV rows in blocks on a background thread "
+        "so that slow storage does not stall reading the device.",
+        action="store_true",
+    )
+
     group_csv.add_argument(
         "--max_rows",
         help="specifies to split CSV files when the number of samples "
@@ -265,6 +299,33 @@ def get_args():
         type=int,
     )
 
+    group_csv.add_argument(
+        "--max_mb",
+        help="specifies to split files when the file size exceeds "
+        "specified megabytes.",
+        type=float,
+    )
+
+    group_csv.add_argument(
+        "--rotate_secs",
+        help="specifies to split files every specified number of seconds.",
+        type=float,
+    )
+
+    group_csv.add_argument(
+        "--rotate_hourly",
+        help="specifies to split files at every hour of local time.",
+        action="store_true",
+    )
+
+    group_csv.add_argument(
+        "--compress",
+        help="specifies to compress closed files in a background process "
+        "and write a manifest listing the files and their sample ranges.",
+        type=str.lower,
+        choices=["gzip", "lzma"],
+    )
+
     return parser.parse_args()
 
 
@@ -318,11 +379,16 @@ if __name__ == "__main__":
                 "When using --no_init, device model must be specified with --model <model name>"
             )
             sys.exit(1)
+        if args.plan:
+            print(
+                "When using --plan, device model must be specified with --model <model name>"
+            )
+            sys.exit(1)
         args.model = "auto"
         print("Model not specified, attempting to auto-detect")
 
     # Generate filename based on specified settings
-    if args.csv:
+    if args.csv or args.binary:
         fn_list = [time.strftime("%Y%m%d-%H%M%S")]
 
         if args.noscale:
@@ -339,7 +405,32 @@ if __name__ == "__main__":
             fn_list.append("CHK")
         if args.tag:
             fn_list.append(args.tag)
-    file_index = 0
+    # Create configuration dict arguments
+    drate_in_hz = get_dout_rate_rmspp(args.drate)
+    urate_in_hz = get_update_rate_rmspp(args.urate)
+    device_cfg = {
+        "output_sel": args.output_sel.upper(),
+        "dout_rate_rmspp": drate_in_hz,
+        "update_rate_rmspp": urate_in_hz,
+        "ndflags": args.ndflags,
+        "tempc": args.tempc or args.tempc8,
+        "is_tempc16": not args.tempc8,
+        "counter": args.counter,
+        "chksm": args.chksm,
+        "uart_auto": True,
+        "auto_start": args.autostart,
+        "ext_pol": args.ext_pol_neg,
+        "verbose": args.verbose,
+        "no_init": args.no_init,
+    }
+    if args.verbose:
+        logger.debug(f"device_cfg: {device_cfg}")
+    # Plan the UART link without opening the device
+    if args.plan:
+        cost = link_budget.load_cost(args.cost, args.model) if args.cost else None
+        plan = link_budget.plan_link(args.model, device_cfg, args.baud_rate, cost)
+        print(link_budget.format_plan(plan))
+        sys.exit(0)
 
     # Communicate with device to process runtime switches and parameters
     try:
@@ -350,6 +441,7 @@ if __name__ == "__main__":
             model=args.model,
             verbose=args.verbose,
             no_init=args.no_init,
+            fast_start=args.fast_start,
         )
     except IOError:
         print("Port Error: Unable to initialize device")
@@ -366,27 +458,6 @@ if __name__ == "__main__":
     if args.flash_update:
         vibe.backup_flash(verbose=args.verbose)
         sys.exit(0)
-    # Create configuration dict arguments
-    drate_in_hz = get_dout_rate_rmspp(args.drate)
-    urate_in_hz = get_update_rate_rmspp(args.urate)
-    device_cfg = {
-        "output_sel": args.output_sel.upper(),
-        "dout_rate_rmspp": drate_in_hz,
-        "update_rate_rmspp": urate_in_hz,
-        "ndflags": args.ndflags,
-        "tempc": args.tempc or args.tempc8,
-        "is_tempc16": not args.tempc8,
-        "counter": args.counter,
-        "chksm": args.chksm,
-        "uart_auto": True,
-        "auto_start": args.autostart,
-        "ext_pol": args.ext_pol_neg,
-        "verbose": args.verbose,
-        "no_init": args.no_init,
-    }
-    if args.verbose:
-        logger.debug(f"device_cfg: {device_cfg}")
-
     # Configure device with configuration dict
     vibe.set_config(**device_cfg)
     # Create helper for handling sensor data after
@@ -411,29 +482,41 @@ if __name__ == "__main__":
         else:
             num_samples = int(args.secs * args.drate)
 
-    # If CSV enabled, send tuple of strings for filename creation
+    # If CSV or binary enabled, send tuple of strings for filename creation
     # otherwise None means output to console
     fname_param = None
-    if args.csv:
+    if args.csv or args.binary:
         fname_param = fn_list
 
     vibe.goto("sampling")
+    # Split files into numbered segments if any rotation or compression
+    # is specified
+    rotator = None
+    if fname_param and (
+        args.max_rows
+        or args.max_mb
+        or args.rotate_secs
+        or args.rotate_hourly
+        or args.compress
+    ):
+        rotator = rotation.SegmentRotator(
+            max_rows=args.max_rows,
+            max_bytes=int(args.max_mb * 1e6) if args.max_mb else None,
+            interval=args.rotate_secs,
+            hourly=args.rotate_hourly,
+            compress=args.compress,
+        )
+        log.set_rotation(rotator)
+
     try:
-        if args.csv and args.max_rows:
-            # Append file_index for csv output and max_rows
-            log.set_writer(to=fname_param + [f"{file_index:04}"])
-        else:
-            log.set_writer(to=fname_param)
+        log.set_writer(to=fname_param, binary=args.binary, buffered=args.buffered)
         log.write_header(scale_mode=not args.noscale)
-        # If csv enabled show progress indicator
-        iter_samples = tqdm(range(num_samples)) if args.csv else range(num_samples)
-
-        for i in iter_samples:
-            # Create new CSV with header info when max_rows exceeded and increment file_index
-            if args.csv and args.max_rows and (i != 0) and (i % args.max_rows) == 0:
-                file_index = file_index + 1
-                log.set_writer(to=fname_param + [f"{file_index:04}"])
-                log.write_header(scale_mode=not args.noscale)
+        # If csv or binary enabled show progress indicator
+        iter_samples = tqdm(range(num_samples)) if fname_param else range(num_samples)
+
+        # New file with header info is started by log.write() when
+        # a rotation limit is reached
+        for _ in iter_samples:
             if args.noscale:
                 log.write(sample_data=vibe.read_sample_unscaled(verbose=args.verbose))
             else:
@@ -441,6 +524,16 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         pass
     vibe.goto("config")
+    if args.verbose:
+        logger.debug(f"Timing per phase in seconds: {dict(vibe.timing)}")
     log.write_footer()
+    # Close file, buffered rows are written before the file is closed
+    log.set_writer()
+    if args.verbose and log.writer_stats:
+        logger.debug(f"CSV writer stats: {dict(log.writer_stats)}")
+    if rotator is not None:
+        # Wait for closed segments to be compressed
+        rotator.close()
+        print(f"Segments: {len(rotator.segments)}, manifest: {rotator.manifest}")
     log.get_dev_status()
     sys.exit(0)
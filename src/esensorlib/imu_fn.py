@@ -25,46 +25,31 @@
 """IMU class for IMU functions
 Contains:
 - ImuFn() class
-- Descriptive Exceptions specific to this package
+- Descriptive Exceptions shared with base_fn
 """
 
-import struct
 import time
-from types import MappingProxyType
 
 from loguru import logger
 
+from esensorlib import (
+    base_fn,
+    burst_decoder,
+)
 
-# Custom Exceptions
-class HardwareError(Exception):
-    """Exception class for HARD_ERR from device"""
 
+# Descriptive Exceptions shared by the functions classes
+HardwareError = base_fn.HardwareError
+SelfTestError = base_fn.SelfTestError
+FlashTestError = base_fn.FlashTestError
+FlashBackupError = base_fn.FlashBackupError
+DeviceConfigurationError = base_fn.DeviceConfigurationError
+InvalidCommandError = base_fn.InvalidCommandError
+InvalidBurstReadError = base_fn.InvalidBurstReadError
+DeviceTimeoutError = base_fn.DeviceTimeoutError
 
-class SelfTestError(Exception):
-    """Exception class for ST_ERR from device"""
 
-
-class FlashTestError(Exception):
-    """Exception class for FLASH_ERR from device"""
-
-
-class FlashBackupError(Exception):
-    """Exception class for FLASH_BU_ERR from device"""
-
-
-class DeviceConfigurationError(Exception):
-    """Exception class for FLASH_BU_ERR from device"""
-
-
-class InvalidCommandError(Exception):
-    """Exception class for invalid register access for device"""
-
-
-class InvalidBurstReadError(Exception):
-    """Exception class for malformed burst read access for device"""
-
-
-class ImuFn:
+class ImuFn(base_fn.BaseFn):
     """
     IMU functions
 
@@ -80,6 +65,22 @@ class ImuFn:
         dict of burst output status
     burst_fields : tuple
         tuple of fields for sensor burst read
+    tracker : CounterTracker
+        lost and duplicate sample counters, None if counter is not in burst
+    clock : SampleClock
+        fit of host time to sample index for burst timestamps
+    index : int
+        sample index of the last sample read, -1 if none
+    stall_timeout : float
+        time in seconds without a burst before a read times out
+    stalls : int
+        number of reads and register waits that timed out
+    poll_stats : MappingProxyType
+        per operation counters and measured durations of register waits
+    timestamp : float
+        host timestamp of the last sample from read_sample() or read_frames()
+    timestamps : numpy.ndarray
+        host timestamps of the last samples from read_samples()
     mdef : object
         model specific definitions - addresses, values, constants, etc
     reg : enum
@@ -96,6 +97,12 @@ class ImuFn:
     set_config(**cfg)
         Configure device from key, value parameters
 
+    stage_config(**cfg)
+        Return register writes of set_config(**cfg) without writing to device
+
+    apply_image(image, write_all, verbose)
+        Configure device from a RegisterImage() compiled from a profile
+
     set_baudrate(baud, verbose)
         Configure device baudrate setting NOTE: This takes immediate effect.
 
@@ -129,9 +136,45 @@ class ImuFn:
 
     read_sample_unscaled(verbose)
         Return unscaled burst sample of sensor data
+
+    read_samples(n, scaled, verbose)
+        Return n burst samples of sensor data as numpy structured array
+
+    read_frames(n, verbose)
+        Return n complete burst frames as received without decoding
+
+    flush_frames()
+        Return and clear burst frames received but not yet read
+
+    set_index(index)
+        Set sample index of the last sample read
     """
 
-    def __init__(self, obj_regif, obj_mdef, device_info=None, verbose=False):
+    # Registers with self-clearing command or busy bits that are polled,
+    # never cached by RegInterface
+    VOLATILE_REGS = ("GLOB_CMD", "GLOB_CMD2", "MSC_CTRL", "FILTER_CTRL")
+
+    # Configuration registers read in a single pipeline by set_config()
+    # to compare against the register image computed from cfg
+    CONFIG_REGS = (
+        "SIG_CTRL",
+        "MSC_CTRL",
+        "SMPL_CTRL",
+        "FILTER_CTRL",
+        "UART_CTRL",
+        "BURST_CTRL1",
+        "BURST_CTRL2",
+        "DLT_CTRL",
+        "ATTI_CTRL",
+        "GLOB_CMD2",
+    )
+
+    # Registers that need a delay or busy check after writing
+    SETTLE_REGS = ("FILTER_CTRL", "GLOB_CMD2")
+
+    def __init__(
+        self, obj_regif, obj_mdef, device_info=None, verbose=False, fast_start=False
+    ):
         """
         Parameters
         ----------
@@ -143,21 +186,12 @@ class ImuFn:
             prod_id, version_id, serial_id as key, value pairs
         verbose : bool
             If True outputs additional debug info
+        fast_start : bool
+            If True goto() polls MODE_CTRL instead of waiting post_delay,
+            and register waits poll from the command with backoff
         """
 
-        self.regif = obj_regif
-        self.model_def = obj_mdef
-
-        self._device_info = device_info or {
-            "prod_id": None,
-            "version_id": None,
-            "serial_id": None,
-        }
-
-        self._verbose = verbose
-
-        # _cfg is updated when set_config(**cfg) called
-        self._cfg = {}
+        super().__init__(obj_regif, obj_mdef, device_info, verbose, fast_start)
 
         # Default device config status
         self._status = {
@@ -206,23 +240,6 @@ class ImuFn:
             "qtn32": False,
             "atti32": False,
         }
-        # Stores burst output fields
-        self._burst_fields = ()
-
-        # Store burst structure format for unpacking bytes
-        self._b_struct = ""
-
-    def __repr__(self):
-        cls = self.__class__.__name__
-        string_val = "".join(
-            [
-                f"{cls}(obj_regif={repr(self.regif)}, ",
-                f"obj_mdef={repr(self.model_def)}, ",
-                f"device_info={self._device_info}, ",
-                f"verbose={self._verbose})",
-            ]
-        )
-        return string_val
 
     def __str__(self):
         string_val = "".join(
@@ -232,79 +249,11 @@ class ImuFn:
                 f"\n  Model Definitions: {self.model_def}",
                 f"\n  Device Info: {self._device_info}",
                 f"\n  Verbose: {self._verbose}",
+                f"\n  Fast_Start: {self._fast_start}",
             ]
         )
         return string_val
 
-    @property
-    def info(self):
-        """property for device info as MappingProxyType"""
-        return MappingProxyType(self._device_info)
-
-    @property
-    def status(self):
-        """property for device status as MappingProxyType"""
-        return MappingProxyType(self._status)
-
-    @property
-    def burst_out(self):
-        """property for burst_output as MappingProxyType"""
-        return MappingProxyType(self._burst_out)
-
-    @property
-    def burst_fields(self):
-        """property for burst_fields"""
-        return self._burst_fields
-
-    @property
-    def mdef(self):
-        """property from SensorDevice() instance model definitions"""
-        return self.model_def
-
-    @property
-    def reg(self):
-        """property from SensorDevice() instance Reg"""
-        return self.model_def.Reg
-
-    def get_reg(self, winnum, regaddr, verbose=False):
-        """redirect to RegInterface() instance"""
-        return self.regif.get_reg(winnum, regaddr, verbose)
-
-    def set_reg(self, winnum, regaddr, write_byte, verbose=False):
-        """redirect to RegInterface() instance"""
-        self.regif.set_reg(winnum, regaddr, write_byte, verbose)
-
-    def set_config(self, **cfg):
-        """Configure device based on keyword, value parameters.
-        Configure with supplied key, values
-        Then read burst configuration from BURST_CTRL
-        and update status dict
-
-        Parameters
-        ----------
-        cfg : dict of keyword arguments
-            Optional keyword arguments
-        """
-
-        if not cfg:
-            logger.warning("** No cfg parameters provided using defaults")
-
-        self._cfg = cfg
-
-        verbose = self._cfg.get("verbose", False)
-        if verbose:
-            logger.debug(f"set_config({cfg})")
-
-        # Place device in CONFIG mode, if not already
-        self.goto("config", verbose=verbose)
-        self._config_basic(verbose)
-        self._config_dlt(verbose)
-        self._config_atti(verbose)
-        self._get_burst_config(verbose)
-
-        if verbose:
-            logger.debug(f"imu_fn.status: {self.status}")
-
     def set_baudrate(self, baud, verbose=False):
         """Configure Baud Rate
         NOTE: This change occurs immediately on the device
@@ -348,12 +297,16 @@ class ImuFn:
             non-zero results indicates HARD_ERR
         """
 
-        result = 0x0400
-        while (result & 0x0400) != 0:
-            # Wait for NOT_READY
-            result = self.get_reg(
-                self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR, verbose
-            )
+        # Wait for NOT_READY
+        self._wait_reg(
+            "power_on",
+            self.reg.GLOB_CMD.WINID,
+            self.reg.GLOB_CMD.ADDR,
+            0x0400,
+            self.mdef.POWERON_DELAY_S,
+            verbose,
+            min_wait=False,
+        )
         result = self.get_reg(
             self.reg.DIAG_STAT.WINID, self.reg.DIAG_STAT.ADDR, verbose
         )
@@ -378,11 +331,14 @@ class ImuFn:
         """
 
         self.set_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDRH, 0x04, verbose)
-        time.sleep(self.mdef.SELFTEST_DELAY_S)
-        result = 0x0400
-        while (result & 0x0400) != 0:
-            # Wait for SELF_TEST = 0
-            result = self.get_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDR)
+        # Wait for SELF_TEST = 0
+        self._wait_reg(
+            "selftest",
+            self.reg.MSC_CTRL.WINID,
+            self.reg.MSC_CTRL.ADDR,
+            0x0400,
+            self.mdef.SELFTEST_DELAY_S,
+        )
         result = self.get_reg(
             self.reg.DIAG_STAT.WINID, self.reg.DIAG_STAT.ADDR, verbose
         )
@@ -391,19 +347,6 @@ class ImuFn:
             raise SelfTestError(f"** Self Test Failure. DIAG_STAT={result: 04X}")
         print("Self Test completed with no errors")
 
-    def do_softreset(self, verbose=False):
-        """Initiate Software Reset
-
-        Parameters
-        ----------
-        verbose : bool
-            If True outputs additional debug info
-        """
-
-        self.set_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR, 0x80, verbose)
-        time.sleep(self.mdef.RESET_DELAY_S)
-        print("Software Reset Completed")
-
     def do_flashtest(self, verbose=False):
         """Initiate Flash Test
 
@@ -419,10 +362,13 @@ class ImuFn:
         """
 
         self.set_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDRH, 0x08, verbose)
-        time.sleep(self.mdef.FLASH_TEST_DELAY_S)
-        result = 0x0800
-        while (result & 0x0800) != 0:
-            result = self.get_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDR)
+        self._wait_reg(
+            "flash_test",
+            self.reg.MSC_CTRL.WINID,
+            self.reg.MSC_CTRL.ADDR,
+            0x0800,
+            self.mdef.FLASH_TEST_DELAY_S,
+        )
 
         result = self.get_reg(
             self.reg.DIAG_STAT.WINID, self.reg.DIAG_STAT.ADDR, verbose
@@ -447,10 +393,13 @@ class ImuFn:
         """
 
         self.set_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR, 0x08, verbose)
-        time.sleep(self.mdef.FLASH_BACKUP_DELAY_S)
-        result = 0x0008
-        while (result & 0x0008) != 0:
-            result = self.get_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR)
+        self._wait_reg(
+            "flash_backup",
+            self.reg.GLOB_CMD.WINID,
+            self.reg.GLOB_CMD.ADDR,
+            0x0008,
+            self.mdef.FLASH_BACKUP_DELAY_S,
+        )
 
         result = self.get_reg(
             self.reg.DIAG_STAT.WINID, self.reg.DIAG_STAT.ADDR, verbose
@@ -479,10 +428,15 @@ class ImuFn:
             return
 
         self.set_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR, 0x10, verbose)
-        time.sleep(self.mdef.FLASH_BACKUP_DELAY_S)
-        result = 0x0010
-        while (result & 0x0010) != 0:
-            result = self.get_reg(self.reg.GLOB_CMD.WINID, self.reg.GLOB_CMD.ADDR)
+        # Flash backup registers are reinitialized, discard cached registers
+        self.regif.invalidate_cache()
+        self._wait_reg(
+            "init_backup",
+            self.reg.GLOB_CMD.WINID,
+            self.reg.GLOB_CMD.ADDR,
+            0x0010,
+            self.mdef.FLASH_BACKUP_DELAY_S,
+        )
 
         result = self.get_reg(
             self.reg.DIAG_STAT.WINID, self.reg.DIAG_STAT.ADDR, verbose
@@ -519,6 +473,7 @@ class ImuFn:
             raise TypeError(f"** Mode parameter must be 'config' or 'sampling': {mode}")
 
         mode = mode.upper()
+        was_config = self._status["is_config"]
         self._status["is_config"] = mode == "CONFIG"
 
         if verbose:
@@ -541,11 +496,15 @@ class ImuFn:
                 self.mdef.MODE_CMD[mode],
                 verbose=verbose,
             )
-            time.sleep(post_delay)
+            if self._fast_start and mode in ("CONFIG", "SAMPLING"):
+                self._wait_mode(mode, was_config, post_delay, verbose)
+            else:
+                time.sleep(post_delay)
             # When entering CONFIG mode
             # flush any pending incoming burst data
             if mode == "CONFIG":
                 self.regif.port_io.reset_input_buffer()
+                self._rx_frames.clear()
 
         except KeyError as err:
             logger.error("** Invalid MODE_CMD")
@@ -565,11 +524,14 @@ class ImuFn:
             0 = Sampling, 1 = Config
         """
 
-        result = 0x0300
-        while (result & 0x0300) != 0:
-            result = self.get_reg(
-                self.reg.MODE_CTRL.WINID, self.reg.MODE_CTRL.ADDR, verbose=verbose
-            )
+        self._wait_reg(
+            "mode",
+            self.reg.MODE_CTRL.WINID,
+            self.reg.MODE_CTRL.ADDR,
+            0x0300,
+            0,
+            verbose,
+        )
         result = (
             self.get_reg(
                 self.reg.MODE_CTRL.WINID, self.reg.MODE_CTRL.ADDR, verbose=verbose
@@ -581,86 +543,6 @@ class ImuFn:
             logger.debug(f"MODE_CMD = {result}")
         return result
 
-    def read_sample(self, verbose=False):
-        """Read one burst of sensor data, post processes,
-        and returns scaled sensor data.
-        If burst read contains corrupted data, returns ()
-        NOTE: Device must be in SAMPLING mode before calling
-
-        Parameters
-        ----------
-        verbose : bool
-            If True outputs additional debug info
-
-        Returns
-        -------
-        tuple
-            tuple containing single set of sensor burst data with
-            scale factor applied or () if burst data is malformed
-            or device not in SAMPLING
-
-        Raises
-        -------
-        KeyboardInterrupt
-            Raises to caller CTRL-C
-        IOError
-            Raises to caller any type of serial port error
-        """
-
-        try:
-            raw_burst = self._get_sample(verbose=verbose)
-            return self._proc_sample(raw_burst)
-        except InvalidCommandError:
-            return ()
-        except InvalidBurstReadError:
-            return ()
-        except KeyboardInterrupt:
-            print("Stop reading sensor")
-            raise
-        except IOError:
-            logger.error("** Failure reading sensor sample")
-            raise
-
-    def read_sample_unscaled(self, verbose=False):
-        """Read one burst of sensor data, post processes,
-        and returns unscaled sensor data.
-        If burst read contains corrupted data, returns ()
-        NOTE: Device must be in SAMPLING mode before calling
-
-        Parameters
-        ----------
-        verbose : bool
-            If True outputs additional debug info
-
-        Returns
-        -------
-        tuple
-            tuple containing single set of sensor burst data
-            without scale factor applied or () if burst data
-            is malformed or device not in SAMPLING
-
-        Raises
-        -------
-        KeyboardInterrupt
-            Raises to caller CTRL-C
-        IOError
-            Raises to caller any type of serial port error
-        """
-
-        try:
-            raw_burst = self._get_sample(verbose=verbose)
-            return raw_burst
-        except InvalidCommandError:
-            return ()
-        except InvalidBurstReadError:
-            return ()
-        except KeyboardInterrupt:
-            print("Stop reading sensor")
-            raise
-        except IOError:
-            logger.error("** Failure reading sensor sample")
-            raise
-
     def _get_burst_config(self, verbose=False):
         """Typically, read from either BURST_CTRL1 & BURST_CTRL2.
         For no_init, read from self._cfg to update
@@ -728,13 +610,14 @@ class ImuFn:
             self._burst_out["qtn32"] = is_32bit and self._cfg.get("qtn", False)
             self._burst_out["atti32"] = is_32bit and self._cfg.get("atti", False)
 
-        self._b_struct = self._get_burst_struct_fmt()
-        self._burst_fields = self._get_burst_fields()
-
-        if verbose:
-            logger.debug(f"burst_out: {self._burst_out}")
-            logger.debug(f"burst_struct_fmt: {self._b_struct}")
-            logger.debug(f"burst_fields: {self._burst_fields}")
+        rate = self._status.get("dout_rate") or 1000
+        # Reset counter does not count samples when reset by EXT pin
+        self._start_session(
+            rate,
+            bin_size=rate,
+            use_counter=self._status.get("counter") != "reset",
+            verbose=verbose,
+        )
 
     def _get_burst_struct_fmt(self):
         """Returns the struct format for burst packet
@@ -823,6 +706,123 @@ class ImuFn:
                     burst_fields.append(key)
         return tuple(burst_fields)
 
+    def _get_burst_decoder(self):
+        """Returns BurstDecoder() compiled for the current burst layout
+        based on _b_struct, _burst_fields and scale factors in _status
+
+        Returns
+        -------
+        BurstDecoder
+            decoder object reused by _get_sample() and _proc_sample()
+        """
+
+        # Locally held scale factor
+        sf_tempc = self.mdef.SF_TEMPC
+        tempc_25c = self.mdef.TEMPC_25C
+        sf_gyro = self.mdef.SF_GYRO
+        sf_accl = (
+            self.mdef.SF_ACCL if not self._status.get("a_range") else self.mdef.SF_ACCL * 2
+        )
+
+        sf_dlta = 0
+        sf_dltv = 0
+        dlt_supported = self.mdef.HAS_FEATURE.get("DLT_OUTPUT")
+        if dlt_supported:
+            if self._status.get("dlta_sf_range") is not None:
+                sf_dlta = self.mdef.SF_DLTA * 2 ** self._status.get("dlta_sf_range")
+            _sf_dltv = (
+                self.mdef.SF_DLTV
+                if not self._status.get("a_range")
+                else self.mdef.SF_DLTV * 2
+            )
+            if self._status.get("dltv_sf_range") is not None:
+                sf_dltv = _sf_dltv * 2 ** self._status.get("dltv_sf_range")
+
+        sf_qtn = 1 / 2**14
+
+        # Set ATTI_SF to 0 for unsupported models
+        atti_supported = self.mdef.HAS_FEATURE.get("ATTI_OUTPUT")
+        sf_atti = 0
+        if atti_supported:
+            sf_atti = self.mdef.SF_ATTI
+
+        # Map conversions for scaled as (scale, offset, ndigits)
+        map_scl = {
+            "ndflags": (None, 0, None),
+            "tempc": (sf_tempc, 25 - tempc_25c * sf_tempc, 4),
+            "gyro": (sf_gyro, 0, 6),
+            "accl": (sf_accl, 0, 6),
+            "dlta": (sf_dlta, 0, 6),
+            "dltv": (sf_dltv, 0, 6),
+            "qtn": (sf_qtn, 0, 6),
+            "atti": (sf_atti, 0, 6),
+            "tempc32": (sf_tempc / 65536, 25 - tempc_25c * sf_tempc, 4),
+            "gyro32": (sf_gyro / 65536, 0, 8),
+            "accl32": (sf_accl / 65536, 0, 8),
+            "dlta32": (sf_dlta / 65536, 0, 8),
+            "dltv32": (sf_dltv / 65536, 0, 8),
+            "qtn32": (sf_qtn / 65536, 0, 8),
+            "atti32": (sf_atti / 65536, 0, 8),
+            "gpio": (None, 0, None),
+            "counter": (None, 0, None),
+            "chksm": (None, 0, None),
+        }
+
+        return burst_decoder.BurstDecoder(
+            self._b_struct,
+            self._burst_fields,
+            [map_scl[field.split("_")[0]] for field in self._burst_fields],
+            marker=self.mdef.BURST_MARKER,
+            delimiter=self.mdef.DELIMITER,
+            rounding=self._cfg.get("rounding", True),
+        )
+
+    def _config_regs(self, verbose=False):
+        """Configure basic, delta angle/velocity, and attitude settings
+        based on self._cfg dict
+
+        Parameters
+        ----------
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        self._config_basic(verbose)
+        self._config_dlt(verbose)
+        self._config_atti(verbose)
+
+    def _settle_reg(self, winnum, regaddr, verbose=False):
+        """Wait for the setting to complete after writing a register
+        in SETTLE_REGS, called by _settle()
+
+        Parameters
+        ----------
+        winnum : int
+            WIN_ID of register written
+        regaddr : int
+            register address written
+        verbose : bool
+            If True outputs additional debug info
+
+        Raises
+        -------
+        DeviceTimeoutError
+            When the setting does not complete within the deadline
+        """
+
+        if (winnum, regaddr) == (self.reg.FILTER_CTRL.WINID, self.reg.FILTER_CTRL.ADDR):
+            # Wait for FILTER_STAT = 0
+            self._wait_reg(
+                "filter",
+                self.reg.FILTER_CTRL.WINID,
+                self.reg.FILTER_CTRL.ADDR,
+                0x0020,
+                self.mdef.FILTER_SETTING_DELAY_S,
+            )
+        elif (winnum, regaddr) == (self.reg.GLOB_CMD2.WINID, self.reg.GLOB_CMD2.ADDR):
+            # ATTITUDE_MOTION_PROFILE
+            time.sleep(self.mdef.ATTI_MOTION_SETTING_DELAY_S)
+
     def _set_output_rate(self, output_rate=200, verbose=False):
         """Configure DOUT_RATE and update _status, and
         if no_init then do not write to registers
@@ -921,12 +921,9 @@ class ImuFn:
                 writebyte,
                 verbose,
             )
-            time.sleep(self.mdef.FILTER_SETTING_DELAY_S)
-            result = 0x0020
-            while (result & 0x0020) != 0:
-                result = self.get_reg(
-                    self.reg.FILTER_CTRL.WINID, self.reg.FILTER_CTRL.ADDR
-                )
+            self._settle(
+                self.reg.FILTER_CTRL.WINID, self.reg.FILTER_CTRL.ADDR, verbose
+            )
         except KeyError as err:
             logger.error(f"** Invalid FILTER_SEL, Filter Type = {filter_type}")
             raise InvalidCommandError from err
@@ -999,35 +996,6 @@ class ImuFn:
             logger.error(f"** Invalid EXT_SEL, EXT_SEL = {mode}")
             raise InvalidCommandError from err
 
-    def _set_drdy_polarity(self, act_high=True, verbose=False):
-        """Configure DRDY to active HIGH in MSC_CTRL
-           update _status, and if no_init do not write to registers
-
-        Parameters
-        ----------
-        act_high : bool
-            True = active HIGH or False = active LOW
-        verbose : bool
-            If True outputs additional debug info
-        """
-
-        self._status["drdy_pol"] = act_high
-
-        if verbose:
-            logger.debug(f"DRDY_POL = {act_high}")
-
-        if self._cfg.get("no_init", False):
-            logger.warning("--no_init bypass setting DRDY_POL in MSC_CTRL register")
-            return
-
-        _tmp = self.get_reg(self.reg.MSC_CTRL.WINID, self.reg.MSC_CTRL.ADDR, verbose)
-        self.set_reg(
-            self.reg.MSC_CTRL.WINID,
-            self.reg.MSC_CTRL.ADDR,
-            (_tmp & 0xFD) | int(act_high) << 1,
-            verbose,
-        )
-
     def _set_accl_range(self, a_range=False, verbose=False):
         """Configure A_RANGE settings for models that support it,
            update _status, and if no_init do not write to registers
@@ -1360,7 +1328,7 @@ class ImuFn:
                 _wval,
                 verbose=verbose,
             )
-            time.sleep(self.mdef.ATTI_MOTION_SETTING_DELAY_S)
+            self._settle(self.reg.GLOB_CMD2.WINID, self.reg.GLOB_CMD2.ADDR, verbose)
 
             print("Configured attitude / quaternion")
         except KeyError as err:
@@ -1369,160 +1337,6 @@ class ImuFn:
             )
             raise DeviceConfigurationError from err
 
-    def _get_sample(self, inter_delay=0.000001, verbose=False):
-        """Return single burst from device if burst is malformed
-        then find next header byte and raise InvalidBurstReadError
-
-        Parameters
-        ----------
-        inter_delay : float
-            delay time between checking a complete burst is in the buffer
-        verbose : bool
-            If True outputs additional debug info
-
-        Returns
-        -------
-        list of integers of a single burst of data
-
-        Raises
-        -------
-        InvalidCommandError
-            When device is not configured by set_config() or
-            When device is not in SAMPLING mode
-        InvalidBurstReadError
-            When header byte and delimiter byte is missing, find next header byte,
-            and re-raise InvalidBurstReadError
-        KeyboardInterrupt
-            When CTRL-C occurs, re-raise
-        """
-
-        # Return if struct is empty, then device is not configured
-        if self._b_struct == "":
-            logger.error("** Device not configured. Have you run set_config()?")
-            raise InvalidCommandError
-        # Return if still in CONFIG mode
-        if self._status.get("is_config"):
-            logger.error("** Device not in SAMPLING mode. Run goto('sampling') first.")
-            raise InvalidCommandError
-        # Get data structure of the burst
-        data_struct = struct.Struct(self._b_struct)
-        # If UART_AUTO disabled, send BURST command
-        if not self._status["uart_auto"]:
-            self.regif.port_io.set_raw8(self.mdef.BURST_MARKER, 0x00, verbose)
-
-        try:
-            while self.regif.port_io.in_waiting() < data_struct.size:
-                time.sleep(inter_delay)
-            data_str = self.regif.port_io.read_bytes(data_struct.size)
-
-            data_unpacked = data_struct.unpack(data_str)
-
-            if (data_unpacked[0] != self.mdef.BURST_MARKER) or (
-                data_unpacked[-1] != self.mdef.DELIMITER
-            ):
-                logger.warning("** Missing Header or Delimiter")
-                raise InvalidBurstReadError
-
-            # Strip out the header and delimiter byte
-            return data_unpacked[1:-1]
-        except InvalidBurstReadError:
-            self.regif.port_io.find_delimiter(verbose=verbose)
-            raise
-        except KeyboardInterrupt:
-            print("CTRL-C: Exiting")
-            raise
-
-    def _proc_sample(self, raw_burst=()):
-        """Process as single burst read of device data
-        Returns processed data in a tuple or () if empty burst
-
-        Parameters
-        ----------
-        raw_burst : list
-            list of integers of single burst of data
-            Typically the output from _get_sample()
-
-        Returns
-        -------
-        tuple of scale-converted single burst of data
-
-        Raises
-        -------
-        InvalidBurstReadError
-            If raw_burst is False
-        KeyboardInterrupt
-            When CTRL-C occurs re-raise
-        """
-
-        try:
-            if not raw_burst:
-                raise InvalidBurstReadError
-
-            # Locally held scale factor
-            sf_tempc = self.mdef.SF_TEMPC
-            tempc_25c = self.mdef.TEMPC_25C
-            sf_gyro = self.mdef.SF_GYRO
-            sf_accl = (
-                self.mdef.SF_ACCL
-                if not self._status.get("a_range")
-                else self.mdef.SF_ACCL * 2
-            )
-
-            sf_dlta = 0
-            sf_dltv = 0
-            dlt_supported = self.mdef.HAS_FEATURE.get("DLT_OUTPUT")
-            if dlt_supported:
-                if self._status.get("dlta_sf_range") is not None:
-                    sf_dlta = self.mdef.SF_DLTA * 2 ** self._status.get("dlta_sf_range")
-                _sf_dltv = (
-                    self.mdef.SF_DLTV
-                    if not self._status.get("a_range")
-                    else self.mdef.SF_DLTV * 2
-                )
-                if self._status.get("dltv_sf_range") is not None:
-                    sf_dltv = _sf_dltv * 2 ** self._status.get("dltv_sf_range")
-
-            sf_qtn = 1 / 2**14
-
-            # Set ATTI_SF to 0 for unsupported models
-            atti_supported = self.mdef.HAS_FEATURE.get("ATTI_OUTPUT")
-            sf_atti = 0
-            if atti_supported:
-                sf_atti = self.mdef.SF_ATTI
-
-            # Map conversions for scaled
-            map_scl = {
-                "ndflags": lambda x: x,
-                "tempc": lambda x: round(((x - tempc_25c) * sf_tempc) + 25, 4),
-                "gyro": lambda x: round(x * sf_gyro, 6),
-                "accl": lambda x: round(x * sf_accl, 6),
-                "dlta": lambda x: round(x * sf_dlta, 6),
-                "dltv": lambda x: round(x * sf_dltv, 6),
-                "qtn": lambda x: round(x * sf_qtn, 6),
-                "atti": lambda x: round(x * sf_atti, 6),
-                "tempc32": lambda x: round(
-                    ((x - (tempc_25c * 65536)) * sf_tempc / 65536) + 25, 4
-                ),
-                "gyro32": lambda x: round(x * sf_gyro / 65536, 8),
-                "accl32": lambda x: round(x * sf_accl / 65536, 8),
-                "dlta32": lambda x: round(x * sf_dlta / 65536, 8),
-                "dltv32": lambda x: round(x * sf_dltv / 65536, 8),
-                "qtn32": lambda x: round(x * sf_qtn / 65536, 8),
-                "atti32": lambda x: round(x * sf_atti / 65536, 8),
-                "gpio": lambda x: x,
-                "counter": lambda x: x,
-                "chksm": lambda x: x,
-            }
-
-            return tuple(
-                # Pass field_data into lambda function in map_scl dict
-                map_scl[field_name.split("_")[0]](field_data)
-                for field_name, field_data in zip(self._burst_fields, raw_burst)
-            )
-        except KeyboardInterrupt:
-            print("CTRL-C: Exiting")
-            raise
-
     def _config_ext_sel(self, verbose=False):
         """Configure EXT_SEL setting based on self._cfg
         Exit early and do nothing if no_init is True
@@ -361,8 +361,10 @@ class IMUMonitor:
                 # If no new data, just continue
                 data = latest_data if latest_data else self.imu.read_sample()
                 if data:
-                    current_time = time.time()
-                    dt = current_time - last_time
+                    # Host timestamp of the sample from the sample clock,
+                    # not the jittery time it was read from the buffer
+                    current_time = self.imu.timestamp
+                    dt = max(current_time - last_time, 0.0)
                     timestamp = current_time - start_time
                     display_counter += 1
 
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Link Budget class for checking that the burst output of a device fits
+the UART link, and planner of the minimum baudrate or burst fields to drop
+Contains:
+- LinkBudgetError() class
+- LinkBudget() class
+- load_cost() function
+- plan_link() function
+- format_plan() function
+"""
+
+import contextlib
+import io
+import json
+
+from loguru import logger
+
+from esensorlib import accl_fn, imu_fn, reg_interface, sim_port, vib_fn
+
+# Bits per byte on the wire, 1 start + 8 data + 1 stop bit
+BITS_PER_BYTE = 10
+
+# Fraction of the UART capacity the burst output may use, the rest is
+# margin for gaps between bytes and host latency
+MAX_UTILIZATION = 0.9
+
+# Default host CPU microseconds per frame and per frame byte of read_sample()
+# for the cpu estimate of LinkBudget, not used to check if the burst fits.
+# Fitted by load_cost() from esensorlib-bench --suite decode --json of all
+# models and burst layouts on a Linux x86-64 host (Intel Xeon, Python 3.11).
+# Pass cost=load_cost(path) with the results of your own host instead
+READ_US_FRAME = 6.4
+READ_US_BYTE = 0.17
+
+# set_config() parameters that add burst fields, in the order tried
+# when two parameters save the same number of bytes
+DROP_KEYS = (
+    "atti",
+    "qtn",
+    "dltv",
+    "dlta",
+    "gpio",
+    "chksm",
+    "counter",
+    "ndflags",
+    "tempc",
+    "sensz",
+    "sensy",
+    "sensx",
+    "is_32bit",
+)
+
+_FN_CLASSES = {
+    "imu": imu_fn.ImuFn,
+    "accl": accl_fn.AcclFn,
+    "vib": vib_fn.VibFn,
+}
+
+
+class LinkBudgetError(Exception):
+    """Burst output does not fit the UART link"""
+
+
+class LinkBudget:
+    """
+    Bytes per second of the burst output compared with the capacity of
+    the UART link at BITS_PER_BYTE, and the host CPU estimated for
+    read_sample() of every frame
+
+    ...
+
+    Attributes
+    ----------
+    frame_size : int
+        burst frame size in bytes including header and delimiter
+    rate : float
+        output rate in frames per second
+    baudrate : int
+        UART baudrate
+    bytes_per_s : float
+        burst output in bytes per second
+    capacity : float
+        UART capacity in bytes per second
+    utilization : float
+        fraction of the UART capacity used by the burst output
+    fits : bool
+        True if utilization is within MAX_UTILIZATION
+    cpu : float
+        estimated fraction of one host CPU core for read_sample()
+    """
+
+    def __init__(self, frame_size, rate, baudrate, cost=None):
+        """
+        Parameters
+        ----------
+        frame_size : int
+            burst frame size in bytes including header and delimiter
+        rate : float
+            output rate in frames per second
+        baudrate : int
+            UART baudrate
+        cost : tuple
+            host CPU (microseconds per frame, microseconds per frame byte)
+            i.e. from load_cost(), default is READ_US_FRAME, READ_US_BYTE
+        """
+
+        us_frame, us_byte = cost or (READ_US_FRAME, READ_US_BYTE)
+        self.frame_size = frame_size
+        self.rate = rate
+        self.baudrate = baudrate
+        self.bytes_per_s = frame_size * rate
+        self.capacity = baudrate / BITS_PER_BYTE
+        self.utilization = self.bytes_per_s / self.capacity
+        self.fits = self.utilization <= MAX_UTILIZATION
+        self.cpu = rate * (us_frame + us_byte * frame_size) * 1e-6
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return (
+            f"{cls}(frame_size={self.frame_size}, rate={self.rate}, "
+            f"baudrate={self.baudrate})"
+        )
+
+    def __str__(self):
+        return (
+            f"{self.frame_size} bytes x {self.rate:g} sps = "
+            f"{self.bytes_per_s:.0f} bytes/s uses {self.utilization:.0%} of "
+            f"{self.baudrate} baud ({self.capacity:.0f} bytes/s), "
+            f"limit {MAX_UTILIZATION:.0%}"
+        )
+
+
+def load_cost(path, prod_id=None):
+    """Fit host CPU microseconds per frame and per frame byte of
+    read_sample() from esensorlib-bench --json results of the decode suite
+
+    Parameters
+    ----------
+    path : str
+        JSON file saved by esensorlib-bench --suite decode --json
+    prod_id : str
+        optional product ID to fit from results of that model only,
+        when it has at least two frame sizes
+
+    Returns
+    -------
+    tuple
+        (microseconds per frame, microseconds per frame byte)
+
+    Raises
+    -------
+    ValueError
+        When the file has less than two frame sizes to fit
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        results = json.load(f).get("decode", [])
+    if prod_id:
+        model_results = [
+            result for result in results if result["model"] == prod_id.upper()
+        ]
+        if len({result["bytes"] for result in model_results}) > 1:
+            results = model_results
+    if len({result["bytes"] for result in results}) < 2:
+        logger.error(f"** Not enough decode results in {path}")
+        raise ValueError(f"Decode results with two frame sizes needed in {path}")
+
+    # Least squares line of microseconds per sample vs frame bytes
+    sizes = [result["bytes"] for result in results]
+    costs = [result["us_sample"] for result in results]
+    mean_size = sum(sizes) / len(sizes)
+    mean_cost = sum(costs) / len(costs)
+    us_byte = sum(
+        (size - mean_size) * (cost - mean_cost) for size, cost in zip(sizes, costs)
+    ) / sum((size - mean_size) ** 2 for size in sizes)
+    return (mean_cost - us_byte * mean_size, us_byte)
+
+
+def plan_link(prod_id, cfg, baudrate, cost=None):
+    """Plan the UART link for set_config() parameters without a device.
+    The burst layout is read from a SimulatedDevice() configured with cfg.
+    Only parameters enabled in cfg are considered to drop
+
+    Parameters
+    ----------
+    prod_id : str
+        product ID of device model i.e. G370PDF1, A352AD10, A342VD10
+    cfg : dict
+        set_config() keyword arguments
+    baudrate : int
+        UART baudrate
+    cost : tuple
+        host CPU (microseconds per frame, microseconds per frame byte)
+
+    Returns
+    -------
+    dict
+        budget as LinkBudget() of cfg, min_baudrate as the lowest baudrate
+        of the model that fits or None, max_rate as the highest DOUT_RATE
+        that fits at baudrate or None, drop as dict of set_config()
+        parameters to change to fit at baudrate, and drop_budget as
+        LinkBudget() after drop or None when cfg fits.
+        min_baudrate and max_rate are for the burst of cfg as requested,
+        without drop applied
+
+    Raises
+    -------
+    IOError
+        When prod_id is not supported by the simulated device
+    """
+
+    prod_id = prod_id.upper()
+    cfg = {
+        key: value
+        for key, value in cfg.items()
+        if key not in ("verbose", "no_init", "write_all")
+    }
+
+    # Discard messages printed by the simulated device and set_config()
+    with contextlib.redirect_stdout(io.StringIO()):
+        port = sim_port.SimulatedPort(prod_id, fast_start=True)
+        try:
+            device = port.device
+            fn = _FN_CLASSES[device.family](
+                reg_interface.RegInterface(port),
+                device.mdef,
+                {"prod_id": prod_id, "version_id": None, "serial_id": None},
+                fast_start=True,
+            )
+            frame_size, rate = _get_burst(fn, cfg)
+            budget = LinkBudget(frame_size, rate, baudrate, cost)
+
+            # Drop the field that saves the most bytes until the burst fits
+            drop = {}
+            current = budget
+            while not current.fits:
+                best = None
+                for key in DROP_KEYS:
+                    if key in drop or not cfg.get(key):
+                        continue
+                    trial = dict(cfg, **drop)
+                    trial[key] = _get_disabled(cfg[key])
+                    size, _ = _get_burst(fn, trial)
+                    if best is None or size < best[1]:
+                        best = (key, size)
+                if best is None or best[1] >= current.frame_size:
+                    break
+                drop[best[0]] = _get_disabled(cfg[best[0]])
+                current = LinkBudget(best[1], rate, baudrate, cost)
+        finally:
+            port.close(verbose=False)
+
+    mdef = device.mdef
+    min_baudrate = next(
+        (
+            baud
+            for baud in sorted(getattr(mdef, "BAUD_RATE", {}))
+            if LinkBudget(frame_size, rate, baud, cost).fits
+        ),
+        None,
+    )
+    max_rate = max(
+        (
+            dout_rate
+            for dout_rate in getattr(mdef, "DOUT_RATE", {})
+            if LinkBudget(frame_size, dout_rate, baudrate, cost).fits
+        ),
+        default=None,
+    )
+    return {
+        "budget": budget,
+        "min_baudrate": min_baudrate,
+        "max_rate": max_rate,
+        "drop": drop,
+        "drop_budget": current if drop else None,
+    }
+
+
+def format_plan(plan):
+    """Return the result of plan_link() as lines of text
+
+    Parameters
+    ----------
+    plan : dict
+        result of plan_link()
+
+    Returns
+    -------
+    str
+        burst output, UART utilization, host CPU and suggestions
+    """
+
+    budget = plan["budget"]
+    result = "fits" if budget.fits else "does NOT fit"
+    lines = [
+        f"Burst output: {budget}",
+        f"Host CPU: {budget.cpu:.1%} of one core for read_sample()",
+        f"Result: {result} at {budget.baudrate} baud",
+    ]
+    if plan["min_baudrate"] is None:
+        lines.append("Minimum baudrate: none of the device baudrates fit")
+    else:
+        lines.append(f"Minimum baudrate: {plan['min_baudrate']}")
+    if plan["max_rate"] is not None:
+        lines.append(
+            f"Maximum DOUT_RATE at {budget.baudrate} baud: {plan['max_rate']:g}"
+        )
+    if plan["drop"]:
+        changes = ", ".join(f"{key}={value}" for key, value in plan["drop"].items())
+        lines.append(f"Fields to drop at {budget.baudrate} baud: {changes}")
+        lines.append(f"  after drop: {plan['drop_budget']}")
+    return "\n".join(lines)
+
+
+def _get_burst(fn, cfg):
+    """Return frame size and output rate of ImuFn(), AcclFn(), VibFn()
+    instance of a simulated device after set_config(**cfg)"""
+
+    fn.set_config(**cfg)
+    return fn.decoder.size, fn.clock.rate
+
+
+def _get_disabled(value):
+    """Return the set_config() value that disables a burst field"""
+
+    return "" if isinstance(value, str) else False
@@ -0,0 +1,444 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Provisioner class for configuring, testing and flashing many devices
+in parallel with one worker thread per port
+Contains:
+- ProvisionError() class
+- Provisioner() class
+- format_report() function
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from tabulate import tabulate
+
+from esensorlib import config_profile, sensor_device
+
+
+class ProvisionError(Exception):
+    """Device does not match the profile after provisioning"""
+
+
+class Provisioner:
+    """
+    Provisions a batch of devices with the same profile of set_config()
+    parameters, or ConfigProfile() applied as a register image. Each port
+    is opened by its own worker thread which runs the steps connect,
+    init_check, selftest, flashtest, set_config, backup_flash and verify
+    in order, and stops at the first failing step of that device without
+    affecting the other devices
+
+    ...
+
+    Attributes
+    ----------
+    ports : tuple
+        ports of the devices to provision
+    steps : tuple
+        steps to run after connect in order
+    results : list
+        result dict per port in order of ports from the last run()
+
+    Methods
+    -------
+    run()
+        Provision all devices concurrently and return result per port
+
+    provision(port)
+        Provision a single device and return its result
+    """
+
+    # Steps in the order they are run, connect is always run first
+    STEPS = (
+        "connect",
+        "init_check",
+        "selftest",
+        "flashtest",
+        "set_config",
+        "backup_flash",
+        "verify",
+    )
+
+    def __init__(
+        self,
+        ports,
+        profile,
+        speed=460800,
+        if_type="uart",
+        model="auto",
+        steps=None,
+        fast_start=True,
+        verbose=False,
+    ):
+        """
+        Parameters
+        ----------
+        ports : list
+            port per device i.e. ["/dev/ttyUSB0", "/dev/ttyUSB1"], or the
+            product ID per simulated device when if_type is "sim"
+        profile : dict or ConfigProfile
+            set_config() keyword arguments applied to every device, or
+            ConfigProfile() compiled once per model and applied with
+            apply_profile()
+        speed : int
+            baudrate of the devices
+        if_type : str
+            "uart", or "sim" for simulated devices
+        model : str
+            Model of the devices, "auto" to detect per device
+        steps : list
+            steps to run after connect from STEPS, None for all steps
+        fast_start : bool
+            If True open devices with fast_start to poll instead of
+            fixed delays
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        self.ports = tuple(ports)
+        if isinstance(profile, config_profile.ConfigProfile):
+            self._profile = profile
+        else:
+            self._profile = dict(profile)
+        self._speed = speed
+        self._if_type = if_type
+        self._model = model
+        self._fast_start = fast_start
+        self._verbose = verbose
+        self.results = []
+
+        if steps is None:
+            steps = self.STEPS[1:]
+        unknown = [step for step in steps if step not in self.STEPS[1:]]
+        if unknown:
+            logger.error(f"** Unknown provisioning steps {unknown}")
+            raise ValueError(f"Steps must be from {self.STEPS[1:]}")
+        # Keep the order of STEPS regardless of the order specified
+        self.steps = tuple(step for step in self.STEPS[1:] if step in steps)
+
+        if len(set(self.ports)) != len(self.ports):
+            logger.error("** Each port must be specified once")
+            raise ValueError(f"Duplicate ports in {self.ports}")
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(ports={list(self.ports)}, ",
+                f"profile={self._profile}, ",
+                f"speed={self._speed}, ",
+                f"if_type='{self._if_type}', ",
+                f"model='{self._model}', ",
+                f"steps={list(self.steps)}, ",
+                f"fast_start={self._fast_start}, ",
+                f"verbose={self._verbose})",
+            ]
+        )
+        return string_val
+
+    def run(self):
+        """Provision all devices concurrently with one worker per port
+
+        Returns
+        -------
+        list
+            result dict per port in order of ports, refer to provision()
+
+        Raises
+        -------
+        ProfileError
+            When the model is specified and ConfigProfile() is not valid
+            for the model, before any port is opened
+        """
+
+        if isinstance(self._profile, config_profile.ConfigProfile):
+            if self._model.upper() != "AUTO":
+                self._profile.compile(self._model)
+        if not self.ports:
+            self.results = []
+            return self.results
+        with ThreadPoolExecutor(
+            max_workers=len(self.ports), thread_name_prefix="provision"
+        ) as executor:
+            self.results = list(executor.map(self.provision, self.ports))
+        return self.results
+
+    def provision(self, port):
+        """Connect to a single device and run the steps, stopping at the
+        first step that raises an exception
+
+        Parameters
+        ----------
+        port : str
+            port of the device
+
+        Returns
+        -------
+        dict
+            port, prod_id, version_id, serial_id, passed, failed_step (None
+            if passed), error message, changed (True if set_config() wrote
+            registers), timing as seconds per step, and total seconds
+        """
+
+        result = {
+            "port": port,
+            "prod_id": None,
+            "version_id": None,
+            "serial_id": None,
+            "passed": False,
+            "failed_step": None,
+            "error": None,
+            "changed": None,
+            "timing": {},
+            "total": 0.0,
+        }
+        dev = None
+        t_start = time.perf_counter()
+        step = "connect"
+        try:
+            for step in self.STEPS[:1] + self.steps:
+                t_step = time.perf_counter()
+                if step == "connect":
+                    dev = sensor_device.SensorDevice(
+                        port,
+                        speed=self._speed,
+                        if_type=self._if_type,
+                        model=self._model,
+                        verbose=self._verbose,
+                        fast_start=self._fast_start,
+                    )
+                    for key in ("prod_id", "version_id", "serial_id"):
+                        result[key] = dev.info.get(key)
+                else:
+                    self._run_step(dev, step, result)
+                result["timing"][step] = time.perf_counter() - t_step
+                logger.info(f"{port}: {step} passed")
+            result["passed"] = True
+        except Exception as err:
+            # Any failure is reported for this device only
+            result["failed_step"] = step
+            result["error"] = type(err).__name__
+            if str(err):
+                result["error"] = f"{result['error']}: {err}"
+            logger.error(f"** {port}: {step} failed. {result['error']}")
+        finally:
+            if dev is not None:
+                dev.port_io.close(verbose=False)
+        result["total"] = time.perf_counter() - t_start
+        return result
+
+    def _run_step(self, dev, step, result):
+        """Run one step on a connected device
+
+        Parameters
+        ----------
+        dev : SensorDevice
+            connected device
+        step : str
+            step from STEPS except connect
+        result : dict
+            result of the device updated with changed
+
+        Raises
+        -------
+        ProvisionError
+            When verify finds registers that differ from the profile
+        """
+
+        verbose = self._verbose
+        if step == "init_check":
+            dev.init_check(verbose)
+        elif step == "selftest":
+            dev.do_selftest(verbose)
+        elif step == "flashtest":
+            dev.do_flashtest(verbose)
+        elif step == "set_config":
+            if isinstance(self._profile, config_profile.ConfigProfile):
+                result["changed"] = dev.apply_profile(self._profile, verbose=verbose)
+            else:
+                result["changed"] = dev.set_config(**self._profile)
+        elif step == "backup_flash":
+            dev.backup_flash(verbose)
+        elif step == "verify":
+            # Applying the profile again must find nothing to write
+            if isinstance(self._profile, config_profile.ConfigProfile):
+                changed = dev.apply_profile(self._profile, verbose=verbose)
+            else:
+                changed = dev.set_config(**dict(self._profile, write_all=False))
+            if changed:
+                raise ProvisionError("Registers differ from the profile")
+
+
+def format_report(results):
+    """Return a table of the provisioning results with seconds per step
+
+    Parameters
+    ----------
+    results : list
+        result dict per device from Provisioner.run()
+
+    Returns
+    -------
+    str
+        table with one row per device
+    """
+
+    steps = [
+        step
+        for step in Provisioner.STEPS
+        if any(step in result["timing"] for result in results)
+    ]
+    rows = []
+    for result in results:
+        row = {
+            "port": result["port"],
+            "prod_id": result["prod_id"],
+            "serial_id": result["serial_id"],
+            "result": "PASS" if result["passed"] else f"FAIL {result['failed_step']}",
+        }
+        for step in steps:
+            row[step] = result["timing"].get(step)
+        row["total"] = result["total"]
+        rows.append(row)
+    table = tabulate(rows, headers="keys", floatfmt=".3f", missingval="-")
+    errors = [
+        f"{result['port']}: {result['error']}" for result in results if result["error"]
+    ]
+    return "\n".join([table] + errors)
+
+
+def get_args():
+    """
+    returns parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="This program configures, tests and flashes many devices "
+        "in parallel with the same profile, and prints a report with the "
+        "result and seconds per step of each device."
+    )
+
+    parser.add_argument(
+        "-s",
+        "--serial_ports",
+        help="specifies the serial port of each device i.e. /dev/ttyUSB0 "
+        "/dev/ttyUSB1, or the product ID of each simulated device with --sim",
+        type=str,
+        nargs="+",
+        required=True,
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        help="specifies a JSON or TOML file of set_config() parameters "
+        'i.e. {"dout_rate": 200, "filter_sel": "K64_FC50", "auto_start": true}, '
+        "or of named profiles.",
+        type=str,
+        required=True,
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        help="specifies the profile to apply when the file has more than one.",
+        type=str,
+    )
+    parser.add_argument(
+        "-b",
+        "--baud_rate",
+        help="specifies baudrate of the devices, default is 460800.",
+        type=int,
+        default=460800,
+    )
+    parser.add_argument(
+        "--model",
+        help="specifies the device model, default is auto-detect per device.",
+        type=str,
+        default="auto",
+    )
+    parser.add_argument(
+        "--steps",
+        help="specifies the steps to run after connect, default is all steps.",
+        type=str,
+        nargs="+",
+        choices=Provisioner.STEPS[1:],
+    )
+    parser.add_argument(
+        "--sim",
+        help="specifies to provision simulated devices without hardware.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--json",
+        help="specifies a file to write the results as JSON.",
+        type=str,
+    )
+    parser.add_argument(
+        "--verbose",
+        help="specifies to enable low-level register messages "
+        "for debugging purpose.",
+        action="store_true",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    try:
+        profiles = config_profile.load_profiles(args.profile)
+    except (OSError, ValueError, ImportError, config_profile.ProfileError) as err:
+        logger.error(f"** Unable to read profile: {err}")
+        sys.exit(1)
+    if args.name is None and len(profiles) > 1:
+        logger.error(f"** Specify --name, one of {list(profiles)}")
+        sys.exit(1)
+    profile = profiles.get(args.name) if args.name else next(iter(profiles.values()))
+    if profile is None:
+        logger.error(f"** Profile {args.name} not found, one of {list(profiles)}")
+        sys.exit(1)
+
+    provisioner = Provisioner(
+        args.serial_ports,
+        profile,
+        speed=args.baud_rate,
+        if_type="sim" if args.sim else "uart",
+        model=args.model,
+        steps=args.steps,
+        verbose=args.verbose,
+    )
+    try:
+        results = provisioner.run()
+    except config_profile.ProfileError:
+        sys.exit(1)
+    print(format_report(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    sys.exit(0 if all(result["passed"] for result in results) else 1)
@@ -51,7 +51,28 @@ class RegInterface:
     set_reg(winnum, regaddr, write_byte, verbose=False)
         8-bit write to specified register address
 
-    get_device_info(verbose=False)
+    get_regs(regs, verbose=False)
+        16-bit reads from list of register addresses in a single pipeline
+
+    set_regs(regs, verbose=False)
+        8-bit writes to list of register addresses in a single pipeline
+
+    enable_cache(volatile_regs)
+        Enable shadow register cache and WIN_ID tracking
+
+    disable_cache()
+        Disable shadow register cache
+
+    invalidate_cache()
+        Discard cached registers and current WIN_ID
+
+    begin_staging(regs, verbose=False)
+        Read register image and stage following writes in the image
+
+    end_staging(changed_only=True)
+        Stop staging and return writes that differ from the register image
+
+    get_device_info(verbose=False, batch=False)
         Return dict of device read prod_id, version_id, serial_id
     """
 
@@ -70,6 +91,19 @@ class RegInterface:
         self.port_io = obj_port
         self._verbose = verbose
 
+        # Shadow register cache, disabled until enable_cache()
+        # _win_id is None when the current WIN_ID is unknown
+        self._use_cache = False
+        self._cache = {}
+        self._volatile = set()
+        self._win_id = None
+
+        # Register image for staging, None when not staging
+        # _stage_order is the order of first write to each register byte
+        self._stage_current = None
+        self._stage_target = None
+        self._stage_order = []
+
         # Load core device definitions for basic communication
         self._mdef = importlib.import_module(".model.mcore", package="esensorlib")
         self.reg = self._mdef.Reg
@@ -110,8 +144,10 @@ class RegInterface:
             16-bit data read from register
         """
 
-        self.port_io.set_raw8(self.WIN_ID_ADDR, winnum, verbose=False)
-        read_data = self.port_io.get_raw16(regaddr, verbose=False)
+        if self._stage_target is not None:
+            read_data = self._get_staged((winnum, regaddr & 0xFE))
+        else:
+            read_data = self._read_reg(winnum, regaddr)
 
         if verbose:
             logger.debug(
@@ -135,21 +171,269 @@ class RegInterface:
             If True outputs additional debug info
         """
 
-        self.port_io.set_raw8(self.WIN_ID_ADDR, winnum, verbose=False)
+        if self._stage_target is not None:
+            self._set_staged(winnum, regaddr, write_byte)
+            if verbose:
+                logger.debug(
+                    f"STAGE[0x{regaddr & 0xFF:02X}, W({winnum:X})] <- 0x{write_byte:02X}"
+                )
+            return
+
+        self._set_win_id(winnum)
         self.port_io.set_raw8(regaddr, write_byte, verbose=False)
+        self._write_through(winnum, regaddr, write_byte)
 
         if verbose:
             logger.debug(
                 f"REG[0x{regaddr & 0xFF:02X}, W({winnum:X})] <- 0x{write_byte:02X}"
             )
 
-    def get_device_info(self, verbose=False):
+    def get_regs(self, regs, verbose=False):
+        """Returns the 16-bit register data from a list of WIN_ID and
+        regaddr (must be even). Reads are sorted by WIN_ID so that
+        WIN_ID is written once per window, and sent as a single pipeline.
+
+        Parameters
+        ----------
+        regs : list
+            (winnum, regaddr) tuples
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        list
+            16-bit data read from each register in order of regs
+        """
+
+        if self._stage_target is not None:
+            return [self.get_reg(winnum, regaddr, verbose) for winnum, regaddr in regs]
+
+        result = [0] * len(regs)
+        # Start with the current window to skip the first WIN_ID write
+        order = sorted(
+            [i for i, reg in enumerate(regs) if (reg[0], reg[1] & 0xFE) not in self._cache],
+            key=lambda i: (regs[i][0] != self._win_id, regs[i][0]),
+        )
+        cmds = []
+        win_id = self._win_id
+        for i in order:
+            winnum, regaddr = regs[i]
+            if winnum != win_id:
+                cmds.append((self.WIN_ID_ADDR, winnum))
+                win_id = winnum
+            cmds.append((regaddr, None))
+        if cmds:
+            read_data = self.port_io.pipeline(cmds, verbose=False)
+            if self._use_cache:
+                self._win_id = win_id
+            for i, data in zip(order, read_data):
+                result[i] = data
+                key = (regs[i][0], regs[i][1] & 0xFE)
+                if self._is_cacheable(key):
+                    self._cache[key] = data
+
+        for i, (winnum, regaddr) in enumerate(regs):
+            key = (winnum, regaddr & 0xFE)
+            if key in self._cache:
+                result[i] = self._cache[key]
+            if verbose:
+                logger.debug(
+                    f"REG[0x{regaddr & 0xFE:02X}, W({winnum:X})] -> 0x{result[i]:04X}"
+                )
+
+        return result
+
+    def set_regs(self, regs, verbose=False):
+        """Writes 1 byte to each WIN_ID and regaddr (odd or even) in a list
+        as a single pipeline. Writes are sent in order of the list and
+        WIN_ID is only written when it changes, so group writes by WIN_ID
+        where the order does not matter.
+
+        Parameters
+        ----------
+        regs : list
+            (winnum, regaddr, write_byte) tuples
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        if self._stage_target is not None:
+            for winnum, regaddr, write_byte in regs:
+                self.set_reg(winnum, regaddr, write_byte, verbose)
+            return
+
+        cmds = []
+        win_id = self._win_id
+        for winnum, regaddr, write_byte in regs:
+            if winnum != win_id:
+                cmds.append((self.WIN_ID_ADDR, winnum))
+                win_id = winnum
+            cmds.append((regaddr, write_byte))
+        self.port_io.pipeline(cmds, verbose=False)
+        if self._use_cache:
+            self._win_id = win_id
+
+        for winnum, regaddr, write_byte in regs:
+            self._write_through(winnum, regaddr, write_byte)
+            if verbose:
+                logger.debug(
+                    f"REG[0x{regaddr & 0xFF:02X}, W({winnum:X})] <- 0x{write_byte:02X}"
+                )
+
+    @property
+    def is_staging(self):
+        """property for True when writes are staged in the register image"""
+        return self._stage_target is not None
+
+    def begin_staging(self, regs, verbose=False):
+        """Read the current register image with a single pipeline and stage
+        following get_reg() and set_reg() calls in the image instead of
+        the device. Registers not in regs are read from the device on first
+        access. Call end_staging() to get the writes to apply to the device.
+
+        Parameters
+        ----------
+        regs : list
+            Reg members to read into the register image
+        verbose : bool
+            If True outputs additional debug info
+        """
+
+        keys = [(reg.WINID, reg.ADDR & 0xFE) for reg in regs]
+        self._stage_current = dict(zip(keys, self.get_regs(keys, verbose)))
+        self._stage_target = dict(self._stage_current)
+        self._stage_order = []
+
+    def end_staging(self, changed_only=True):
+        """Stop staging and return the staged register bytes that differ
+        from the current register image of the device
+
+        Parameters
+        ----------
+        changed_only : bool
+            If False return every staged register byte, including bytes
+            equal to the current register image
+
+        Returns
+        -------
+        list
+            (winnum, regaddr, write_byte) tuples in order of first write
+        """
+
+        changes = []
+        for winnum, regaddr in self._stage_order:
+            key = (winnum, regaddr & 0xFE)
+            shift = 8 if regaddr & 0x01 else 0
+            write_byte = (self._stage_target[key] >> shift) & 0xFF
+            if (
+                not changed_only
+                or write_byte != (self._stage_current[key] >> shift) & 0xFF
+            ):
+                changes.append((winnum, regaddr, write_byte))
+
+        self._stage_current = None
+        self._stage_target = None
+        self._stage_order = []
+        return changes
+
+    def enable_cache(self, volatile_regs=()):
+        """Enable shadow register cache. WIN_ID is only written when
+        the window changes, and 16-bit reads from windows other than 0
+        are cached. Writes update the cached register (write-through).
+        Window 0 (sensor output, status, MODE_CTRL) and volatile_regs
+        are never cached.
+
+        Parameters
+        ----------
+        volatile_regs : list
+            Reg members with self-clearing or status bits i.e. GLOB_CMD
+        """
+
+        self._volatile = {(reg.WINID, reg.ADDR & 0xFE) for reg in volatile_regs}
+        self._use_cache = True
+        self.invalidate_cache()
+
+    def disable_cache(self):
+        """Disable shadow register cache and discard cached registers"""
+
+        self._use_cache = False
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Discard cached registers and current WIN_ID. Call when device
+        registers change outside of this class i.e. software reset"""
+
+        self._cache.clear()
+        self._win_id = None
+
+    def _read_reg(self, winnum, regaddr):
+        """Return 16-bit register from cache or device"""
+
+        key = (winnum, regaddr & 0xFE)
+        if key in self._cache:
+            return self._cache[key]
+        self._set_win_id(winnum)
+        read_data = self.port_io.get_raw16(regaddr, verbose=False)
+        if self._is_cacheable(key):
+            self._cache[key] = read_data
+        return read_data
+
+    def _get_staged(self, key):
+        """Return register from staged image, read from device if missing"""
+
+        if key not in self._stage_target:
+            read_data = self._read_reg(*key)
+            self._stage_current[key] = read_data
+            self._stage_target[key] = read_data
+        return self._stage_target[key]
+
+    def _set_staged(self, winnum, regaddr, write_byte):
+        """Write byte to staged image and record the order of writes"""
+
+        key = (winnum, regaddr & 0xFE)
+        value = self._get_staged(key)
+        if regaddr & 0x01:
+            self._stage_target[key] = (value & 0x00FF) | (write_byte << 8)
+        else:
+            self._stage_target[key] = (value & 0xFF00) | write_byte
+        if (winnum, regaddr) not in self._stage_order:
+            self._stage_order.append((winnum, regaddr))
+
+    def _is_cacheable(self, key):
+        """Return True if (winnum, regaddr) can be stored in the cache"""
+
+        return self._use_cache and key[0] != 0 and key not in self._volatile
+
+    def _set_win_id(self, winnum):
+        """Write WIN_ID unless the cache knows it is already selected"""
+
+        if winnum != self._win_id:
+            self.port_io.set_raw8(self.WIN_ID_ADDR, winnum, verbose=False)
+            if self._use_cache:
+                self._win_id = winnum
+
+    def _write_through(self, winnum, regaddr, write_byte):
+        """Update the cached register with the byte written"""
+
+        key = (winnum, regaddr & 0xFE)
+        if regaddr == self.WIN_ID_ADDR:
+            self._win_id = write_byte if self._use_cache else None
+        elif key in self._cache:
+            if regaddr & 0x01:
+                self._cache[key] = (self._cache[key] & 0x00FF) | (write_byte << 8)
+            else:
+                self._cache[key] = (self._cache[key] & 0xFF00) | write_byte
+
+    def get_device_info(self, verbose=False, batch=False):
         """Returns PRODID, VERSION_ID, SERIAL_ID as dict.
 
         Parameters
         ----------
         verbose : bool
             If True outputs additional debug info
+        batch : bool
+            If True read the identification registers in a single pipeline
 
         Returns
         -------
@@ -158,9 +442,12 @@ class RegInterface:
         """
 
         # Read Model Info from device
-        prod_id = self._get_prod_id(verbose)
-        version = self._get_firm_ver(verbose)
-        serial_num = self._get_unit_id(verbose)
+        if batch:
+            prod_id, version, serial_num = self._get_id_regs(verbose)
+        else:
+            prod_id = self._get_prod_id(verbose)
+            version = self._get_firm_ver(verbose)
+            serial_num = self._get_unit_id(verbose)
 
         return {
             "prod_id": "".join(chr(i) for i in prod_id),
@@ -168,6 +455,33 @@ class RegInterface:
             "serial_id": "".join(chr(i) for i in serial_num),
         }
 
+    def _get_id_regs(self, verbose=False):
+        """Return Product ID, Firmware Version and UNIT_ID (serial number)
+        as byte codes read in a single pipeline"""
+
+        names = (
+            "PROD_ID1",
+            "PROD_ID2",
+            "PROD_ID3",
+            "PROD_ID4",
+            "VERSION",
+            "SERIAL_NUM1",
+            "SERIAL_NUM2",
+            "SERIAL_NUM3",
+            "SERIAL_NUM4",
+        )
+        regs = [getattr(self.reg, name) for name in names]
+        result = self.get_regs([(reg.WINID, reg.ADDR) for reg in regs])
+
+        codes = []
+        for item in result:
+            codes.append(item & 0xFF)
+            codes.append(item >> 8)
+
+        if verbose:
+            logger.debug(f"Identification raw byte code returned: {codes}")
+        return codes[:8], codes[8:10], codes[10:]
+
     def _get_prod_id(self, verbose=False):
         """Return Product ID as ASCII"""
 
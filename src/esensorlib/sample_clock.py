@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Sample Clock class for assigning host timestamps to burst samples
+from the sample index
+Contains:
+- SampleClock() class
+"""
+
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SampleClock:
+    """
+    Clock model that fits host arrival time against device sample index
+    with an online linear regression, so that every sample is assigned a
+    smoothed monotonic timestamp from its sample index instead of the
+    jittery time it was read. The sample index is the unwrapped burst
+    counter when enabled, otherwise the count of samples read.
+    The regression is updated once per read from the UART, and the
+    fitted period is the measured output period of the device.
+    Typically, created by AcclFn(), ImuFn(), or VibFn() each time
+    the device enters SAMPLING mode
+
+    ...
+
+    Attributes
+    ----------
+    rate : float
+        nominal output rate in Hz used until enough reads are fitted
+    period : float
+        fitted time in seconds per sample index
+    updates : int
+        number of reads fitted
+
+    Methods
+    -------
+    reset()
+        Clear the fit to start a new session
+
+    update(index, arrival)
+        Fit arrival time of the sample with index
+
+    timestamp(index)
+        Return timestamp of the sample with index
+
+    timestamps(indexes)
+        Return numpy array of timestamps of many sample indexes
+    """
+
+    # Reads fitted before the fitted period replaces the nominal period
+    MIN_UPDATES = 8
+
+    def __init__(self, rate, window=256, clock=time.time):
+        """
+        Parameters
+        ----------
+        rate : float
+            nominal output rate in Hz
+        window : int
+            effective number of recent reads in the regression,
+            older reads are exponentially forgotten
+        clock : function
+            returns host time in seconds when arrival is not specified
+        """
+
+        self.rate = rate
+        self._window = window
+        self._forget = 1.0 - 1.0 / window
+        self._clock = clock
+        self.reset()
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(rate={self.rate}, window={self._window})"
+
+    @property
+    def period(self):
+        """property for fitted time in seconds per sample index"""
+        return self._fit[2]
+
+    @property
+    def updates(self):
+        """property for number of reads fitted"""
+        return self._updates
+
+    def reset(self):
+        """Clear the fit to start a new session"""
+
+        # Weighted sums of the regression relative to the last fitted point
+        self._origin = None
+        self._sums = [0.0, 0.0, 0.0, 0.0, 0.0]
+        self._updates = 0
+        # (index, time, period) of the fitted line
+        self._fit = (0, 0.0, 1.0 / self.rate)
+        self._last = float("-inf")
+
+    def update(self, index, arrival=None):
+        """Fit host arrival time of the sample with index
+
+        Parameters
+        ----------
+        index : int
+            sample index of the last sample received
+        arrival : float
+            host time in seconds the sample was received,
+            if None the current time of clock
+        """
+
+        if arrival is None:
+            arrival = self._clock()
+        if self._origin is None:
+            self._origin = (index, arrival)
+
+        # Forget older reads and move the origin of the sums to the new
+        # point, which keeps the sums small for numerical precision
+        weight, sum_x, sum_y, sum_xx, sum_xy = [
+            each * self._forget for each in self._sums
+        ]
+        dx = index - self._origin[0]
+        dy = arrival - self._origin[1]
+        sum_xx = sum_xx - 2 * dx * sum_x + weight * dx * dx
+        sum_xy = sum_xy - dx * sum_y - dy * sum_x + weight * dx * dy
+        sum_x = sum_x - weight * dx
+        sum_y = sum_y - weight * dy
+        weight = weight + 1.0
+        self._sums = [weight, sum_x, sum_y, sum_xx, sum_xy]
+        self._origin = (index, arrival)
+        self._updates = self._updates + 1
+
+        period = 1.0 / self.rate
+        if self._updates >= self.MIN_UPDATES:
+            var = weight * sum_xx - sum_x * sum_x
+            if var > 0:
+                fitted = (weight * sum_xy - sum_x * sum_y) / var
+                if fitted > 0:
+                    period = fitted
+        intercept = (sum_y - period * sum_x) / weight
+        self._fit = (index, arrival + intercept, period)
+
+    def timestamp(self, index):
+        """Return timestamp of the sample with index from the fitted line,
+        timestamps never decrease
+
+        Parameters
+        ----------
+        index : int
+            sample index
+
+        Returns
+        -------
+        float
+            host time in seconds
+        """
+
+        base_index, base_time, period = self._fit
+        stamp = base_time + (index - base_index) * period
+        if stamp < self._last:
+            stamp = self._last
+        self._last = stamp
+        return stamp
+
+    def timestamps(self, indexes):
+        """Return timestamps of many sample indexes with numpy,
+        timestamps never decrease
+
+        Parameters
+        ----------
+        indexes : numpy.ndarray
+            sample index in order received
+
+        Returns
+        -------
+        numpy.ndarray
+            host time in seconds per sample index
+
+        Raises
+        -------
+        ImportError
+            When numpy is not installed
+        """
+
+        if np is None:
+            raise ImportError("** numpy is required for timestamps()")
+        base_index, base_time, period = self._fit
+        stamps = base_time + (np.asarray(indexes, dtype=np.float64) - base_index) * period
+        if len(stamps) == 0:
+            return stamps
+        stamps = np.maximum.accumulate(np.maximum(stamps, self._last))
+        self._last = float(stamps[-1])
+        return stamps
@@ -29,11 +29,22 @@ Contains:
 """
 
 import importlib
+import time
 from types import MappingProxyType
 
 from loguru import logger
 
-from esensorlib import uart_port, spi_port, reg_interface, accl_fn, imu_fn, vib_fn
+from esensorlib import (
+    uart_port,
+    spi_port,
+    sim_port,
+    reg_interface,
+    accl_fn,
+    imu_fn,
+    vib_fn,
+    burst_stream,
+    link_budget,
+)
 
 
 class SensorDevice:
@@ -55,6 +66,30 @@ class SensorDevice:
         tuple of fields for sensor burst read
     mdef : object
         model specific definitions - addresses, values, constants, etc
+    stream : BurstStream
+        background acquisition stream or None if not started
+    sample_stats : MappingProxyType
+        lost and duplicate samples detected from the burst counter
+        or None if counter is not in burst
+    counter_tracker : CounterTracker
+        sample index and loss history from the burst counter
+        or None if counter is not in burst
+    sample_clock : SampleClock
+        fit of host time to sample index for burst timestamps
+    timestamp : float
+        host timestamp of the last sample from read_sample() or read_frames()
+    timestamps : numpy.ndarray
+        host timestamps of the last samples from read_samples()
+    stalls : int
+        number of reads and register waits that timed out
+    timing : MappingProxyType
+        seconds spent per phase from opening the port to the first sample
+    poll_stats : MappingProxyType
+        per operation counters and measured durations of register waits
+        i.e. self test, flash backup, filter setting, and mode change
+    link_budget : LinkBudget
+        burst output of the current configuration compared with the
+        UART capacity at speed, None for SPI or before configuration
 
     Methods
     -------
@@ -73,9 +108,18 @@ class SensorDevice:
     set_reg(winnum, regaddr, write_byte, verbose)
         8-bit write to specified register address
 
+    get_regs(regs, verbose)
+        16-bit reads from list of (WIN_ID, register address)
+
+    set_regs(regs, verbose)
+        8-bit writes to list of (WIN_ID, register address, byte)
+
     set_config(**cfg)
         Configure device from key, value parameters
 
+    apply_profile(profile, write_all, verbose)
+        Configure device from a ConfigProfile() compiled to a register image
+
     init_check(verbose)
         Check if HARD_ERR (hardware error) is reported
         Usually performed once after startup
@@ -106,6 +150,18 @@ class SensorDevice:
 
     read_sample_unscaled(verbose)
         Return unscaled burst sample of sensor data
+
+    read_samples(n, scaled, as_dict, verbose)
+        Return n burst samples of sensor data as numpy array or dict of columns
+
+    read_frames(n, verbose)
+        Return n complete burst frames as received without decoding
+
+    start_stream(maxsize, policy, scaled)
+        Start background acquisition thread and return BurstStream()
+
+    stop_stream(timeout)
+        Stop background acquisition thread
     """
 
     def __init__(
@@ -116,16 +172,21 @@ class SensorDevice:
         model="auto",
         verbose=False,
         no_init=False,
+        reg_cache=False,
+        fast_start=False,
+        link_check="warn",
     ):
         """
         Parameters
         ----------
-        port : UartPort() instance
-            The name of interface port
+        port : str
+            The name of interface port. When if_type is "sim" the product ID
+            of device to simulate or SimulatedPort() instance
         speed : int
             speed of sensor device connected to port
         if_type : str
-            Currently only "uart" is supported
+            Currently only "uart" is supported, or "sim" for a simulated
+            device without hardware
         model : str
             Model of sensor device. Set to auto for auto-detect
         verbose : bool
@@ -136,6 +197,17 @@ class SensorDevice:
             and flashed with AUTO_START, and set_config() must be
             specified with all device configuration to read & process
             sensor burst data
+        reg_cache : bool
+            If True enable RegInterface() shadow register cache to skip
+            redundant WIN_ID writes and register reads
+        fast_start : bool
+            If True poll for the RX buffer to be idle and for MODE_CTRL
+            instead of fixed delays, and read the identification registers
+            in a single pipeline to reduce the time to the first sample
+        link_check : str
+            "warn" to log a warning when the burst output of set_config()
+            exceeds the UART link budget, "error" to also refuse to enter
+            SAMPLING mode with LinkBudgetError, or "off"
         """
 
         self._port = port
@@ -144,7 +216,23 @@ class SensorDevice:
         self._model = model.upper()
         self._verbose = verbose
         self._no_init = no_init
+        self._reg_cache = reg_cache
+        self._fast_start = fast_start
+        self._link_check = link_check.lower()
         self._cfg = {}  # place holder - updated in set_config()
+        self._stream = None  # place holder - updated in start_stream()
+        # Seconds per phase, first_sample is measured from goto("sampling")
+        self._timing = {}
+        self._t_sampling = None
+
+        if self._fast_start and self._if_type == "spi":
+            logger.warning("fast_start is not supported for SPI, ignored")
+            self._fast_start = False
+
+        if self._link_check not in ("off", "warn", "error"):
+            raise ValueError(f"** Unsupported link_check specified {link_check}")
+
+        t_phase = time.perf_counter()
 
         # UartPort() or SpiPort() instance depends on if_type
         # SpiPort is just a stub and not implemented yet
@@ -152,14 +240,30 @@ class SensorDevice:
         # not performed when port to device is opened
         if self._if_type == "uart":
             self.port_io = uart_port.UartPort(
-                self._port, self._speed, self._verbose, self._no_init
+                self._port,
+                self._speed,
+                self._verbose,
+                self._no_init,
+                fast_start=self._fast_start,
             )
         elif self._if_type == "spi":
             self.port_io = spi_port.SpiPort(
                 self._port, self._speed, self._verbose, self._no_init
             )
+        elif self._if_type == "sim":
+            if isinstance(self._port, sim_port.SimulatedPort):
+                self.port_io = self._port
+            else:
+                self.port_io = sim_port.SimulatedPort(
+                    self._port,
+                    self._speed,
+                    self._verbose,
+                    self._no_init,
+                    fast_start=self._fast_start,
+                )
         else:
             raise IOError(f"** Unsupported if_type specified {self._if_type}")
+        t_phase = self._set_timing("open", t_phase)
 
         # RegInterface() instance
         self.regif = reg_interface.RegInterface(self.port_io, self._verbose)
@@ -183,7 +287,10 @@ class SensorDevice:
             }
         else:
             # Read registers to identify Device PROD_ID, VERSION, SER_NUM
-            self._device_info = self.regif.get_device_info(self._verbose)
+            self._device_info = self.regif.get_device_info(
+                self._verbose, batch=self._fast_start
+            )
+        t_phase = self._set_timing("identify", t_phase)
 
         # Update _info with prod_id, version_id, serial_id from UartPort()
         self._info.update(self._device_info)
@@ -192,12 +299,25 @@ class SensorDevice:
         # UartPort().info or SpiPort().info must be defined before calling
         # get_model_definitions()
         self._mdef = self.get_model_definitions(self._model)
+        t_phase = self._set_timing("model", t_phase)
 
         # Return sensor object based on prod_id
         # from AcclFn(), ImuFn(), or VibFn() instance
         # UartPort().info or SpiPort().info must be defined before calling
         # get_sensor_fn()
         self.sensor_fn = self.get_sensor_fn(self._verbose)
+        self._set_timing("sensor_fn", t_phase)
+
+        # Enable shadow register cache except for registers with
+        # self-clearing or busy bits for the device type
+        if self._reg_cache:
+            self.regif.enable_cache(
+                [
+                    getattr(self._mdef.Reg, name)
+                    for name in self.sensor_fn.VOLATILE_REGS
+                    if name in self._mdef.Reg.__members__
+                ]
+            )
 
     def __repr__(self):
         cls = self.__class__.__name__
@@ -208,7 +328,10 @@ class SensorDevice:
                 f"if_type='{self._if_type}', ",
                 f"model='{self._model}', ",
                 f"verbose={self._verbose}, ",
-                f"no_init={self._no_init})",
+                f"no_init={self._no_init}, ",
+                f"reg_cache={self._reg_cache}, ",
+                f"fast_start={self._fast_start}, ",
+                f"link_check='{self._link_check}')",
             ]
         )
         return string_val
@@ -223,6 +346,9 @@ class SensorDevice:
                 f"\n  Model: {self._model}",
                 f"\n  Verbose: {self._verbose}",
                 f"\n  No_Init: {self._no_init}",
+                f"\n  Register Cache: {self._reg_cache}",
+                f"\n  Fast Start: {self._fast_start}",
+                f"\n  Link Check: {self._link_check}",
             ]
         )
         return string_val
@@ -252,6 +378,61 @@ class SensorDevice:
         """property for model definitions"""
         return self._mdef
 
+    @property
+    def stream(self):
+        """property for BurstStream() started by start_stream()"""
+        return self._stream
+
+    @property
+    def counter_tracker(self):
+        """property for CounterTracker() of AcclFn(), ImuFn(), or VibFn()"""
+        return self.sensor_fn.tracker
+
+    @property
+    def sample_stats(self):
+        """property for sample counter statistics of the current session"""
+        tracker = self.sensor_fn.tracker
+        return None if tracker is None else tracker.stats
+
+    @property
+    def sample_clock(self):
+        """property for SampleClock() of AcclFn(), ImuFn(), or VibFn()"""
+        return self.sensor_fn.clock
+
+    @property
+    def timestamp(self):
+        """property for host timestamp of the last sample from read_sample()"""
+        return self.sensor_fn.timestamp
+
+    @property
+    def timestamps(self):
+        """property for host timestamps of the last samples from read_samples()"""
+        return self.sensor_fn.timestamps
+
+    @property
+    def stalls(self):
+        """property for number of reads and register waits that timed out"""
+        return self.sensor_fn.stalls
+
+    @property
+    def poll_stats(self):
+        """property for per operation counters and durations of register waits"""
+        return self.sensor_fn.poll_stats
+
+    @property
+    def timing(self):
+        """property for seconds per phase from opening the port to the first sample"""
+        return MappingProxyType(self._timing)
+
+    @property
+    def link_budget(self):
+        """property for UART link budget of the burst output"""
+        if self._if_type == "spi" or self.sensor_fn.decoder is None:
+            return None
+        return link_budget.LinkBudget(
+            self.sensor_fn.decoder.size, self.sensor_fn.clock.rate, self._speed
+        )
+
     def get_model_definitions(self, prod_id):
         """Load user-specified model or load auto-detect model definitions"""
         prod_id = prod_id.upper()
@@ -304,11 +485,29 @@ class SensorDevice:
         is_vib = _prod_id.startswith("A342") or _prod_id.startswith("A542VR")
 
         if is_imu:
-            return imu_fn.ImuFn(self.regif, self._mdef, self._device_info, verbose)
+            return imu_fn.ImuFn(
+                self.regif,
+                self._mdef,
+                self._device_info,
+                verbose,
+                fast_start=self._fast_start,
+            )
         if is_accl:
-            return accl_fn.AcclFn(self.regif, self._mdef, self._device_info, verbose)
+            return accl_fn.AcclFn(
+                self.regif,
+                self._mdef,
+                self._device_info,
+                verbose,
+                fast_start=self._fast_start,
+            )
         if is_vib:
-            return vib_fn.VibFn(self.regif, self._mdef, self._device_info, verbose)
+            return vib_fn.VibFn(
+                self.regif,
+                self._mdef,
+                self._device_info,
+                verbose,
+                fast_start=self._fast_start,
+            )
 
         raise IOError(f"Unknown Device {self._info.get('prod_id')}")
 
@@ -347,11 +546,43 @@ class SensorDevice:
         Write byte to register WIN_ID and register address (odd or even)"""
         self.regif.set_reg(winnum, regaddr, write_byte, verbose)
 
+    def get_regs(self, regs, verbose=False):
+        """redirect to RegInterface() instance
+        Read 16-bit registers from list of (WIN_ID, register address) in one pipeline"""
+        return self.regif.get_regs(regs, verbose)
+
+    def set_regs(self, regs, verbose=False):
+        """redirect to RegInterface() instance
+        Write bytes to list of (WIN_ID, register address, byte) in one pipeline"""
+        self.regif.set_regs(regs, verbose)
+
     def set_config(self, **cfg):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
-        Configure device based on parameters."""
+        Configure device based on parameters.
+        Returns True if registers were written.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
         self._cfg = cfg
-        self.sensor_fn.set_config(**self._cfg)
+        t_phase = time.perf_counter()
+        result = self.sensor_fn.set_config(**self._cfg)
+        self._set_timing("set_config", t_phase)
+        self._check_link()
+        return result
+
+    def apply_profile(self, profile, write_all=False, verbose=False):
+        """Compile ConfigProfile() for the product ID of this device, cached
+        by the profile, and redirect to ImuFn(), AcclFn(), VibFn() instance.
+        Configure device from the register image.
+        Returns True if registers were written.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        t_phase = time.perf_counter()
+        image = profile.compile(self._info.get("prod_id"))
+        self._cfg = dict(image.cfg)
+        result = self.sensor_fn.apply_image(image, write_all, verbose)
+        self._set_timing("set_config", t_phase)
+        self._check_link()
+        return result
 
     def init_check(self, verbose=False):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
@@ -385,8 +616,19 @@ class SensorDevice:
 
     def goto(self, mode, post_delay=0.2, verbose=False):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
-        Set MODE_CMD to either CONFIG or SAMPLING mode."""
+        Set MODE_CMD to either CONFIG or SAMPLING mode.
+        If fast_start, polls MODE_CTRL with post_delay as the expected delay.
+        Raises LinkBudgetError before SAMPLING if link_check is "error"
+        and the burst output exceeds the UART link budget.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        if mode.upper() == "SAMPLING" and self._link_check == "error":
+            # set_config() already warned, only refuse here
+            self._check_link(refuse=True)
+        t_phase = time.perf_counter()
         self.sensor_fn.goto(mode, post_delay, verbose)
+        t_phase = self._set_timing(f"goto_{mode.lower()}", t_phase)
+        self._t_sampling = t_phase if mode.upper() == "SAMPLING" else None
 
     def get_mode(self, verbose=False):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
@@ -395,10 +637,147 @@ class SensorDevice:
 
     def read_sample(self, verbose=False):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
-        Read one burst of scaled sensor data"""
-        return self.sensor_fn.read_sample(verbose)
+        Read one burst of scaled sensor data.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        sample = self.sensor_fn.read_sample(verbose)
+        if self._t_sampling is not None:
+            self._set_first_sample()
+        return sample
 
     def read_sample_unscaled(self, verbose=False):
         """redirect to ImuFn(), AcclFn(), VibFn() instance.
-        Read one burst of unscaled sensor data"""
-        return self.sensor_fn.read_sample_unscaled(verbose)
+        Read one burst of unscaled sensor data.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        sample = self.sensor_fn.read_sample_unscaled(verbose)
+        if self._t_sampling is not None:
+            self._set_first_sample()
+        return sample
+
+    def read_samples(self, n, scaled=True, as_dict=False, verbose=False):
+        """redirect to ImuFn(), AcclFn(), VibFn() instance.
+        Read n bursts of sensor data as numpy structured array
+        or dict of column arrays named by burst_fields if as_dict is True.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        samples = self.sensor_fn.read_samples(n, scaled, verbose)
+        if self._t_sampling is not None:
+            self._set_first_sample()
+        if as_dict:
+            return {field: samples[field] for field in samples.dtype.names}
+        return samples
+
+    def read_frames(self, n, verbose=False):
+        """redirect to ImuFn(), AcclFn(), VibFn() instance.
+        Read n bursts of sensor data as complete burst frames without decoding.
+        Raises StreamError while start_stream() is running"""
+        self._check_stream()
+        data = self.sensor_fn.read_frames(n, verbose)
+        if self._t_sampling is not None:
+            self._set_first_sample()
+        return data
+
+    def start_stream(self, maxsize=64, policy="block", scaled=True, timestamps=False):
+        """Start background thread to read and decode bursts into a bounded
+        queue of batches. set_config(), goto() and read_sample() raise
+        StreamError while the stream is running.
+        NOTE: Device must be in SAMPLING mode before calling
+
+        Parameters
+        ----------
+        maxsize : int
+            maximum number of batches in the queue
+        policy : str
+            when the queue is full either "block", "drop_oldest", or "drop_newest"
+        scaled : bool
+            If True apply scale factor to sensor data
+        timestamps : bool
+            If True each sample in a batch is a (timestamp, sample) tuple
+            with host timestamp from sample_clock
+
+        Returns
+        -------
+        BurstStream() instance
+            read batches with get() or iterate, counters in stats property
+
+        Raises
+        -------
+        StreamError
+            When device is not in SAMPLING mode or stream is already running
+        """
+
+        self._check_stream()
+        if self.status.get("is_config"):
+            logger.error("** Device not in SAMPLING mode. Run goto('sampling') first.")
+            raise burst_stream.StreamError
+
+        burst_cmd = None if self.status.get("uart_auto") else self._mdef.BURST_MARKER
+        self._stream = burst_stream.BurstStream(
+            self.port_io,
+            self.sensor_fn.decoder,
+            frames=self.sensor_fn.flush_frames(),
+            chksm=self.burst_out.get("chksm", False),
+            tracker=self.sensor_fn.tracker,
+            clock=self.sensor_fn.clock,
+            index=self.sensor_fn.index,
+            timestamps=timestamps,
+            burst_cmd=burst_cmd,
+            maxsize=maxsize,
+            policy=policy,
+            scaled=scaled,
+            stall_timeout=self.sensor_fn.stall_timeout,
+        )
+        self._stream.start()
+        return self._stream
+
+    def stop_stream(self, timeout=1.0):
+        """Stop background thread started by start_stream() and continue
+        the sample index of read_sample() from the last sample decoded
+
+        Parameters
+        ----------
+        timeout : float
+            maximum time in seconds to wait for the thread to exit
+        """
+
+        if self._stream is not None:
+            self._stream.stop(timeout)
+            self.sensor_fn.set_index(self._stream.index)
+
+    def _check_stream(self):
+        """Raise StreamError while BurstStream() is reading the serial port"""
+
+        if self._stream is not None and self._stream.is_running:
+            logger.error("** Stream is running. Run stop_stream() first.")
+            raise burst_stream.StreamError
+
+    def _check_link(self, refuse=False):
+        """Warn, or raise LinkBudgetError if refuse, when the burst output
+        exceeds the UART link budget"""
+        if self._link_check == "off":
+            return
+        budget = self.link_budget
+        if budget is None or budget.fits:
+            return
+        if refuse:
+            logger.error(f"** Burst output exceeds UART link budget: {budget}")
+            raise link_budget.LinkBudgetError(
+                f"Burst output exceeds UART link budget: {budget}"
+            )
+        logger.warning(
+            f"Burst output exceeds UART link budget, samples will be lost: {budget}"
+        )
+
+    def _set_timing(self, phase, t_start):
+        """Store seconds since t_start for phase and return the current time"""
+
+        now = time.perf_counter()
+        self._timing[phase] = now - t_start
+        return now
+
+    def _set_first_sample(self):
+        """Store seconds from goto("sampling") to the first sample read"""
+
+        self._set_timing("first_sample", self._t_sampling)
+        self._t_sampling = None
@@ -0,0 +1,760 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Simulated Port class for running without an accelerometer, vibration sensor,
+   or IMU connected
+Contains:
+- SimulatedDevice() class
+- SimulatedPort() class
+"""
+
+import importlib
+import random
+import struct
+import time
+
+from loguru import logger
+
+from esensorlib import uart_port
+
+
+# Burst layout per device type as
+# (burst field, BURST_CTRL1 bit, BURST_CTRL2 32-bit bit, count, type16, type32)
+# type "t" is a 24-bit signed value sent as unsigned char + unsigned short
+_IMU_LAYOUT = (
+    ("ndflags", 0x8000, 0, 1, "H", "H"),
+    ("tempc", 0x4000, 0x4000, 1, "h", "i"),
+    ("gyro", 0x2000, 0x2000, 3, "h", "i"),
+    ("accl", 0x1000, 0x1000, 3, "h", "i"),
+    ("dlta", 0x0800, 0x0800, 3, "h", "i"),
+    ("dltv", 0x0400, 0x0400, 3, "h", "i"),
+    ("qtn", 0x0200, 0x0200, 4, "h", "i"),
+    ("atti", 0x0100, 0x0100, 3, "h", "i"),
+    ("gpio", 0x0004, 0, 1, "H", "H"),
+)
+
+_ACCL_LAYOUT = (
+    ("ndflags", 0x8000, 0, 1, "H", "H"),
+    ("tempc", 0x4000, 0, 1, "i", "i"),
+    ("acclx", 0x0400, 0, 1, "i", "i"),
+    ("accly", 0x0200, 0, 1, "i", "i"),
+    ("acclz", 0x0100, 0, 1, "i", "i"),
+)
+
+_VIB_LAYOUT = (
+    ("ndflags", 0x8000, 0, 1, "H", "H"),
+    ("tempc", 0x4000, 0, 1, "H", "H"),
+    ("sensx", 0x0400, 0, 1, "t", "t"),
+    ("sensy", 0x0200, 0, 1, "t", "t"),
+    ("sensz", 0x0100, 0, 1, "t", "t"),
+)
+
+# Value range of each struct type to clamp generated data
+_TYPE_RANGE = {
+    "h": (-(2**15), 2**15 - 1),
+    "H": (0, 2**16 - 1),
+    "i": (-(2**31), 2**31 - 1),
+    "t": (-(2**23), 2**23 - 1),
+}
+
+
+class SimulatedDevice:
+    """
+    In-memory model of an Epson sensor device connected by UART.
+    It is a drop-in replacement for the pyserial object used by UartPort()
+    and responds to register read and write commands on a register map
+    built from the model Reg enum. The device honours MODE_CTRL,
+    BURST_CTRL, SIG_CTRL, DOUT_RATE, UART_AUTO and AUTO_START, and in
+    SAMPLING mode sends burst data with header, counter, checksum, and
+    delimiter formatted for the configured burst fields
+
+    ...
+
+    Attributes
+    ----------
+    prod_id : str
+        product ID of simulated device
+    family : str
+        "imu", "accl", or "vib"
+    mdef : object
+        model specific definitions - addresses, values, constants, etc
+    regs : dict
+        register map as (WIN_ID, even address) to 16-bit value
+    rate : float
+        burst output rate in Hz for the current configuration
+    frame_size : int
+        size of burst frame in bytes for the current configuration
+    nframes : int
+        number of bursts output since entering SAMPLING mode
+    overrun : int
+        number of bursts dropped since the receive buffer was full
+    nreads : int
+        number of register read commands received
+    nwrites : int
+        number of register write commands received including WIN_ID
+    is_sampling : bool
+        True if device is in SAMPLING mode
+
+    Methods
+    -------
+    get_family(prod_id)
+        Return device type from product ID
+    get_model_definitions(prod_id)
+        Return module of model definitions for product ID
+    write(data)
+        Process register read, write, and burst commands
+    read(size)
+        Return up to size bytes sent by device
+    readinto(buffer)
+        Copy bytes sent by device into buffer, return number of bytes
+    in_waiting
+        Number of bytes sent by device waiting to be read
+    reset_input_buffer()
+        Discard bytes sent by device
+    feed(data)
+        Queue bytes as if sent by device
+    get_settings()
+        Return dict of serial port settings
+    close()
+        Close the simulated port
+    """
+
+    # Burst data kept in the receive buffer before further bursts are dropped
+    BUFFER_SZ = 4096 * 16
+    # Bytes of burst data queued per poll when not realtime
+    FAST_FILL_SZ = 4096
+    # Number of distinct burst payloads generated per configuration
+    TABLE_SZ = 256
+
+    # Vibration sensor burst output rates in Hz for RAW output
+    VELOCITY_RAW_RATE = 3000
+    DISP_RAW_RATE = 300
+
+    # Default product and serial number IDs
+    VERSION_ID = 0x0100
+    SERIAL_ID = "SIM00001"
+
+    def __init__(
+        self, prod_id, baudrate=460800, realtime=False, seed=0, flash=None
+    ):
+        """
+        Parameters
+        ----------
+        prod_id : str
+            product ID of device to simulate i.e. G370PDF1, A352AD10, A342VD10
+        baudrate : int
+            Baudrate of simulated port
+        realtime : bool
+            If True bursts are output at the configured output rate,
+            otherwise bursts are output as fast as they are read
+        seed : int
+            seed for random noise added to simulated sensor data
+        flash : dict
+            optional register name to 16-bit value stored in flash backup
+            and loaded at power on i.e. {"UART_CTRL": 0x03} for AUTO_START
+        """
+
+        self.prod_id = prod_id.upper()
+        self.baudrate = baudrate
+        self.port = self.prod_id
+        self.portstr = self.prod_id
+        self.timeout = None
+        self.is_open = True
+        self.family = self.get_family(self.prod_id)
+        self.mdef = self.get_model_definitions(self.prod_id)
+        self._realtime = realtime
+        self._seed = seed
+        self._reg = self.mdef.Reg
+        self._layout = {
+            "imu": _IMU_LAYOUT,
+            "accl": _ACCL_LAYOUT,
+            "vib": _VIB_LAYOUT,
+        }[self.family]
+
+        # Bytes sent by device, and partial command received from host
+        self._out = bytearray()
+        self._cmd = bytearray()
+        self._win_id = 0
+
+        # Burst output state, updated when entering SAMPLING mode
+        self.is_sampling = False
+        self.rate = 0.0
+        self.frame_size = 0
+        self.nframes = 0
+        self.overrun = 0
+        self.nreads = 0
+        self.nwrites = 0
+        self._uart_auto = False
+        self._has_counter = False
+        self._has_chksm = False
+        self._table = []
+        self._count = 0
+        self._t_start = 0.0
+
+        # Registers that clear or partly clear after being written
+        # as (WIN_ID, address) to mask of bits that self-clear
+        self._self_clear = {}
+        for name, addr_key, mask in (
+            ("GLOB_CMD", "ADDR", 0xFF),
+            ("MSC_CTRL", "ADDRH", 0xFF),
+            ("FILTER_CTRL", "ADDR", 0x20),
+            ("MODE_CTRL", "ADDRH", 0x03),
+        ):
+            if name in self._reg.__members__:
+                reg = getattr(self._reg, name)
+                self._self_clear[(reg.WINID, getattr(reg, addr_key))] = mask
+        if self.family == "vib":
+            self._self_clear[(self._reg.SIG_CTRL.WINID, self._reg.SIG_CTRL.ADDR)] = 0x01
+
+        # Power on with factory defaults overwritten by flash backup
+        self._flash = self._get_defaults()
+        for name, value in (flash or {}).items():
+            reg = getattr(self._reg, name)
+            self._flash[(reg.WINID, reg.ADDR)] = value & 0xFFFF
+        self.regs = {}
+        self._do_reset()
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(prod_id='{self.prod_id}', realtime={self._realtime})"
+
+    @staticmethod
+    def get_family(prod_id):
+        """Return device type from product ID"""
+
+        if prod_id.startswith("G"):
+            return "imu"
+        if prod_id.startswith(("A352", "A552AR", "A370")):
+            return "accl"
+        if prod_id.startswith(("A342", "A542VR")):
+            return "vib"
+        raise IOError(f"** Unsupported device for simulation: {prod_id}")
+
+    @staticmethod
+    def get_model_definitions(prod_id):
+        """Return module of model definitions for product ID"""
+
+        # If G330, or G366 use the same G366 model definitions
+        if prod_id.startswith("G330") or prod_id.startswith("G366"):
+            prod_id = "G366PDG0"
+        # If G320 or G354 just keep the first 4 letters
+        elif prod_id.startswith("G320") or prod_id.startswith("G354"):
+            prod_id = prod_id[:4]
+        try:
+            return importlib.import_module(
+                f".model.m{prod_id.lower()}", package="esensorlib"
+            )
+        except ModuleNotFoundError as exc:
+            logger.error(f"** Cannot load model definitions for {prod_id}")
+            raise IOError from exc
+
+    def _get_defaults(self):
+        """Return factory default register map"""
+
+        reg = self._reg
+        regs = {(each.WINID, each.ADDR): 0x0000 for each in reg}
+        regs[(reg.ID.WINID, reg.ID.ADDR)] = uart_port.UartPort.ID_RETVAL
+        regs[(reg.MODE_CTRL.WINID, reg.MODE_CTRL.ADDR)] = 0x0400
+        regs[(reg.VERSION.WINID, reg.VERSION.ADDR)] = self.VERSION_ID
+
+        # PROD_ID and SERIAL_NUM are 8 ASCII characters, lower byte first
+        for prefix, text in (
+            ("PROD_ID", self.prod_id),
+            ("SERIAL_NUM", self.SERIAL_ID),
+        ):
+            text = text.ljust(8)[:8].encode("ascii")
+            for i in range(4):
+                each = getattr(reg, f"{prefix}{i + 1}")
+                regs[(each.WINID, each.ADDR)] = text[2 * i] | text[2 * i + 1] << 8
+
+        if self.family == "imu":
+            dout_rate = self.mdef.DOUT_RATE.get(200, 0)
+            regs[(reg.BURST_CTRL1.WINID, reg.BURST_CTRL1.ADDR)] = 0xF006
+            regs[(reg.BURST_CTRL2.WINID, reg.BURST_CTRL2.ADDR)] = 0x7000
+        elif self.family == "accl":
+            dout_rate = self.mdef.DOUT_RATE.get(200, 0)
+            regs[(reg.BURST_CTRL.WINID, reg.BURST_CTRL.ADDR)] = 0x4700
+        else:
+            # DOUT_RATE_RMSPP, UPDATE_RATE_RMSPP
+            dout_rate = 0x01
+            regs[(reg.SMPL_CTRL.WINID, reg.SMPL_CTRL.ADDR)] = 0x0004
+            regs[(reg.BURST_CTRL.WINID, reg.BURST_CTRL.ADDR)] = 0x4700
+        regs[(reg.SMPL_CTRL.WINID, reg.SMPL_CTRL.ADDR)] |= dout_rate << 8
+        baud_rate = getattr(self.mdef, "BAUD_RATE", {}).get(self.baudrate, 0)
+        regs[(reg.UART_CTRL.WINID, reg.UART_CTRL.ADDR)] = baud_rate << 8
+        return regs
+
+    @property
+    def in_waiting(self):
+        """Number of bytes sent by device waiting to be read"""
+
+        self._poll()
+        return len(self._out)
+
+    def get_settings(self):
+        """Return dict of serial port settings in the same form as pyserial"""
+
+        return {
+            "baudrate": self.baudrate,
+            "bytesize": 8,
+            "parity": "N",
+            "stopbits": 1,
+            "xonxoff": False,
+            "dsrdtr": False,
+            "rtscts": False,
+            "timeout": self.timeout,
+            "write_timeout": None,
+            "inter_byte_timeout": None,
+        }
+
+    def close(self):
+        """Close the simulated port"""
+
+        self.is_open = False
+
+    def write(self, data):
+        """Process 3-byte commands of address, data, and DELIMITER.
+        Bytes before a misaligned command are discarded
+
+        Parameters
+        ----------
+        data : bytes
+            commands sent by host
+
+        Returns
+        -------
+        int
+            number of bytes written
+        """
+
+        self._poll()
+        delimiter = uart_port.UartPort.DELIMITER
+        cmd = self._cmd
+        cmd.extend(data)
+        while len(cmd) >= 3:
+            if cmd[2] != delimiter:
+                del cmd[0]
+                continue
+            addr, value = cmd[0], cmd[1]
+            del cmd[:3]
+            if addr & 0x80:
+                self.nwrites = self.nwrites + 1
+                self._write_reg(addr & 0x7F, value)
+            else:
+                self.nreads = self.nreads + 1
+                word = self._read_reg(addr)
+                self._out.extend((addr, word >> 8, word & 0xFF, delimiter))
+        return len(data)
+
+    def read(self, size=1):
+        """Return up to size bytes sent by device. When realtime and
+        in SAMPLING mode wait up to timeout for bursts to be output
+
+        Parameters
+        ----------
+        size : int
+            maximum number of bytes to read
+
+        Returns
+        -------
+        bytes
+            bytes sent by device
+        """
+
+        self._poll(size)
+        if self._realtime and self.is_sampling and self._uart_auto:
+            t_end = time.perf_counter() + (self.timeout or 0)
+            while len(self._out) < size and time.perf_counter() < t_end:
+                time.sleep(1 / self.rate)
+                self._poll()
+        data = bytes(self._out[:size])
+        del self._out[:size]
+        return data
+
+    def readinto(self, buffer):
+        """Copy bytes sent by device into buffer
+
+        Parameters
+        ----------
+        buffer : memoryview or bytearray
+            writable buffer
+
+        Returns
+        -------
+        int
+            number of bytes copied
+        """
+
+        self._poll(len(buffer))
+        size = min(len(buffer), len(self._out))
+        buffer[:size] = self._out[:size]
+        del self._out[:size]
+        return size
+
+    def reset_input_buffer(self):
+        """Discard bytes sent by device"""
+
+        self._out.clear()
+
+    def feed(self, data):
+        """Queue bytes to be read as if sent by the device, i.e. to inject
+        corrupted, partial, or misaligned bursts
+
+        Parameters
+        ----------
+        data : bytes
+            bytes appended after the bytes waiting to be read
+        """
+
+        self._out.extend(data)
+
+    def _read_reg(self, regaddr):
+        """Return 16-bit register value from current window"""
+
+        if regaddr == uart_port.UartPort.WIN_ID_ADDR:
+            return self._win_id
+        return self.regs.get((self._win_id, regaddr & 0xFE), 0)
+
+    def _write_reg(self, regaddr, value):
+        """Write byte to register of current window and act on commands"""
+
+        # WIN_ID is accessible from any window
+        if regaddr == uart_port.UartPort.WIN_ID_ADDR:
+            self._win_id = value
+            return
+
+        reg = self._reg
+        # BURST command when UART_AUTO is disabled
+        if (self._win_id, regaddr) == (reg.BURST.WINID, reg.BURST.ADDR):
+            if self.is_sampling and not self._uart_auto:
+                self._emit(1)
+            return
+
+        key = (self._win_id, regaddr & 0xFE)
+        word = self.regs.get(key, 0)
+        if regaddr & 0x01:
+            word = (word & 0x00FF) | value << 8
+        else:
+            word = (word & 0xFF00) | value
+        mask = self._self_clear.get((self._win_id, regaddr), 0)
+        self.regs[key] = word & ~(mask << (8 * (regaddr & 0x01)))
+
+        if (self._win_id, regaddr) == (reg.MODE_CTRL.WINID, reg.MODE_CTRL.ADDRH):
+            if value & 0x03 == 0x01:
+                self._start_sampling()
+            elif value & 0x03:
+                self._stop_sampling()
+        elif (self._win_id, regaddr) == (reg.GLOB_CMD.WINID, reg.GLOB_CMD.ADDR):
+            if value & 0x80:
+                self._do_reset()
+            elif value & 0x08:
+                self._flash = {k: v for k, v in self.regs.items()}
+            elif value & (0x10 if self.family == "imu" else 0x04):
+                self._flash = self._get_defaults()
+
+    def _do_reset(self):
+        """Load registers from flash backup, and enter SAMPLING mode
+        if AUTO_START is enabled"""
+
+        self.regs = dict(self._flash)
+        self._win_id = 0
+        self._stop_sampling()
+        uart_ctrl = self.regs[(self._reg.UART_CTRL.WINID, self._reg.UART_CTRL.ADDR)]
+        if uart_ctrl & 0x02:
+            self._start_sampling()
+
+    def _stop_sampling(self):
+        """Enter CONFIG mode"""
+
+        mode_ctrl = (self._reg.MODE_CTRL.WINID, self._reg.MODE_CTRL.ADDR)
+        self.regs[mode_ctrl] = (self.regs[mode_ctrl] & ~0x0700) | 0x0400
+        self.is_sampling = False
+
+    def _start_sampling(self):
+        """Enter SAMPLING mode and compile burst output from registers"""
+
+        reg = self._reg
+        mode_ctrl = (reg.MODE_CTRL.WINID, reg.MODE_CTRL.ADDR)
+        self.regs[mode_ctrl] = self.regs[mode_ctrl] & ~0x0700
+        uart_ctrl = self.regs[(reg.UART_CTRL.WINID, reg.UART_CTRL.ADDR)]
+        self._uart_auto = bool(uart_ctrl & 0x01)
+        self.rate = self._get_rate()
+        self._compile_burst()
+        self.is_sampling = True
+        self.nframes = 0
+        self._count = 0
+        self._t_start = time.perf_counter()
+
+    def _get_rate(self):
+        """Return burst output rate in Hz from DOUT_RATE or SIG_CTRL"""
+
+        reg = self._reg
+        dout_rate = self.regs[(reg.SMPL_CTRL.WINID, reg.SMPL_CTRL.ADDR)] >> 8
+        if self.family == "vib":
+            output_sel = (self.regs[(reg.SIG_CTRL.WINID, reg.SIG_CTRL.ADDR)] >> 4) & 0x0F
+            if output_sel == self.mdef.OUTPUT_SEL["VELOCITY_RAW"]:
+                return self.VELOCITY_RAW_RATE
+            if output_sel == self.mdef.OUTPUT_SEL["DISP_RAW"]:
+                return self.DISP_RAW_RATE
+            # RMS or peak-peak output every DOUT_RATE_RMSPP seconds
+            return 1 / max(dout_rate, 1)
+        for rate, code in self.mdef.DOUT_RATE.items():
+            if code == dout_rate:
+                return rate
+        return max(self.mdef.DOUT_RATE)
+
+    def _get_signals(self):
+        """Return simulated sensor data per burst field as
+        (mean values, noise, scale factor, offset) in scaled units"""
+
+        mdef = self.mdef
+        if self.family == "imu":
+            sf_tempc = mdef.SF_TEMPC
+            return {
+                "ndflags": ((0x7E00,), 0, 1, 0),
+                "tempc": ((25.0,), 0.01, sf_tempc, 25 - mdef.TEMPC_25C * sf_tempc),
+                "gyro": ((0.0, 0.0, 0.0), 0.02, mdef.SF_GYRO, 0),
+                "accl": ((0.0, 0.0, 1000.0), 0.2, mdef.SF_ACCL, 0),
+                "dlta": ((0, 0, 0), 2, 1, 0),
+                "dltv": ((0, 0, 0), 2, 1, 0),
+                "qtn": ((1.0, 0.0, 0.0, 0.0), 0.0001, 1 / 2**14, 0),
+                "atti": ((0, 0, 0), 2, 1, 0),
+                "gpio": ((0,), 0, 1, 0),
+            }
+        if self.family == "accl":
+            return {
+                "ndflags": ((0x0E00,), 0, 1, 0),
+                "tempc": ((25.0,), 0.01, mdef.SF_TEMPC, mdef.TEMPC_OFFSET),
+                "acclx": ((0.0,), 0.05, mdef.SF_ACCL, 0),
+                "accly": ((0.0,), 0.05, mdef.SF_ACCL, 0),
+                "acclz": ((1000.0,), 0.05, mdef.SF_ACCL, 0),
+            }
+        return {
+            "ndflags": ((0x0E00,), 0, 1, 0),
+            "tempc": ((25.0,), 0.01, mdef.SF_TEMPC, mdef.TEMPC_OFFSET),
+            "sensx": ((0.0,), 0.05, mdef.SF_VEL, 0),
+            "sensy": ((0.0,), 0.05, mdef.SF_VEL, 0),
+            "sensz": ((0.0,), 0.05, mdef.SF_VEL, 0),
+        }
+
+    def _compile_burst(self):
+        """Generate table of burst payloads for the enabled burst fields"""
+
+        reg = self._reg
+        if self.family == "imu":
+            ctrl1 = self.regs[(reg.BURST_CTRL1.WINID, reg.BURST_CTRL1.ADDR)]
+            ctrl2 = self.regs[(reg.BURST_CTRL2.WINID, reg.BURST_CTRL2.ADDR)]
+        else:
+            ctrl1 = self.regs[(reg.BURST_CTRL.WINID, reg.BURST_CTRL.ADDR)]
+            ctrl2 = 0
+        self._has_counter = bool(ctrl1 & 0x0002)
+        self._has_chksm = bool(ctrl1 & 0x0001)
+
+        signals = self._get_signals()
+        fields = []
+        for field, bit, bit32, count, type16, type32 in self._layout:
+            if ctrl1 & bit:
+                is_32bit = bool(ctrl2 & bit32)
+                fields.append(
+                    (field, count, type32 if is_32bit else type16, is_32bit)
+                )
+
+        rng = random.Random(self._seed)
+        self._table = []
+        for _ in range(self.TABLE_SZ):
+            values = []
+            for field, count, type_char, is_32bit in fields:
+                means, noise, scale, offset = signals[field]
+                if is_32bit:
+                    scale = scale / 65536
+                low, high = _TYPE_RANGE[type_char]
+                for i in range(count):
+                    value = means[i] + (rng.gauss(0, noise) if noise else 0)
+                    raw = min(max(round((value - offset) / scale), low), high)
+                    if type_char == "t":
+                        values.extend(((raw >> 16) & 0xFF, raw & 0xFFFF))
+                    else:
+                        values.append(raw)
+            fmt = ">" + "".join(
+                "BH" * count if type_char == "t" else type_char * count
+                for _, count, type_char, _ in fields
+            )
+            self._table.append(struct.pack(fmt, *values))
+
+        self.frame_size = (
+            len(self._table[0]) + 2 + 2 * self._has_counter + 2 * self._has_chksm
+        )
+
+    def _poll(self, size=0):
+        """Output bursts that are due when in SAMPLING mode with UART_AUTO.
+        When realtime, bursts are due at the output rate since entering
+        SAMPLING mode, otherwise bursts are output until at least size
+        or FAST_FILL_SZ bytes are waiting"""
+
+        if not (self.is_sampling and self._uart_auto):
+            return
+        if self._realtime:
+            due = int((time.perf_counter() - self._t_start) * self.rate) - self.nframes
+        else:
+            fill = max(size, self.FAST_FILL_SZ) - len(self._out)
+            due = -(-fill // self.frame_size)
+        if due > 0:
+            self._emit(due)
+
+    def _emit(self, count):
+        """Output count bursts, bursts that do not fit in the receive buffer
+        are dropped but still advance the counter"""
+
+        space = max((self.BUFFER_SZ - len(self._out)) // self.frame_size, 0)
+        table = self._table
+        frames = []
+        for _ in range(min(count, space)):
+            payload = table[self.nframes % self.TABLE_SZ]
+            if self._has_counter:
+                payload = payload + struct.pack(">H", self._count)
+            if self._has_chksm:
+                payload = payload + struct.pack(">H", uart_port.checksum16(payload))
+            frames.append(b"\x80" + payload + b"\r")
+            self._count = (self._count + 1) & 0xFFFF
+            self.nframes = self.nframes + 1
+        self._out.extend(b"".join(frames))
+
+        dropped = count - len(frames)
+        if dropped > 0:
+            self.overrun = self.overrun + dropped
+            self._count = (self._count + dropped) & 0xFFFF
+            self.nframes = self.nframes + dropped
+
+
+class SimulatedPort(uart_port.UartPort):
+    """
+    UART Port Interface to a SimulatedDevice() instead of a serial port
+    so that SensorDevice() can be used without hardware
+    ...
+
+    Attributes
+    ----------
+    info : MappingProxyType
+        simulated serial port settings
+    device : SimulatedDevice
+        simulated device connected to port
+
+    Methods
+    -------
+    Same as UartPort()
+    """
+
+    def __init__(
+        self,
+        port="G370PDF1",
+        speed=460800,
+        verbose=False,
+        no_init=False,
+        realtime=False,
+        seed=0,
+        flash=None,
+        fast_start=False,
+    ):
+        """
+        Parameters
+        ----------
+        port : str
+            product ID of device to simulate i.e. G370PDF1, A352AD10, A342VD10
+        speed : int
+            Baudrate of simulated port
+        verbose : bool
+            If True outputs additional debug info
+        no_init : bool
+            If True does not call response_ok() during initialization
+        realtime : bool
+            If True keep UART command timing and output bursts at the
+            configured output rate, otherwise run as fast as possible
+        seed : int
+            seed for random noise added to simulated sensor data
+        flash : dict
+            optional register name to 16-bit value stored in flash backup
+            and loaded at power on i.e. {"UART_CTRL": 0x03} for AUTO_START
+        fast_start : bool
+            If True response_ok() waits until the device stops sending
+            instead of fixed delays
+        """
+
+        self._realtime = realtime
+        self._seed = seed
+        self._flash = flash
+        if not realtime:
+            self.TSTALL = 0
+            self.TWRITERATE = 0
+            self.TREADRATE = 0
+        super().__init__(port, speed, verbose, no_init, fast_start)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        string_val = "".join(
+            [
+                f"{cls}(port='{self._port}', ",
+                f"speed={self._speed}, ",
+                f"verbose={self._verbose}, ",
+                f"no_init={self._no_init}, ",
+                f"realtime={self._realtime})",
+            ]
+        )
+        return string_val
+
+    def __str__(self):
+        string_val = "".join(
+            [
+                "\nSimulated Port",
+                f"\n  Port: {self._port}",
+                f"\n  Speed (baud): {self._speed}",
+                f"\n  Verbose: {self._verbose}",
+                f"\n  No_Init: {self._no_init}",
+                f"\n  Realtime: {self._realtime}",
+            ]
+        )
+        return string_val
+
+    @property
+    def device(self):
+        """property for SimulatedDevice() connected to port"""
+        return self.uart_epson
+
+    def open(self, port, speed, verbose=True):
+        """Creates simulated device in place of serial port"""
+
+        self.uart_epson = SimulatedDevice(
+            port, speed, self._realtime, self._seed, self._flash
+        )
+        self.uart_epson.timeout = self.UART_RD_TIMEOUT_SEC
+        if verbose:
+            print(
+                " ".join(
+                    [
+                        "Open: ",
+                        self.uart_epson.portstr,
+                        ", ",
+                        str(self.uart_epson.baudrate),
+                    ]
+                )
+            )
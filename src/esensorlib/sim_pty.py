@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pseudo-terminal emulator of an Epson sensor device for Linux
+so that unmodified UartPort() and pyserial can connect to a simulated
+device, i.e. python -m esensorlib.sim_pty --model G370PDF1
+Contains:
+- PtyEmulator() class
+"""
+
+import argparse
+import os
+import select
+import sys
+import time
+
+from loguru import logger
+
+from esensorlib import sim_port
+
+try:
+    import tty
+except ImportError:
+    tty = None
+
+
+class PtyEmulator:
+    """
+    Runs a SimulatedDevice() in realtime behind the master side of a
+    pseudo-terminal pair. The slave side is opened by the host as a
+    serial port. Commands from the host are processed as they arrive and
+    burst data is written at the configured output rate, optionally paced
+    to the wire time of the baudrate
+
+    ...
+
+    Attributes
+    ----------
+    port : str
+        path of the pseudo-terminal slave to open as serial port
+    device : SimulatedDevice
+        simulated device behind the pseudo-terminal
+    stats : dict
+        bytes received, bytes sent, and bursts dropped
+
+    Methods
+    -------
+    run()
+        Process commands and send bursts until stop() is called
+    stop()
+        Stop run() loop
+    close()
+        Close pseudo-terminal and remove link
+    """
+
+    # Maximum bytes written to pseudo-terminal per loop
+    CHUNK_SZ = 4096
+    # Loop period when no bursts are due
+    IDLE_PERIOD_S = 0.1
+    # Bits per byte on the wire, 1 start + 8 data + 1 stop bit
+    BITS_PER_BYTE = 10
+
+    def __init__(
+        self, model="G370PDF1", speed=460800, link=None, pace=True, seed=0, flash=None
+    ):
+        """
+        Parameters
+        ----------
+        model : str
+            product ID of device to simulate i.e. G370PDF1, A352AD10, A342VD10
+        speed : int
+            Baudrate of simulated device
+        link : str
+            optional path of symbolic link created to the pseudo-terminal slave
+        pace : bool
+            If True limit bytes sent to the wire time of the baudrate
+        seed : int
+            seed for random noise added to simulated sensor data
+        flash : dict
+            optional register name to 16-bit value stored in flash backup
+            and loaded at power on i.e. {"UART_CTRL": 0x03} for AUTO_START
+        """
+
+        if tty is None:
+            raise IOError("** Pseudo-terminal emulator requires Linux or macOS")
+
+        self.device = sim_port.SimulatedDevice(
+            model, speed, realtime=True, seed=seed, flash=flash
+        )
+        self._speed = speed
+        self._pace = pace
+        self._link = link
+        self._is_running = False
+        self._pending = bytearray()
+        self._stats = {"received": 0, "sent": 0}
+
+        # Keep the slave open so the master does not see a hangup
+        # when the host closes the serial port
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self.port = os.ttyname(self._slave)
+        if link:
+            if os.path.lexists(link):
+                os.remove(link)
+            os.symlink(self.port, link)
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(model='{self.device.prod_id}', speed={self._speed}, port='{self.port}')"
+
+    @property
+    def stats(self):
+        """property for bytes received, bytes sent, and bursts dropped"""
+        return dict(self._stats, dropped=self.device.overrun)
+
+    def run(self):
+        """Process commands and send bursts until stop() is called"""
+
+        device = self.device
+        self._is_running = True
+        budget = 0.0
+        t_last = time.perf_counter()
+        bytes_per_s = self._speed / self.BITS_PER_BYTE
+
+        while self._is_running:
+            # Wake up for the next burst, or when pacing pending bytes
+            # including bytes output before the device left SAMPLING mode
+            if self._pending or device.in_waiting:
+                timeout = 0.0005
+            elif device.is_sampling and device.rate:
+                timeout = min(1 / device.rate, self.IDLE_PERIOD_S)
+            else:
+                timeout = self.IDLE_PERIOD_S
+            readable, _, _ = select.select([self._master], [], [], timeout)
+            if readable:
+                try:
+                    data = os.read(self._master, self.CHUNK_SZ)
+                except (BlockingIOError, OSError):
+                    data = b""
+                if data:
+                    self._stats["received"] = self._stats["received"] + len(data)
+                    device.write(data)
+
+            # Bytes are taken from the device only after pending bytes are
+            # sent, so the device drops bursts when the host stops reading
+            if not self._pending:
+                size = min(device.in_waiting, self.CHUNK_SZ)
+                if size:
+                    self._pending.extend(device.read(size))
+
+            now = time.perf_counter()
+            size = len(self._pending)
+            if self._pace:
+                budget = min(budget + (now - t_last) * bytes_per_s, self.CHUNK_SZ)
+                size = min(size, int(budget))
+            t_last = now
+            if size:
+                try:
+                    size = os.write(self._master, self._pending[:size])
+                except BlockingIOError:
+                    size = 0
+                del self._pending[:size]
+                budget = budget - size
+                self._stats["sent"] = self._stats["sent"] + size
+
+    def stop(self):
+        """Stop run() loop"""
+
+        self._is_running = False
+
+    def close(self):
+        """Close pseudo-terminal and remove link"""
+
+        self.stop()
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        if self._link and os.path.islink(self._link):
+            os.remove(self._link)
+
+
+def get_args():
+    """
+    returns parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="This program emulates an Epson device on a "
+        "pseudo-terminal so that logger scripts and benchmarks "
+        "can be run without hardware. Connect to the printed "
+        "port or --link path as the serial port."
+    )
+
+    parser.add_argument(
+        "-m",
+        "--model",
+        help="specifies the device model to emulate, default is G370PDF1.",
+        type=str,
+        default="G370PDF1",
+    )
+    parser.add_argument(
+        "-b",
+        "--baud_rate",
+        help="specifies baudrate of the emulated device, default is 460800.",
+        type=int,
+        default=460800,
+    )
+    parser.add_argument(
+        "--link",
+        help="specifies a path to create as symbolic link to the pseudo-terminal "
+        "i.e. /tmp/ttyEPSON",
+        type=str,
+    )
+    parser.add_argument(
+        "--no_pace",
+        help="specifies to send bytes as fast as possible instead of pacing "
+        "to the wire time of the baudrate.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--autostart",
+        help="specifies to power on with AUTO_START and UART_AUTO enabled.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--seed",
+        help="specifies seed for random noise added to simulated sensor data.",
+        type=int,
+        default=0,
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    try:
+        emulator = PtyEmulator(
+            model=args.model,
+            speed=args.baud_rate,
+            link=args.link,
+            pace=not args.no_pace,
+            seed=args.seed,
+            flash={"UART_CTRL": 0x03} if args.autostart else None,
+        )
+    except IOError as err:
+        logger.error(f"** Unable to start emulator: {err}")
+        sys.exit(1)
+
+    print(f"Emulating {emulator.device.prod_id} on {emulator.port}", flush=True)
+    try:
+        emulator.run()
+    except KeyboardInterrupt:
+        print("CTRL-C: Exiting")
+    finally:
+        emulator.close()
+        print(f"Stats: {emulator.stats}")
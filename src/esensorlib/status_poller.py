@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Status Poller class for waiting on busy bits of device registers
+Contains:
+- StatusPoller() class
+"""
+
+import time
+from types import MappingProxyType
+
+
+class StatusPoller:
+    """
+    Polls a status register until its busy bits are cleared by the device,
+    i.e. after starting self test, flash test, flash backup, filter setting,
+    or a mode change. The register is read once immediately, then after
+    first_poll of the expected duration, then at an interval that doubles
+    until the deadline. With min_wait, i.e. the delay of the datasheet before
+    the status is valid, the first read is after min_wait and the backoff
+    starts from there. The expected duration of each operation starts at
+    the delay from the model definitions and is learned from the measured
+    durations, which are kept per operation in stats.
+    Typically, created by AcclFn(), ImuFn(), or VibFn() and shared by all
+    register waits of the device
+
+    ...
+
+    Attributes
+    ----------
+    stats : MappingProxyType
+        per operation name, dict of waits, reads, timeouts, delay (from
+        model definitions), expected, and measured count with last, min,
+        max, and mean duration in seconds, measured when the busy bits were
+        set on the first read
+
+    Methods
+    -------
+    wait(op, read_reg, mask, delay_s, timeout, min_wait)
+        Read register until busy bits in mask are cleared or timeout
+
+    reset()
+        Clear learned durations and stats
+    """
+
+    # Fraction of the expected duration before the second read
+    FIRST_POLL = 0.8
+    # Fraction of the expected duration for the first backoff interval
+    BACKOFF_START = 0.05
+    # Fraction of the expected duration the backoff interval doubles up to
+    BACKOFF_MAX = 0.25
+    # Shortest interval between reads in seconds
+    MIN_INTERVAL_S = 0.001
+    # Backoff interval always doubles up to at least this many seconds
+    BACKOFF_LIMIT_S = 0.01
+    # Weight of the latest measured duration in the expected duration
+    LEARN_RATE = 0.25
+
+    def __init__(self, first_poll=None):
+        """
+        Parameters
+        ----------
+        first_poll : float
+            fraction of the expected duration before the second read,
+            None for FIRST_POLL, 0 to start the backoff immediately
+        """
+
+        self._first_poll = self.FIRST_POLL if first_poll is None else first_poll
+        self._stats = {}
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}(first_poll={self._first_poll})"
+
+    @property
+    def stats(self):
+        """property for per operation counters and measured durations"""
+        return MappingProxyType(
+            {op: MappingProxyType(entry) for op, entry in self._stats.items()}
+        )
+
+    def reset(self):
+        """Clear learned durations and stats"""
+
+        self._stats = {}
+
+    def wait(self, op, read_reg, mask, delay_s, timeout, min_wait=0.0):
+        """Read register until the busy bits in mask are cleared or timeout
+
+        Parameters
+        ----------
+        op : str
+            name of the operation for learned duration and stats
+        read_reg : callable
+            returns the 16-bit register value when called without arguments
+        mask : int
+            busy bits of the register that are 1 until the operation completes
+        delay_s : float
+            expected duration in seconds from model definitions
+        timeout : float
+            maximum time in seconds to wait
+        min_wait : float
+            minimum time in seconds before the first read, 0 to read
+            immediately
+
+        Returns
+        -------
+        tuple
+            (register value, True if busy bits cleared or False on timeout)
+        """
+
+        t_start = time.perf_counter()
+        entry = self._stats.get(op)
+        if entry is None:
+            entry = {
+                "waits": 0,
+                "reads": 0,
+                "timeouts": 0,
+                "measured": 0,
+                "delay": delay_s,
+                "expected": delay_s,
+                "last": None,
+                "min": None,
+                "max": None,
+                "mean": None,
+            }
+            self._stats[op] = entry
+        entry["waits"] = entry["waits"] + 1
+        entry["delay"] = delay_s
+
+        if min_wait <= 0:
+            # Already completed, i.e. device powered up long ago,
+            # does not measure the duration of the operation
+            result = read_reg()
+            entry["reads"] = entry["reads"] + 1
+            if (result & mask) == 0:
+                return result, True
+        else:
+            result = mask
+
+        expected = entry["expected"]
+        deadline = t_start + timeout
+        t_next = t_start + max(expected * self._first_poll, min_wait)
+        interval = max(expected * self.BACKOFF_START, self.MIN_INTERVAL_S)
+        max_interval = max(expected * self.BACKOFF_MAX, self.BACKOFF_LIMIT_S)
+        while True:
+            t_now = time.perf_counter()
+            if t_now >= deadline:
+                entry["timeouts"] = entry["timeouts"] + 1
+                return result, False
+            t_next = min(max(t_next, t_now + self.MIN_INTERVAL_S), deadline)
+            time.sleep(t_next - t_now)
+            result = read_reg()
+            entry["reads"] = entry["reads"] + 1
+            if (result & mask) == 0:
+                self._update(entry, time.perf_counter() - t_start)
+                return result, True
+            t_next = time.perf_counter() + interval
+            interval = min(interval * 2, max_interval)
+
+    def _update(self, entry, duration):
+        """Add measured duration to stats and the learned expected duration"""
+
+        count = entry["measured"] + 1
+        entry["measured"] = count
+        entry["last"] = duration
+        if count == 1:
+            entry["min"] = entry["max"] = entry["mean"] = duration
+        else:
+            entry["min"] = min(entry["min"], duration)
+            entry["max"] = max(entry["max"], duration)
+            entry["mean"] = entry["mean"] + (duration - entry["mean"]) / count
+        expected = entry["expected"]
+        entry["expected"] = expected + self.LEARN_RATE * (duration - expected)
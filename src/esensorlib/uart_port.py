@@ -25,9 +25,11 @@
 """Uart Port class for interfacing to accelerometer, vibration sensor, or IMU
 Contains:
 - UartPort() class
+- checksum16() function for burst checksum
 - Descriptive Exceptions specific to this package
 """
 
+import select
 import struct
 import sys
 import time
@@ -48,6 +50,26 @@ class InvalidResponseFormatError(Exception):
 ReadResponse = namedtuple("ReadResponse", "ADDR DATA DELIMITER")
 
 
+def checksum16(data):
+    """Return 16-bit checksum of burst data as the sum of big endian
+    16-bit words, a trailing odd byte is the upper byte of the last word
+
+    Parameters
+    ----------
+    data : bytes
+        burst data after header byte up to but not including checksum field
+
+    Returns
+    -------
+    int
+        16-bit checksum
+    """
+
+    if len(data) % 2:
+        data = bytes(data) + b"\x00"
+    return sum(struct.unpack(f">{len(data) // 2}H", data)) & 0xFFFF
+
+
 class UartPort:
     """
     UART Port Interface
@@ -57,6 +79,9 @@ class UartPort:
     ----------
     info : MappingProxyType
         serial port settings
+    rx_stats : MappingProxyType
+        bytes discarded, resyncs, checksum errors of read_frames(),
+        and bytes discarded by the last completed resync
 
     Methods
     -------
@@ -65,10 +90,15 @@ class UartPort:
     close(verbose)
     write_bytes(wr_data)
     read_bytes(size)
+    read_into(buffer)
     in_waiting()
     reset_input_buffer()
+    wait_rx(nbytes, timeout, spin)
+    wait_rx_idle(idle, timeout)
+    read_frames(frame_size, chksm)
     get_raw16(regaddr, verbose)
     set_raw8(regaddr, regbyte, verbose)
+    pipeline(cmds, verbose)
     response_ok(retries, verbose)
     find_delimiter(ntries, retry_delay, verbose)
     """
@@ -78,6 +108,16 @@ class UartPort:
     UART_WR_TIMEOUT_SEC = 3
     # Windows buffer may be ignored by the device driver
     WIN_BUFFER_SZ = 4096 * 4
+    # Receive buffer for read_frames(), holds many bursts per read
+    RX_BUFFER_SZ = 4096 * 16
+    # Largest number of bytes wait_rx() waits for, below the OS serial buffer
+    RX_WAIT_SZ = 2048
+    # Time without receiving that the device is idle after leaving SAMPLING
+    # mode for fast_start, longer than the slowest output period of 15.625Hz
+    RX_IDLE_SEC = 0.07
+    # Time to poll in_waiting before blocking in wait_rx(), 0 to always block
+    # Increase for lowest latency at the cost of CPU load
+    RX_SPIN_SEC = 0
 
     BURST_MARKER = 0x80
     DELIMITER = 0x0D
@@ -94,7 +134,9 @@ class UartPort:
     TWRITERATE = 350e-6
     TREADRATE = 350e-6
 
-    def __init__(self, port, speed=460800, verbose=False, no_init=False):
+    def __init__(
+        self, port, speed=460800, verbose=False, no_init=False, fast_start=False
+    ):
         """
         Parameters
         ----------
@@ -106,6 +148,9 @@ class UartPort:
             If True outputs additional debug info
         no_init : bool
             If True does not call response_ok() during initialization
+        fast_start : bool
+            If True response_ok() waits until the device stops sending
+            instead of fixed delays
         """
 
         # If no serial port is specified, list available ports on PC
@@ -118,10 +163,27 @@ class UartPort:
         self._speed = speed
         self._verbose = verbose
         self._no_init = no_init
+        self._fast_start = fast_start
 
         # Create serial port object to device
         self.uart_epson = serial.Serial()
 
+        # Preallocated receive buffer for read_frames()
+        # unparsed bytes are between _rx_head and _rx_tail
+        self._rx_buf = bytearray(self.RX_BUFFER_SZ)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_head = 0
+        self._rx_tail = 0
+        self._rx_discarded = 0
+        # Resync state and counters for read_frames()
+        self._rx_is_sync = True
+        self._rx_resync_bytes = 0
+        self._rx_last_resync = 0
+        self._rx_resyncs = 0
+        self._rx_chksm_errors = 0
+        # Precompiled struct to sum checksum words per burst data size
+        self._chksm_structs = {}
+
         # Initialize serial port settings
         self.open(port=port, speed=speed)
 
@@ -139,7 +201,8 @@ class UartPort:
                 f"{cls}(port='{self._port}', ",
                 f"speed={self._speed}, ",
                 f"verbose={self._verbose}, ",
-                f"no_init={self._no_init})",
+                f"no_init={self._no_init}, ",
+                f"fast_start={self._fast_start})",
             ]
         )
         return string_val
@@ -152,6 +215,7 @@ class UartPort:
                 f"\n  Speed (baud): {self._speed}",
                 f"\n  Verbose: {self._verbose}",
                 f"\n  No_Init: {self._no_init}",
+                f"\n  Fast_Start: {self._fast_start}",
             ]
         )
         return string_val
@@ -164,6 +228,28 @@ class UartPort:
         """property for underlying serial interface as MappingProxyType"""
         return MappingProxyType(self.uart_epson.get_settings())
 
+    @property
+    def rx_discarded(self):
+        """property for number of bytes discarded by read_frames()"""
+        return self._rx_discarded
+
+    @property
+    def rx_resyncs(self):
+        """property for number of times read_frames() lost burst alignment"""
+        return self._rx_resyncs
+
+    @property
+    def rx_stats(self):
+        """property for read_frames() counters as MappingProxyType"""
+        return MappingProxyType(
+            {
+                "discarded": self._rx_discarded,
+                "resyncs": self._rx_resyncs,
+                "chksm_errors": self._rx_chksm_errors,
+                "last_resync": self._rx_last_resync,
+            }
+        )
+
     @staticmethod
     def list_ports():
         """List serial ports"""
@@ -261,15 +347,164 @@ class UartPort:
 
         return self.uart_epson.read(size)
 
+    def read_into(self, buffer):
+        """Redirect to pyserial, returns number of bytes read into buffer"""
+
+        return self.uart_epson.readinto(buffer)
+
     def in_waiting(self):
         """Redirect to pyserial"""
 
         return self.uart_epson.in_waiting
 
     def reset_input_buffer(self):
-        """Redirect to pyserial"""
+        """Redirect to pyserial and discard unparsed bytes in receive buffer"""
 
         self.uart_epson.reset_input_buffer()
+        self._rx_head = 0
+        self._rx_tail = 0
+        self._rx_is_sync = True
+
+    def wait_rx(self, nbytes, timeout=None, spin=None):
+        """
+        Wait until at least nbytes are received and not yet parsed by
+        read_frames() without busy polling. When no bytes are waiting, block on the
+        serial port file descriptor until the first byte is received,
+        then sleep for the wire time of the remaining bytes. If the port has
+        no file descriptor (i.e. Windows) sleep for the wire time instead.
+        Optionally poll in_waiting for spin seconds before blocking.
+
+        Parameters
+        ----------
+        nbytes : int
+            Number of bytes to wait for, limited to RX_WAIT_SZ
+        timeout : float
+            Maximum time in seconds to wait, None for UART_RD_TIMEOUT_SEC
+        spin : float
+            Time in seconds to poll before blocking, None for RX_SPIN_SEC
+
+        Returns
+        -------
+        bool
+            True if nbytes are received, False on timeout
+        """
+
+        t_now = time.perf_counter()
+        deadline = t_now + (self.UART_RD_TIMEOUT_SEC if timeout is None else timeout)
+        t_spin = t_now + (self.RX_SPIN_SEC if spin is None else spin)
+        nbytes = min(nbytes, self.RX_WAIT_SZ)
+        # Wire time of 1 start + 8 data + 1 stop bit
+        byte_time = 10.0 / self.uart_epson.baudrate
+        fileno = getattr(self.uart_epson, "fileno", None)
+        while True:
+            waiting = self.in_waiting()
+            missing = nbytes - waiting - (self._rx_tail - self._rx_head)
+            if missing <= 0:
+                return True
+            t_now = time.perf_counter()
+            if t_now >= deadline:
+                return False
+            if t_now < t_spin:
+                continue
+            t_wait = deadline - t_now
+            if waiting == 0 and fileno is not None:
+                select.select([fileno()], [], [], t_wait)
+            else:
+                time.sleep(min(missing * byte_time, t_wait))
+
+    def wait_rx_idle(self, idle, timeout=None):
+        """
+        Discard received bytes until no byte is received for idle seconds,
+        i.e. to wait for a device to stop sending bursts after leaving
+        SAMPLING mode without a fixed delay
+
+        Parameters
+        ----------
+        idle : float
+            Time in seconds without receiving a byte
+        timeout : float
+            Maximum time in seconds to wait, None for UART_RD_TIMEOUT_SEC
+
+        Returns
+        -------
+        bool
+            True if idle, False if still receiving at timeout
+        """
+
+        t_end = time.perf_counter() + (
+            self.UART_RD_TIMEOUT_SEC if timeout is None else timeout
+        )
+        while True:
+            self.reset_input_buffer()
+            t_wait = min(idle, t_end - time.perf_counter())
+            if t_wait <= 0:
+                return False
+            if not self.wait_rx(1, t_wait):
+                return t_wait >= idle
+
+    def read_frames(self, frame_size, chksm=False):
+        """
+        Read all bytes waiting in the serial RX buffer with a single read
+        into the receive buffer, then yield every complete burst frame
+        starting with BURST_MARKER and ending with DELIMITER, and if chksm
+        is True with a valid 16-bit checksum before the DELIMITER.
+        On a malformed frame the receive buffer is scanned for the next
+        BURST_MARKER that passes the same checks at frame_size. Bytes that
+        do not start a valid frame are discarded and counted in rx_discarded
+        and rx_stats. Incomplete frames are kept for the next call.
+
+        Parameters
+        ----------
+        frame_size : int
+            Size of complete burst frame in bytes including header and delimiter
+        chksm : bool
+            If True verify the 16-bit checksum field before the delimiter
+
+        Yields
+        ------
+        bytes
+            complete burst frame
+        """
+
+        self._fill_rx_buffer(frame_size)
+
+        buf = self._rx_buf
+        last = frame_size - 1
+        if chksm:
+            # Checksum is the sum of 16-bit words after the header byte
+            # up to the checksum field, an odd trailing byte is summed as upper byte
+            nbytes = frame_size - 4
+            sum_struct = self._chksm_structs.get(nbytes)
+            if sum_struct is None:
+                sum_struct = struct.Struct(f">{nbytes // 2}H")
+                self._chksm_structs[nbytes] = sum_struct
+            is_odd = nbytes % 2
+        while self._rx_tail - self._rx_head >= frame_size:
+            head = self._rx_head
+            if buf[head] == self.BURST_MARKER and buf[head + last] == self.DELIMITER:
+                is_valid = True
+                if chksm:
+                    total = sum(sum_struct.unpack_from(buf, head + 1))
+                    if is_odd:
+                        total = total + (buf[head + nbytes] << 8)
+                    is_valid = (total & 0xFFFF) == (
+                        buf[head + last - 2] << 8 | buf[head + last - 1]
+                    )
+                    if not is_valid:
+                        self._rx_chksm_errors = self._rx_chksm_errors + 1
+                if is_valid:
+                    if not self._rx_is_sync:
+                        self._rx_is_sync = True
+                        self._rx_last_resync = self._rx_resync_bytes
+                    self._rx_head = head + frame_size
+                    yield bytes(buf[head : head + frame_size])
+                    continue
+            # Resync to next header byte
+            next_head = buf.find(self.BURST_MARKER, head + 1, self._rx_tail)
+            if next_head < 0:
+                next_head = self._rx_tail
+            self._discard_rx(next_head - head)
+            self._rx_head = next_head
 
     def get_raw16(self, regaddr, verbose=False):
         """Returns the 16-bit read command from regaddr (must be even)"""
@@ -309,6 +544,91 @@ class UartPort:
         if verbose:
             logger.debug(f"REG[0x{regaddr & 0xFF:02X}] <- 0x{regbyte:02X}")
 
+    def pipeline(self, cmds, verbose=False):
+        """
+        Send a sequence of register commands without waiting for each
+        read response. Commands are spaced by TWRITERATE or TREADRATE
+        measured from the start of each command. When the UART is slow
+        enough that sending a command takes longer than the spacing, the
+        commands are combined into a single serial write. Read responses
+        are collected with a single read after the last command.
+
+        Parameters
+        ----------
+        cmds : list
+            (regaddr, regbyte) tuples, regbyte of None is a 16-bit read
+            of regaddr (must be even), otherwise an 8-bit write
+        verbose : bool
+            If True outputs additional debug info
+
+        Returns
+        -------
+        list
+            16-bit data of each read command in order of cmds
+
+        Raises
+        -------
+        InvalidResponseFormatError
+            When a read response has unexpected address or delimiter
+        """
+
+        wire_time = 30.0 / self.uart_epson.baudrate
+        nreads = 0
+        frames = []
+        for regaddr, regbyte in cmds:
+            if regbyte is None:
+                frames.append(
+                    (bytes((regaddr & 0xFE, 0x00, self.DELIMITER)), self.TREADRATE)
+                )
+                nreads = nreads + 1
+            else:
+                frames.append(
+                    (bytes((regaddr | 0x80, regbyte, self.DELIMITER)), self.TWRITERATE)
+                )
+
+        if all(wire_time >= spacing for _, spacing in frames):
+            self.write_bytes(b"".join([cmd for cmd, _ in frames]))
+            time.sleep(self.TWRITERATE)
+        else:
+            t_next = time.perf_counter()
+            for cmd, spacing in frames:
+                t_wait = t_next - time.perf_counter()
+                if t_wait > 0:
+                    time.sleep(t_wait)
+                self.write_bytes(cmd)
+                t_next = t_next + spacing
+            t_wait = t_next - time.perf_counter()
+            if t_wait > 0:
+                time.sleep(t_wait)
+
+        if nreads == 0:
+            return []
+
+        data_struct = struct.Struct(">BHB")
+        data_str = self.read_bytes(data_struct.size * nreads)
+        if len(data_str) != data_struct.size * nreads:
+            raise InvalidResponseFormatError(
+                f"Error: Expected {data_struct.size * nreads} bytes, "
+                f"received {len(data_str)}"
+            )
+        read_addrs = [regaddr for regaddr, regbyte in cmds if regbyte is None]
+        result = []
+        for regaddr, rdata in zip(
+            read_addrs, map(ReadResponse._make, data_struct.iter_unpack(data_str))
+        ):
+            # Validation check on Header Byte, and Delimiter Byte
+            if (rdata.ADDR != regaddr) or (rdata.DELIMITER != self.DELIMITER):
+                raise InvalidResponseFormatError(
+                    f"Error: Unexpected response ({rdata.ADDR:02X},"
+                    f"{rdata.DATA:04X}, {rdata.DELIMITER:02X})"
+                )
+            result.append(rdata.DATA)
+
+        if verbose:
+            logger.debug(f"Pipelined {len(cmds)} commands, {nreads} reads")
+
+        return result
+
     def response_ok(self, retries=5, verbose=False):
         """
         Assumes behaviour of Epson sensor device
@@ -341,32 +661,44 @@ class UartPort:
         except KeyboardInterrupt:
             return False
 
-    def find_delimiter(self, ntries=100, verbose=False):
+    def find_delimiter(self, ntries=100, retry_delay=0.001, verbose=False):
         """
-        Read UART RX buffer one byte at a time until DELIMITER byte detected
+        Read UART RX into the receive buffer until DELIMITER byte detected,
+        bytes up to and including DELIMITER are discarded.
+        Waits retry_delay for more bytes between tries.
         Returns False if ntries exceeded
         """
 
         if verbose:
             logger.debug("Searching for DELIMITER...")
-        _try = 0
-        while _try < ntries:
-            if self.in_waiting() > 0:
-                # Read 1 byte and search for DELIMITER
-                data = self.read_bytes(1)
-                if self.DELIMITER in data:
-                    if verbose:
-                        logger.debug("Found DELIMITER...")
-                    return True
-            _try = _try + 1
+        for _ in range(ntries):
+            self._fill_rx_buffer(1)
+            index = self._rx_buf.find(self.DELIMITER, self._rx_head, self._rx_tail)
+            if index >= 0:
+                self._discard_rx(index + 1 - self._rx_head)
+                self._rx_head = index + 1
+                if verbose:
+                    logger.debug("Found DELIMITER...")
+                return True
+            self._discard_rx(self._rx_tail - self._rx_head)
+            self._rx_head = self._rx_tail
+            time.sleep(retry_delay)
         return False
 
     def _clear_rx_buffer(self, retries=5, retry_delay=0.10, verbose=False):
         """
         Flushes the UART RX buffer.
         Returns False if RX buffer not empty after retries exceeded.
+        If fast_start, returns as soon as no bytes are received for
+        RX_IDLE_SEC instead of checking after each retry_delay
         """
 
+        if self._fast_start:
+            is_idle = self.wait_rx_idle(self.RX_IDLE_SEC, retries * retry_delay)
+            if verbose:
+                logger.debug(f"RX idle: {is_idle}")
+            return is_idle
+
         try:
             _rxcount = 0
             while _rxcount < retries:
@@ -386,3 +718,45 @@ class UartPort:
             return False
         except KeyboardInterrupt:
             return False
+
+    def _fill_rx_buffer(self, frame_size):
+        """Read all bytes waiting in the serial RX buffer with a single read
+        into the receive buffer, keeping room for at least frame_size bytes
+
+        Parameters
+        ----------
+        frame_size : int
+            Size of complete burst frame in bytes including header and delimiter
+        """
+
+        # Move unparsed bytes to the front when the free space runs out
+        if self._rx_tail + frame_size > self.RX_BUFFER_SZ or (
+            self._rx_head == self._rx_tail
+        ):
+            remain = self._rx_tail - self._rx_head
+            self._rx_buf[:remain] = self._rx_buf[self._rx_head : self._rx_tail]
+            self._rx_head = 0
+            self._rx_tail = remain
+
+        size = min(self.in_waiting(), self.RX_BUFFER_SZ - self._rx_tail)
+        if size > 0:
+            self._rx_tail = self._rx_tail + self.read_into(
+                self._rx_view[self._rx_tail : self._rx_tail + size]
+            )
+
+    def _discard_rx(self, nbytes):
+        """Count nbytes discarded from the receive buffer,
+        the first discard after a valid frame starts a new resync
+
+        Parameters
+        ----------
+        nbytes : int
+            number of bytes discarded
+        """
+
+        if self._rx_is_sync:
+            self._rx_is_sync = False
+            self._rx_resyncs = self._rx_resyncs + 1
+            self._rx_resync_bytes = 0
+        self._rx_resync_bytes = self._rx_resync_bytes + nbytes
+        self._rx_discarded = self._rx_discarded + nbytes
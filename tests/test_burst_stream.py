@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of reading bursts on a background thread with BurstStream()"""
+
+import pytest
+
+from esensorlib import burst_stream, sensor_device
+
+
+def _read_batches(stream, n):
+    samples = []
+    while len(samples) < n:
+        samples += stream.get(timeout=1.0)
+    return samples
+
+
+def test_device_access_raises_while_running(imu):
+    imu.goto("sampling")
+    stream = imu.start_stream()
+    try:
+        with pytest.raises(burst_stream.StreamError):
+            imu.read_sample()
+        with pytest.raises(burst_stream.StreamError):
+            imu.set_config(dout_rate=1000)
+        with pytest.raises(burst_stream.StreamError):
+            imu.goto("config")
+        with pytest.raises(burst_stream.StreamError):
+            imu.start_stream()
+    finally:
+        imu.stop_stream()
+    assert not stream.is_running
+    imu.read_sample()
+
+
+@pytest.mark.parametrize("counter", ["sample", ""])
+def test_index_continues_after_stop(counter):
+    dev = sensor_device.SensorDevice("G370PDF1", speed=921600, if_type="sim")
+    dev.set_config(dout_rate=2000, counter=counter, uart_auto=True)
+    dev.goto("sampling")
+    try:
+        dev.read_sample()
+        stream = dev.start_stream()
+        _read_batches(stream, 100)
+        dev.stop_stream()
+        assert dev.sensor_fn.index == stream.index >= 100
+        dev.read_sample()
+        assert dev.sensor_fn.index == stream.index + 1
+    finally:
+        dev.goto("config")
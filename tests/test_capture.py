@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of writing and reading binary capture files"""
+
+import datetime
+import json
+import os
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from esensorlib import burst_decoder, capture  # noqa: E402
+from esensorlib.counter_tracker import CounterTracker  # noqa: E402
+
+
+def _read_capture(path):
+    """Return header and records of a capture file parsed without
+    CaptureReader()"""
+
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[: len(capture.MAGIC)] == capture.MAGIC
+    (header_size,) = struct.unpack_from("<I", data, len(capture.MAGIC))
+    offset = len(capture.MAGIC) + 4
+    header = json.loads(data[offset : offset + header_size].decode("utf-8"))
+    offset = offset + header_size
+    assert offset % capture.ALIGN == 0
+    dtype = np.dtype([tuple(each) for each in header["record_dtype"]])
+    return header, np.frombuffer(data[offset:], dtype=dtype)
+
+
+def test_decoded_records(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    samples = []
+    timestamps = []
+    with capture.CaptureWriter(path, imu) as writer:
+        for _ in range(500):
+            sample = imu.read_sample()
+            writer.write(sample)
+            samples.append(sample)
+            timestamps.append(imu.timestamp)
+    assert writer.records == 500
+
+    header, records = _read_capture(path)
+    assert header["mode"] == "decoded"
+    assert header["burst_fields"] == list(imu.burst_fields)
+    assert len(records) == 500
+    assert records["timestamp"].tolist() == timestamps
+    for i in (0, 123, 499):
+        assert tuple(records[i])[1:] == pytest.approx(tuple(samples[i]))
+
+
+def test_write_samples_unscaled(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    samples = imu.read_samples(300, scaled=False)
+    with capture.CaptureWriter(path, imu, scaled=False, timestamps=False) as writer:
+        writer.write_samples(samples)
+
+    header, records = _read_capture(path)
+    assert records.dtype.names == samples.dtype.names
+    for field in samples.dtype.names:
+        assert (records[field] == samples[field]).all()
+
+
+def test_raw_frames(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "raw.ecap")
+    data = imu.read_frames(200)
+    with capture.CaptureWriter(path, imu, mode="raw") as writer:
+        writer.write_frames(data)
+        with pytest.raises(ValueError):
+            writer.write_frames(data[:-1])
+        with pytest.raises(capture.CaptureError):
+            writer.write(imu.read_sample())
+
+    header, records = _read_capture(path)
+    assert header["mode"] == "raw"
+    assert records.tobytes() == data
+    # Frames are decoded later with the burst decoder layout of the header
+    decoder = burst_decoder.BurstDecoder(**header["decoder"])
+    decoded = decoder.decode_array(records.tobytes(), scaled=False)
+    assert len(decoded) == 200
+    assert decoded.dtype.names == tuple(imu.burst_fields)
+
+
+def _get_indexes(reader):
+    """Return sample index of every record unwrapped from the counter"""
+
+    indexes = CounterTracker().update_array(reader.decode(scaled=False)["counter"])
+    return indexes - indexes[-1] + reader.entries["index"][-1]
+
+
+def test_decoded_round_trip(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    samples = []
+    timestamps = []
+    with capture.CaptureWriter(path, imu) as writer:
+        for _ in range(3000):
+            sample = imu.read_sample()
+            writer.write(sample)
+            samples.append(sample)
+            timestamps.append(imu.timestamp)
+    timestamps = np.array(timestamps)
+
+    with capture.CaptureReader(path) as reader:
+        assert len(reader) == 3000
+        assert reader.entries["record"].tolist() == [0, 1024, 2048, 2999]
+        assert reader.header["burst_fields"] == list(imu.burst_fields)
+        assert (reader.records["timestamp"] == timestamps).all()
+        decoded = reader.decode()
+        for i in (0, 1234, 2999):
+            assert tuple(decoded[i]) == pytest.approx(tuple(samples[i]))
+
+        for value in (timestamps[0] - 1, timestamps[1500], timestamps[-1] + 1):
+            expected = np.searchsorted(timestamps, value)
+            assert reader.find_time(value) == expected
+            moment = datetime.datetime.fromtimestamp(value)
+            assert reader.find_time(moment) == np.searchsorted(
+                timestamps, moment.timestamp()
+            )
+        selected = reader.select_time(timestamps[100], timestamps[2100])
+        assert len(selected) == np.searchsorted(
+            timestamps, timestamps[2100]
+        ) - np.searchsorted(timestamps, timestamps[100])
+        assert np.shares_memory(selected, reader.records)
+        del decoded, selected
+
+
+def test_raw_round_trip_with_lost_samples(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "raw.ecap")
+    frames = []
+    with capture.CaptureWriter(path, imu, mode="raw") as writer:
+        for i in range(60):
+            data = imu.read_frames(100)
+            size = len(data) // 100
+            if i % 3 == 1:
+                # Lose frames in the middle of the read, the last frame of
+                # the read is the sample index of the index entry
+                data = data[: 20 * size] + data[(27 + i % 5) * size :]
+            writer.write_frames(data)
+            frames.append(data)
+
+    with capture.CaptureReader(path) as reader:
+        assert reader.records.tobytes() == b"".join(frames)
+        indexes = _get_indexes(reader)
+        tracker = CounterTracker()
+        tracker.update_array(reader.decode(scaled=False)["counter"])
+        assert tracker.stats["lost"] > 0
+        records = reader.entries["record"].astype(np.int64)
+        assert (indexes[records] == reader.entries["index"]).all()
+
+        # Exact across lost samples within and outside the index entries
+        for index in range(indexes[0] - 2, indexes[-1] + 3):
+            assert reader.find_index(index) == np.searchsorted(indexes, index)
+        selected = reader.select_index(indexes[700], indexes[4000])
+        assert len(selected) == 3300
+        del selected
+
+
+def test_without_sidecar_index(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    with capture.CaptureWriter(path, imu) as writer:
+        writer.write_samples(imu.read_samples(2500), timestamps=np.arange(2500.0))
+    os.remove(path + ".idx")
+
+    with capture.CaptureReader(path) as reader:
+        assert len(reader.entries) == 4
+        assert reader.find_time(1234.5) == 1235
+        assert reader.find_index(reader.entries["index"][0] + 10) == 10
+
+
+def test_entries_use_index_of_written_records(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    samples = imu.read_samples(1500, scaled=False)
+    last = imu.sensor_fn.index
+    # Read ahead so the index of the device is past the written records
+    imu.read_samples(100)
+    with capture.CaptureWriter(path, imu, scaled=False, timestamps=False) as writer:
+        writer.write_samples(samples[:1000], index=last - 500)
+        writer.write_samples(samples[1000:], index=last)
+
+    with capture.CaptureReader(path) as reader:
+        assert reader.entries["record"].tolist() == [999, 1499]
+        assert reader.entries["index"].tolist() == [last - 500, last]
+
+
+def test_write_samples_without_timestamps(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "run.ecap")
+    samples = imu.read_samples(10)
+    imu.sensor_fn._timestamps = None
+    with capture.CaptureWriter(path, imu) as writer:
+        writer.write_samples(samples)
+        writer.write_samples(samples[:0])
+    assert writer.records == 10
+
+    header, records = _read_capture(path)
+    assert np.isnan(records["timestamp"]).all()
+
+
+def test_find_index_scans_without_sidecar_index(imu, tmp_path):
+    imu.goto("sampling")
+    path = str(tmp_path / "raw.ecap")
+    data = imu.read_frames(300)
+    size = len(data) // 300
+    with capture.CaptureWriter(path, imu, mode="raw", index=False) as writer:
+        # Lose 5 frames after the first 100
+        writer.write_frames(data[: 100 * size] + data[105 * size :])
+
+    with capture.CaptureReader(path) as reader:
+        assert reader.entries is None
+        assert reader.find_index(50) == 50
+        assert reader.find_index(102) == 100
+        assert reader.find_index(110) == 105
+        assert reader.find_index(1000) == 295
+        with pytest.raises(capture.CaptureError):
+            reader.find_time(0.0)
+
+
+def test_not_a_capture_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(capture.CaptureError):
+        capture.CaptureReader(str(path))
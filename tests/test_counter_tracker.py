@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of unwrapping the burst counter with CounterTracker()"""
+
+import random
+
+import pytest
+
+from esensorlib import sensor_device
+from esensorlib.counter_tracker import CounterTracker
+
+
+def _update_all(tracker, counts):
+    return [tracker.update(count) for count in counts]
+
+
+def test_wrap_without_loss():
+    tracker = CounterTracker()
+    assert _update_all(tracker, [65533, 65534, 65535, 0, 1]) == [0, 1, 2, 3, 4]
+    assert tracker.stats["lost"] == 0
+    assert tracker.step == 1
+
+
+def test_gap_across_wrap():
+    tracker = CounterTracker()
+    assert _update_all(tracker, [65534, 65535, 2, 3]) == [0, 1, 4, 5]
+    stats = tracker.stats
+    assert stats["samples"] == 4
+    assert stats["lost"] == 2
+    assert stats["gaps"] == 1
+    assert stats["longest_gap"] == 2
+    assert stats["loss_rate"] == pytest.approx(2 / 6)
+
+
+def test_step_and_duplicate():
+    tracker = CounterTracker()
+    assert _update_all(tracker, [65532, 65534, 65534, 0, 6]) == [0, 1, 1, 2, 5]
+    stats = tracker.stats
+    assert tracker.step == 2
+    assert stats["duplicates"] == 1
+    assert stats["lost"] == 2
+
+
+def test_update_array_matches_update():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(0)
+    counts = []
+    count = 65000
+    for _ in range(5000):
+        count = (count + 2 * rng.choice([0, 1, 1, 1, 1, 1, 1, 1, 3, 40])) % 0x10000
+        counts.append(count)
+
+    scalar = CounterTracker(bin_size=100)
+    expected = _update_all(scalar, counts)
+    vector = CounterTracker(bin_size=100)
+    indexes = [vector.update_array(np.array(counts[:1]))]
+    indexes += [
+        vector.update_array(np.array(counts[i : i + 700], dtype=np.uint16))
+        for i in range(1, len(counts), 700)
+    ]
+
+    assert np.concatenate(indexes).tolist() == expected
+    assert dict(vector.stats) == dict(scalar.stats)
+    assert vector.loss_history == scalar.loss_history
+
+
+@pytest.mark.parametrize(
+    "cfg, bin_size",
+    [
+        ({"output_sel": "VELOCITY_RAW"}, 3000),
+        ({"output_sel": "DISP_RAW"}, 300),
+        ({"output_sel": "VELOCITY_RMS", "dout_rate_rmspp": 10}, 1),
+    ],
+)
+def test_vib_bins_are_one_second(cfg, bin_size):
+    dev = sensor_device.SensorDevice("A342VD10", speed=460800, if_type="sim")
+    dev.set_config(counter=True, **cfg)
+    dev.goto("sampling")
+    try:
+        assert dev.sensor_fn.tracker._bin_size == bin_size
+    finally:
+        dev.goto("config")
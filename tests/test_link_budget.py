@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of the UART link budget check and planner"""
+
+import pytest
+from loguru import logger
+
+from esensorlib import link_budget, sensor_device
+
+CFG = {"dout_rate": 2000, "is_32bit": True, "tempc": True, "uart_auto": True}
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    sink = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(sink)
+
+
+def _budget_warnings(messages):
+    return [msg for msg in messages if "link budget" in msg]
+
+
+def test_warns_once_per_configuration(warnings):
+    dev = sensor_device.SensorDevice("G370PDF1", speed=115200, if_type="sim")
+    dev.set_config(**CFG)
+    assert len(_budget_warnings(warnings)) == 1
+    dev.goto("sampling")
+    dev.goto("config")
+    assert len(_budget_warnings(warnings)) == 1
+
+
+def test_error_refuses_sampling():
+    dev = sensor_device.SensorDevice(
+        "G370PDF1", speed=115200, if_type="sim", link_check="error"
+    )
+    dev.set_config(**CFG)
+    with pytest.raises(link_budget.LinkBudgetError):
+        dev.goto("sampling")
+    assert dev.status["is_config"]
+
+
+def test_plan_link_drops_fields():
+    plan = link_budget.plan_link("G370PDF1", CFG, 460800)
+    assert not plan["budget"].fits
+    assert plan["drop_budget"].fits
+    assert plan["drop"] == {"is_32bit": False}
+    assert link_budget.LinkBudget(
+        plan["budget"].frame_size, plan["max_rate"], 460800
+    ).fits
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of pipelined register access of RegInterface()"""
+
+from esensorlib import reg_interface
+
+
+class RegPort:
+    """Stand-in for UartPort() that executes pipeline() commands on a
+    register map and records the commands sent"""
+
+    def __init__(self, regs):
+        self.regs = dict(regs)
+        self.cmds = []
+        self.win_id = 0
+
+    def pipeline(self, cmds, verbose=False):
+        self.cmds.extend(cmds)
+        result = []
+        for regaddr, regbyte in cmds:
+            if regaddr == 0x7E:
+                self.win_id = regbyte
+            elif regbyte is None:
+                result.append(self.regs[(self.win_id, regaddr & 0xFE)])
+            else:
+                key = (self.win_id, regaddr & 0xFE)
+                word = self.regs.get(key, 0)
+                if regaddr & 0x01:
+                    word = (word & 0x00FF) | regbyte << 8
+                else:
+                    word = (word & 0xFF00) | regbyte
+                self.regs[key] = word
+        return result
+
+
+REGS = {(1, 0x6A): 0x3347, (0, 0x02): 0x0400, (1, 0x04): 0x0900, (0, 0x04): 0x0000}
+
+
+def test_get_regs_sorts_by_window():
+    port = RegPort(REGS)
+    regif = reg_interface.RegInterface(port)
+    keys = [(1, 0x6A), (0, 0x02), (1, 0x04), (0, 0x04)]
+
+    assert regif.get_regs(keys) == [REGS[key] for key in keys]
+    # WIN_ID is written once per window and reads are sent in one pipeline
+    assert port.cmds == [
+        (0x7E, 0),
+        (0x02, None),
+        (0x04, None),
+        (0x7E, 1),
+        (0x6A, None),
+        (0x04, None),
+    ]
+
+
+def test_set_regs_in_order():
+    port = RegPort(REGS)
+    regif = reg_interface.RegInterface(port)
+
+    regif.set_regs([(1, 0x0C, 0x03), (1, 0x0D, 0x70), (0, 0x08, 0x06), (1, 0x05, 0x04)])
+    # Writes are not reordered, WIN_ID is written when the window changes
+    assert port.cmds == [
+        (0x7E, 1),
+        (0x0C, 0x03),
+        (0x0D, 0x70),
+        (0x7E, 0),
+        (0x08, 0x06),
+        (0x7E, 1),
+        (0x05, 0x04),
+    ]
+    assert port.regs[(1, 0x0C)] == 0x7003
+    assert port.regs[(0, 0x08)] == 0x0006
+    assert port.regs[(1, 0x04)] == 0x0400
+
+
+def test_get_regs_cached():
+    port = RegPort(REGS)
+    regif = reg_interface.RegInterface(port)
+    regif.enable_cache()
+    keys = [(1, 0x6A), (0, 0x02)]
+    regif.get_regs(keys)
+    port.cmds.clear()
+
+    assert regif.get_regs(keys) == [REGS[key] for key in keys]
+    # Window 1 is cached, window 0 is always read
+    assert port.cmds == [(0x7E, 0), (0x02, None)]
+
+
+def test_set_regs_write_through():
+    port = RegPort(REGS)
+    regif = reg_interface.RegInterface(port)
+    regif.enable_cache()
+    regif.get_regs([(1, 0x04)])
+    port.cmds.clear()
+
+    # WIN_ID 1 is already selected
+    regif.set_regs([(1, 0x05, 0x04)])
+    assert port.cmds == [(0x05, 0x04)]
+    assert regif.get_regs([(1, 0x04)]) == [0x0400]
+    assert port.cmds == [(0x05, 0x04)]
+
+    regif.invalidate_cache()
+    assert regif.get_regs([(1, 0x04)]) == [0x0400]
+    assert port.cmds == [(0x05, 0x04), (0x7E, 1), (0x04, None)]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of fitting host arrival time against sample index with SampleClock()"""
+
+import random
+
+import pytest
+
+from esensorlib.sample_clock import SampleClock
+
+
+def _fit(clock, rate, reads, per_read=20, jitter=2e-3, t0=1000.0):
+    """Fit reads of per_read samples arriving late by up to jitter seconds"""
+
+    rng = random.Random(0)
+    for i in range(1, reads + 1):
+        index = i * per_read - 1
+        clock.update(index, t0 + index / rate + rng.uniform(0, jitter))
+
+
+def test_nominal_period_until_min_updates():
+    clock = SampleClock(rate=2000)
+    _fit(clock, 1990, SampleClock.MIN_UPDATES - 1)
+    assert clock.period == 1 / 2000
+    assert clock.updates == SampleClock.MIN_UPDATES - 1
+
+
+def test_fit_measured_rate():
+    # Device clock is 0.5% slower than the nominal rate
+    clock = SampleClock(rate=2000)
+    _fit(clock, 1990, 500)
+    assert clock.period == pytest.approx(1 / 1990, rel=1e-3)
+    # Smoothed timestamp is within the jitter of the true arrival time
+    assert clock.timestamp(9999) == pytest.approx(1000.0 + 9999 / 1990, abs=2e-3)
+
+
+def test_timestamps_never_decrease():
+    np = pytest.importorskip("numpy")
+    clock = SampleClock(rate=100)
+    _fit(clock, 100, 50)
+    first = clock.timestamps(np.arange(1000, 1010))
+    assert np.all(np.diff(first) > 0)
+    # Indexes before the last timestamp are held at the last timestamp
+    second = clock.timestamps(np.array([990, 1011]))
+    assert second[0] == first[-1]
+    assert clock.timestamp(0) == second[-1]
+
+
+def test_reset():
+    clock = SampleClock(rate=2000)
+    _fit(clock, 1990, 50)
+    clock.reset()
+    assert clock.updates == 0
+    assert clock.period == 1 / 2000
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of the SimulatedDevice() transport used without hardware"""
+
+import pytest
+
+from esensorlib import sim_port
+
+
+@pytest.mark.parametrize(
+    "prod_id, family",
+    [("G370PDF1", "imu"), ("A352AD10", "accl"), ("A342VD10", "vib")],
+)
+def test_detect_family(prod_id, family):
+    port = sim_port.SimulatedPort(prod_id)
+    assert port.device.family == family
+    # PROD_ID1 register holds the first two characters of the product ID
+    # with the first character in the low byte
+    port.write_bytes(bytes((0xFE, 0x01, 0x0D, 0x6A, 0x00, 0x0D)))
+    assert port.read_bytes(4) == bytes((0x6A, *prod_id[1::-1].encode(), 0x0D))
+    port.close(verbose=False)
+
+
+def test_feed_is_read_in_order():
+    device = sim_port.SimulatedDevice("G370PDF1")
+    device.feed(b"\x80\x01")
+    device.feed(b"\x02\r")
+    assert device.in_waiting == 4
+    assert device.read(3) == b"\x80\x01\x02"
+    buffer = bytearray(4)
+    assert device.readinto(buffer) == 1
+    assert buffer[:1] == b"\r"
+    device.feed(b"\x80")
+    device.reset_input_buffer()
+    assert device.in_waiting == 0
+
+
+def test_read_sample_counter(imu):
+    imu.goto("sampling")
+    pos = imu.burst_fields.index("counter")
+    counts = [imu.read_sample()[pos] for _ in range(5)]
+    assert len(imu.read_sample()) == len(imu.burst_fields)
+    assert [(b - a) & 0xFFFF for a, b in zip(counts, counts[1:])] == [1, 1, 1, 1]
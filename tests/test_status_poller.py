@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of register waits with StatusPoller()"""
+
+import time
+
+from esensorlib.status_poller import StatusPoller
+
+
+class BusyReg:
+    """Register with busy bit 0x0001 set for duration seconds"""
+
+    def __init__(self, duration):
+        self.t_start = time.perf_counter()
+        self.duration = duration
+        self.reads = []
+
+    def __call__(self):
+        elapsed = time.perf_counter() - self.t_start
+        self.reads.append(elapsed)
+        return 0x0001 if elapsed < self.duration else 0x0000
+
+
+def test_min_wait_before_first_read():
+    poller = StatusPoller(first_poll=0.0)
+    reg = BusyReg(0.05)
+    result, is_done = poller.wait("selftest", reg, 0x0001, 0.04, 1.0, min_wait=0.04)
+    assert is_done and result == 0
+    assert reg.reads[0] >= 0.04
+    assert poller.stats["selftest"]["measured"] == 1
+
+
+def test_read_immediately_without_min_wait():
+    poller = StatusPoller(first_poll=0.0)
+    reg = BusyReg(0.0)
+    result, is_done = poller.wait("power_on", reg, 0x0001, 0.04, 1.0)
+    assert is_done and result == 0
+    assert reg.reads[0] < 0.04
+    assert len(reg.reads) == 1
+    assert poller.stats["power_on"]["measured"] == 0
+
+
+def test_timeout():
+    poller = StatusPoller()
+    reg = BusyReg(10.0)
+    result, is_done = poller.wait("flash_backup", reg, 0x0001, 0.01, 0.05, 0.01)
+    assert not is_done and result == 0x0001
+    assert poller.stats["flash_backup"]["timeouts"] == 1
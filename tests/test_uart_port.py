@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+
+# MIT License
+
+# Copyright (c) 2023, 2025 Seiko Epson Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Tests of the read_frames() receive buffer parser and pipeline() of UartPort()"""
+
+import struct
+
+import pytest
+
+from esensorlib import sim_port, uart_port
+
+
+class LoopSerial:
+    """Stand-in for the pyserial object of UartPort() that returns the
+    bytes queued by feed()"""
+
+    def __init__(self):
+        self.port = None
+        self.baudrate = None
+        self.timeout = None
+        self.is_open = False
+        self.written = bytearray()
+        self._rx = bytearray()
+
+    @property
+    def portstr(self):
+        return self.port
+
+    @property
+    def in_waiting(self):
+        return len(self._rx)
+
+    def feed(self, data):
+        self._rx.extend(data)
+
+    def open(self):
+        self.is_open = True
+
+    def close(self):
+        self.is_open = False
+
+    def set_low_latency_mode(self, enable):
+        pass
+
+    def get_settings(self):
+        return {"baudrate": self.baudrate}
+
+    def write(self, data):
+        self.written.extend(data)
+        return len(data)
+
+    def read(self, size=1):
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self._rx))
+        buffer[:size] = self._rx[:size]
+        del self._rx[:size]
+        return size
+
+    def reset_input_buffer(self):
+        self._rx.clear()
+
+
+class SmallPort(uart_port.UartPort):
+    """UartPort() with a receive buffer of a few frames"""
+
+    RX_BUFFER_SZ = 40
+
+
+# Known-good burst frames of 4 data words and the checksum of the words,
+# the first is 0x0000 + 0x1234 + 0xABCD + 0x0102 = 0xBF03
+GOOD = [
+    bytes.fromhex("80 0000 1234 abcd 0102 bf03 0d"),
+    bytes.fromhex("80 0001 1234 abcd 0102 bf04 0d"),
+    bytes.fromhex("80 0002 1234 abcd 0102 bf05 0d"),
+]
+# First frame with one data bit flipped, framing is intact
+CORRUPT = bytes.fromhex("80 0000 1235 abcd 0102 bf03 0d")
+
+
+def _frame(count):
+    """Return 6-byte burst frame of header, counter, data, and delimiter"""
+
+    return b"\x80" + struct.pack(">HH", count, 0x1234) + b"\r"
+
+
+@pytest.fixture
+def sim():
+    port = sim_port.SimulatedPort("G370PDF1", no_init=True)
+    yield port
+    port.close(verbose=False)
+
+
+@pytest.fixture
+def port(monkeypatch):
+    monkeypatch.setattr(uart_port.serial, "Serial", LoopSerial)
+    port = uart_port.UartPort("loop", no_init=True)
+    yield port
+    port.close(verbose=False)
+
+
+def test_read_frames_many_per_read(port):
+    frames = [_frame(i) for i in range(10)]
+    port.uart_epson.feed(b"".join(frames))
+    assert list(port.read_frames(6)) == frames
+    assert port.rx_discarded == 0
+    assert list(port.read_frames(6)) == []
+
+
+def test_frame_split_across_reads(port):
+    frames = [_frame(i) for i in range(3)]
+    data = b"".join(frames)
+    port.uart_epson.feed(data[:8])
+    assert list(port.read_frames(6)) == frames[:1]
+    port.uart_epson.feed(data[8:11])
+    assert list(port.read_frames(6)) == []
+    port.uart_epson.feed(data[11:])
+    assert list(port.read_frames(6)) == frames[1:]
+    assert port.rx_discarded == 0
+
+
+def test_resync_after_junk_before_marker(port):
+    frames = [_frame(i) for i in range(3)]
+    # Junk includes a BURST_MARKER that does not start a frame
+    junk = b"\x01\r\x80\x02"
+    port.uart_epson.feed(junk + frames[0] + frames[1] + b"\x55" + frames[2])
+    assert list(port.read_frames(6)) == frames
+    assert port.rx_discarded == len(junk) + 1
+
+
+def test_compaction_keeps_partial_frame(monkeypatch):
+    monkeypatch.setattr(uart_port.serial, "Serial", LoopSerial)
+    port = SmallPort("loop", no_init=True)
+    frames = [_frame(i) for i in range(50)]
+    data = b"".join(frames)
+    received = []
+    # Feed in chunks that do not align with the frames or the buffer size,
+    # so partial frames are moved to the front of the receive buffer
+    for i in range(0, len(data), 17):
+        port.uart_epson.feed(data[i : i + 17])
+        received.extend(port.read_frames(6))
+    while port.uart_epson.in_waiting:
+        received.extend(port.read_frames(6))
+    assert received == frames
+    assert port.rx_discarded == 0
+    port.close(verbose=False)
+
+
+def test_reset_input_buffer_discards_partial_frame(port):
+    port.uart_epson.feed(_frame(0)[:4])
+    assert list(port.read_frames(6)) == []
+    port.reset_input_buffer()
+    port.uart_epson.feed(_frame(1))
+    assert list(port.read_frames(6)) == [_frame(1)]
+
+
+def test_pipeline_reads_and_writes(port):
+    # Responses of reads from 0x6A and 0x04 after WIN_ID and a write
+    port.uart_epson.feed(bytes.fromhex("6a33470d 0409000d"))
+    result = port.pipeline([(0x7E, 1), (0x6A, None), (0x05, 0x04), (0x04, None)])
+    assert result == [0x3347, 0x0900]
+    assert port.uart_epson.written == bytes.fromhex("fe010d 6a000d 85040d 04000d")
+
+
+def test_pipeline_rejects_unexpected_response(port):
+    port.uart_epson.feed(bytes.fromhex("6a33470d 0609000d"))
+    with pytest.raises(uart_port.InvalidResponseFormatError):
+        port.pipeline([(0x6A, None), (0x04, None)])
+
+
+def test_checksum16_known_frames():
+    assert uart_port.checksum16(GOOD[0][1:-3]) == 0xBF03
+    assert uart_port.checksum16(GOOD[2][1:-3]) == 0xBF05
+    assert uart_port.checksum16(CORRUPT[1:-3]) != 0xBF03
+    # An odd trailing byte is summed as the upper byte of a word
+    assert uart_port.checksum16(bytes.fromhex("123456")) == 0x6834
+
+
+def test_read_frames_resyncs_on_checksum_error(sim):
+    size = len(GOOD[0])
+    junk = b"\x01\x02\x03"
+    start = dict(sim.rx_stats)
+
+    sim.device.feed(GOOD[0] + CORRUPT + GOOD[1] + junk + GOOD[2][:5])
+    assert list(sim.read_frames(size, chksm=True)) == GOOD[:2]
+    stats = sim.rx_stats
+    assert stats["chksm_errors"] - start["chksm_errors"] == 1
+    assert stats["resyncs"] - start["resyncs"] == 1
+    assert stats["last_resync"] == size
+
+    # Junk and partial frame are kept until a frame size of bytes is
+    # waiting, then the junk is discarded to resync on the next frame
+    sim.device.feed(GOOD[2][5:])
+    assert list(sim.read_frames(size, chksm=True)) == GOOD[2:]
+    stats = sim.rx_stats
+    assert stats["resyncs"] - start["resyncs"] == 2
+    assert stats["discarded"] - start["discarded"] == size + len(junk)
+    assert stats["last_resync"] == len(junk)
+
+
+def test_read_frames_without_chksm_keeps_corrupt_payload(sim):
+    start = sim.rx_discarded
+    sim.device.feed(GOOD[0] + CORRUPT)
+    assert list(sim.read_frames(len(GOOD[0]))) == [GOOD[0], CORRUPT]
+    assert sim.rx_discarded == start